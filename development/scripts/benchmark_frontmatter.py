@@ -0,0 +1,102 @@
+"""
+Benchmark parse_frontmatter on a generated vault.
+
+Compares three ways of loading the same notes:
+  - pure-Python yaml.SafeLoader (what parse_frontmatter used to do)
+  - yaml.CSafeLoader (libyaml), when PyYAML was built with it
+  - the fast path for flat template fields, with the loader as fallback
+
+Usage:
+    python development/scripts/benchmark_frontmatter.py --notes 10000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+# Add development directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import frontmatter
+from src.utils.frontmatter import parse_frontmatter
+
+NOTE_TYPES = ["fleeting", "literature", "permanent"]
+STATUSES = ["inbox", "promoted", "draft", "published"]
+TAGS = ["ai", "python", "zettelkasten", "productivity", "research", "writing"]
+
+
+def generate_vault(root: Path, count: int, seed: int = 0) -> None:
+    """Write ``count`` notes shaped like our templates' output."""
+    rng = random.Random(seed)
+    for i in range(count):
+        folder = root / rng.choice(["Inbox", "Fleeting Notes", "Permanent Notes"])
+        folder.mkdir(exist_ok=True)
+        tags = ", ".join(rng.sample(TAGS, rng.randint(1, 4)))
+        lines = [
+            "---",
+            f"type: {rng.choice(NOTE_TYPES)}",
+            f"created: 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 10:30",
+            f"status: {rng.choice(STATUSES)}",
+            f"tags: [{tags}]",
+            "visibility: private",
+        ]
+        if i % 3 == 0:
+            lines.append(f"quality_score: 0.{rng.randint(10, 99)}")
+        if i % 5 == 0:
+            lines += ["ai_tags:", "  - generated", "  - review"]
+        if i % 50 == 0:
+            # Nested YAML the fast path hands to the loader
+            lines += ["review:", "  reviewer: me", "  passes: 2"]
+        lines.append("---")
+        body = f"\n# Note {i}\n\n" + "Body text with a [[link]].\n" * 20
+        (folder / f"note-{i:05d}.md").write_text("\n".join(lines) + body)
+
+
+def time_parse(contents, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for content in contents:
+            parse_frontmatter(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter parsing.")
+    parser.add_argument("--notes", type=int, default=10000, help="Notes to generate")
+    parser.add_argument("--rounds", type=int, default=3, help="Best of N rounds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = Path(tmp)
+        generate_vault(vault, args.notes)
+        contents = [p.read_text() for p in sorted(vault.rglob("*.md"))]
+
+    configurations = [("yaml.SafeLoader", False, yaml.SafeLoader)]
+    if frontmatter.HAS_CSAFE_LOADER:
+        configurations.append(("yaml.CSafeLoader", False, yaml.CSafeLoader))
+    configurations.append(("fast path + fallback", True, frontmatter._YamlLoader))
+
+    print(f"Parsing {len(contents)} notes (best of {args.rounds} rounds)\n")
+    baseline = None
+    for label, fast_path, loader in configurations:
+        with patch.object(frontmatter, "FAST_PATH_ENABLED", fast_path), patch.object(
+            frontmatter, "_YamlLoader", loader
+        ):
+            elapsed = time_parse(contents, args.rounds)
+        baseline = baseline or elapsed
+        print(
+            f"{label:<22} {elapsed:7.3f}s  "
+            f"{len(contents) / elapsed:9.0f} notes/s  {baseline / elapsed:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,16 +4,21 @@ analytics.py — consolidated vault metrics module (#120).
 Public classes:
   NoteStats           — dataclass for per-note statistics
   NoteAnalytics       — vault-wide analytics with optional matplotlib/networkx visualization
+  AnalyticsService    — long-lived NoteAnalytics report, refreshed incrementally (web UI)
   AnalyticsManager    — pure-Python quality scoring, orphan/stale detection, workflow reports
+  LinkGraph           — wiki-link graph with a reverse index (degrees, neighbours, components)
   AnalyticsCoordinator — coordinates analytics workflow steps (link graph, age, productivity)
 
 Import boundary: no AI calls in the core managers. Safe to run without Ollama.
 """
 
+import hashlib
 import json
 import re
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Union
 from collections import Counter, defaultdict
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass
@@ -27,6 +32,7 @@ except ImportError:
     HAS_VISUALIZATION = False
 
 from src.utils.frontmatter import parse_frontmatter as fm_parse_frontmatter
+from src.utils.vault_index import INLINE_TAG_PATTERN, NoteRecord, VaultIndex
 from .types import AnalyticsResult, ConfigDict, WorkflowReport, ReviewCandidate
 
 
@@ -59,42 +65,42 @@ class NoteStats:
 class NoteAnalytics:
     """Comprehensive analytics for note collections."""
 
-    def __init__(self, notes_directory: str):
+    def __init__(self, notes_directory: str, vault_index: Optional[VaultIndex] = None):
         self.notes_dir = Path(notes_directory)
+        self.vault_index = (
+            vault_index if vault_index is not None else VaultIndex(self.notes_dir)
+        )
         self._note_cache = {}
         self._connection_cache = {}
 
     def scan_notes(self) -> List[NoteStats]:
         """Scan all notes and collect statistics."""
         notes = []
-        for md_file in self.notes_dir.rglob("*.md"):
+        for record in self.vault_index.notes(self.notes_dir):
             try:
-                stats = self._analyze_note(md_file)
+                stats = self._stats_from_record(record)
                 if stats:
                     notes.append(stats)
             except Exception as e:
-                print(f"Warning: Failed to analyze {md_file}: {e}")
+                print(f"Warning: Failed to analyze {record.path}: {e}")
         return notes
 
     def _analyze_note(self, file_path: Path) -> Optional[NoteStats]:
         """Analyze a single note file."""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-        except Exception:
-            return None
-
-        frontmatter, body = self._extract_frontmatter(content)
-
-        word_count = len(body.split())
+        record = self.vault_index.get(file_path)
+        return self._stats_from_record(record) if record is not None else None
 
-        tags = frontmatter.get("tags", [])
-        tag_count = len(tags) if isinstance(tags, list) else 0
+    def _stats_from_record(self, record: NoteRecord) -> Optional[NoteStats]:
+        if not record.readable:
+            return None
 
-        link_count = len(re.findall(r"\[\[([^\]]+)\]\]", body))
+        frontmatter = record.frontmatter
+        word_count = record.word_count
+        tag_count = len(record.tags)
+        link_count = record.body_link_count
 
         creation_date = self._parse_date(frontmatter.get("created"))
-        last_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
+        last_modified = datetime.fromtimestamp(record.mtime)
 
         note_type = frontmatter.get("type", "unknown")
         status = frontmatter.get("status", "unknown")
@@ -105,7 +111,7 @@ class NoteAnalytics:
         )
 
         return NoteStats(
-            filename=file_path.name,
+            filename=record.name,
             word_count=word_count,
             tag_count=tag_count,
             link_count=link_count,
@@ -164,7 +170,10 @@ class NoteAnalytics:
 
     def generate_report(self) -> Dict:
         """Generate comprehensive analytics report."""
-        notes = self.scan_notes()
+        return self.build_report(self.scan_notes())
+
+    def build_report(self, notes: List[NoteStats]) -> Dict:
+        """Aggregate per-note statistics into the analytics report."""
         if not notes:
             return {"error": "No notes found"}
 
@@ -281,6 +290,124 @@ class NoteAnalytics:
         return f"Report exported to {output_file}"
 
 
+# ---------------------------------------------------------------------------
+# AnalyticsService
+# ---------------------------------------------------------------------------
+
+
+class AnalyticsService:
+    """
+    Keeps a NoteAnalytics report in memory for a long-running process.
+
+    Each refresh is a stat sweep through a persistent VaultIndex: only notes
+    whose mtime/size/inode changed are re-read, only their NoteStats are
+    recomputed, and the report is only re-aggregated when the vault's
+    fingerprint changed. The fingerprint doubles as the report's ETag.
+
+    ``report()`` serves the cached report and, once it is older than
+    ``refresh_interval`` seconds, refreshes it on a background thread
+    (stale-while-revalidate), so callers never wait for a sweep except the
+    very first time.
+    """
+
+    def __init__(
+        self,
+        vault_path: Union[str, Path],
+        refresh_interval: float = 5.0,
+        vault_index: Optional[VaultIndex] = None,
+    ):
+        self.vault_path = Path(vault_path)
+        self.refresh_interval = refresh_interval
+        self.vault_index = (
+            vault_index
+            if vault_index is not None
+            else VaultIndex.for_vault(self.vault_path)
+        )
+        self.analytics = NoteAnalytics(str(self.vault_path), self.vault_index)
+        self.generated_at: Optional[datetime] = None
+        # (report, etag), swapped as one so readers never see a mismatched pair
+        self._current: Optional[Tuple[Dict, str]] = None
+        # rel_path -> (record the stats were computed from, stats)
+        self._stats: Dict[str, Tuple[NoteRecord, Optional[NoteStats]]] = {}
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        # Separate lock so scheduling never waits behind a running sweep
+        self._thread_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def report(self) -> Tuple[Dict, str]:
+        """Return ``(report, etag)``, scheduling a refresh when stale."""
+        if self._current is None:
+            self.refresh()
+            return self._current
+        # Captured first: a fast background sweep must not swap it mid-call
+        current = self._current
+        if time.monotonic() - self._refreshed_at >= self.refresh_interval:
+            self._refresh_in_background()
+        return current
+
+    def refresh(self) -> bool:
+        """Sweep the vault now; returns True if the report changed."""
+        with self._lock:
+            records = self.vault_index.refresh()
+            fingerprint = hashlib.sha1()
+            for record in records:
+                fingerprint.update(
+                    f"{record.rel_path}\0{record.mtime_ns}\0{record.size}\n".encode()
+                )
+            etag = fingerprint.hexdigest()[:20]
+            self._refreshed_at = time.monotonic()
+            if self._current is not None and etag == self._current[1]:
+                return False
+
+            stats: Dict[str, Tuple[NoteRecord, Optional[NoteStats]]] = {}
+            for record in records:
+                cached = self._stats.get(record.rel_path)
+                # VaultIndex hands back the same record object while unchanged
+                if cached is not None and cached[0] is record:
+                    stats[record.rel_path] = cached
+                    continue
+                try:
+                    note_stats = self.analytics._stats_from_record(record)
+                except Exception as e:
+                    print(f"Warning: Failed to analyze {record.path}: {e}")
+                    note_stats = None
+                stats[record.rel_path] = (record, note_stats)
+
+            self._stats = stats
+            report = self.analytics.build_report(
+                [s for _, s in stats.values() if s is not None]
+            )
+            self._current = (report, etag)
+            self.generated_at = datetime.now()
+            return True
+
+    def _refresh_in_background(self):
+        with self._thread_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._safe_refresh, name="analytics-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _safe_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"Warning: Analytics refresh failed for {self.vault_path}: {e}")
+
+    def close(self):
+        """Wait for a running background refresh and close the vault index."""
+        with self._thread_lock:
+            thread = self._refresh_thread
+            self._refresh_thread = None
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            self.vault_index.close()
+
+
 # ---------------------------------------------------------------------------
 # AnalyticsManager
 # ---------------------------------------------------------------------------
@@ -294,9 +421,17 @@ class AnalyticsManager:
     and promotion candidate scanning. Safe to run without Ollama.
     """
 
-    def __init__(self, base_dir: Path, config: ConfigDict) -> None:
+    def __init__(
+        self,
+        base_dir: Path,
+        config: ConfigDict,
+        vault_index: Optional[VaultIndex] = None,
+    ) -> None:
         self.base_dir = Path(base_dir)
         self.config = config
+        self.vault_index = (
+            vault_index if vault_index is not None else VaultIndex(self.base_dir)
+        )
 
     def assess_quality(self, note_path: str, dry_run: bool = False) -> AnalyticsResult:
         """Assess the quality of a note based on multiple metrics."""
@@ -325,23 +460,39 @@ class AnalyticsManager:
 
         word_count = len(body_content.split())
 
-        tags = set()
-        if frontmatter_content:
-            tag_match = re.search(r"tags:\s*\[(.*?)\]", frontmatter_content)
-            if tag_match:
-                tag_str = tag_match.group(1)
-                tags.update(
-                    tag.strip().strip("\"'")
-                    for tag in tag_str.split(",")
-                    if tag.strip()
-                )
-        inline_tags = re.findall(r"#([\w-]+)", body_content)
-        tags.update(inline_tags)
-        tag_count = len(tags)
+        frontmatter = fm_parse_frontmatter(content)[0] if frontmatter_content else {}
+        tag_count = len(
+            self._note_tags(frontmatter, INLINE_TAG_PATTERN.findall(body_content))
+        )
 
         links = re.findall(r"\[\[(.*?)\]\]", body_content)
         link_count = len(links)
 
+        return self._score_quality(word_count, tag_count, link_count, has_frontmatter)
+
+    def _quality_from_record(self, record: NoteRecord) -> AnalyticsResult:
+        """assess_quality() for an already-indexed note (no file read)."""
+        return self._score_quality(
+            record.word_count,
+            len(self._note_tags(record.frontmatter, record.inline_tags)),
+            record.body_link_count,
+            record.has_frontmatter,
+        )
+
+    @staticmethod
+    def _note_tags(frontmatter: Dict, inline_tags: Iterable[str]) -> Set[str]:
+        """Distinct frontmatter (list or block-list) and inline ``#tags``."""
+        tags = frontmatter.get("tags") if isinstance(frontmatter, dict) else None
+        tags = tags if isinstance(tags, list) else []
+        return {str(tag) for tag in tags} | set(inline_tags)
+
+    def _score_quality(
+        self,
+        word_count: int,
+        tag_count: int,
+        link_count: int,
+        has_frontmatter: bool,
+    ) -> AnalyticsResult:
         weights = self.config.get("analytics", {}).get(
             "quality_weights",
             {
@@ -379,9 +530,14 @@ class AnalyticsManager:
             },
         }
 
-    def detect_orphaned_notes(self) -> ReviewCandidate:
+    def detect_orphaned_notes(
+        self, records: Optional[List[NoteRecord]] = None
+    ) -> ReviewCandidate:
         """Detect notes with no incoming or outgoing links."""
-        link_graph = self._build_link_graph()
+        if records is None:
+            records = self.vault_index.refresh()
+        titles = {record.rel_path: record.title for record in records}
+        link_graph = self._build_link_graph(records)
         orphaned = []
         for note_path, links in link_graph.items():
             incoming = links.get("incoming", [])
@@ -390,7 +546,7 @@ class AnalyticsManager:
                 orphaned.append(
                     {
                         "note": Path(note_path).name,
-                        "title": self._extract_title(note_path),
+                        "title": titles.get(note_path, Path(note_path).stem),
                         "incoming_links": 0,
                         "outgoing_links": 0,
                     }
@@ -398,27 +554,31 @@ class AnalyticsManager:
         return orphaned
 
     def detect_stale_notes(
-        self, days_threshold: Optional[int] = None
+        self,
+        days_threshold: Optional[int] = None,
+        records: Optional[List[NoteRecord]] = None,
     ) -> ReviewCandidate:
         """Detect notes not modified within threshold period."""
         if days_threshold is None:
             days_threshold = self.config.get("analytics", {}).get(
                 "stale_threshold_days", 90
             )
+        if records is None:
+            records = self.vault_index.refresh()
 
         threshold_date = datetime.now() - timedelta(days=days_threshold)
         stale_notes = []
 
-        for md_file in self.base_dir.rglob("*.md"):
-            if ".git" in str(md_file) or "Archive" in str(md_file):
+        for record in records:
+            if "Archive" in record.rel_path:
                 continue
-            modified_time = datetime.fromtimestamp(md_file.stat().st_mtime)
+            modified_time = datetime.fromtimestamp(record.mtime)
             if modified_time < threshold_date:
                 days_since = (datetime.now() - modified_time).days
                 stale_notes.append(
                     {
-                        "note": md_file.name,
-                        "title": self._extract_title(md_file),
+                        "note": record.name,
+                        "title": record.title,
                         "last_modified": modified_time,
                         "days_since_modified": days_since,
                     }
@@ -436,41 +596,35 @@ class AnalyticsManager:
             "quality_scores": [],
         }
 
-        for md_file in self.base_dir.rglob("*.md"):
-            if ".git" in str(md_file) or "Archive" in str(md_file):
+        records = self.vault_index.refresh()
+        for record in records:
+            if "Archive" in record.rel_path:
                 continue
             report["total_notes"] += 1
-            try:
-                content = md_file.read_text(encoding="utf-8")
-                type_match = re.search(r"type:\s*(\w+)", content)
-                if type_match:
-                    note_type = type_match.group(1)
-                    report["notes_by_type"][note_type] = (
-                        report["notes_by_type"].get(note_type, 0) + 1
-                    )
-                status_match = re.search(r"status:\s*(\w+)", content)
-                if status_match:
-                    status = status_match.group(1)
-                    report["notes_by_status"][status] = (
-                        report["notes_by_status"].get(status, 0) + 1
-                    )
-                try:
-                    quality_result = self.assess_quality(
-                        str(md_file.relative_to(self.base_dir))
-                    )
-                    report["quality_scores"].append(quality_result["quality_score"])
-                except Exception:
-                    pass
-            except Exception:
+            if not record.readable:
                 continue
+            note_type = record.frontmatter.get("type")
+            if note_type:
+                note_type = str(note_type)
+                report["notes_by_type"][note_type] = (
+                    report["notes_by_type"].get(note_type, 0) + 1
+                )
+            status = record.frontmatter.get("status")
+            if status:
+                status = str(status)
+                report["notes_by_status"][status] = (
+                    report["notes_by_status"].get(status, 0) + 1
+                )
+            quality_result = self._quality_from_record(record)
+            report["quality_scores"].append(quality_result["quality_score"])
 
         if report["quality_scores"]:
             report["avg_quality_score"] = round(
                 sum(report["quality_scores"]) / len(report["quality_scores"]), 2
             )
 
-        report["orphaned_count"] = len(self.detect_orphaned_notes())
-        report["stale_count"] = len(self.detect_stale_notes())
+        report["orphaned_count"] = len(self.detect_orphaned_notes(records))
+        report["stale_count"] = len(self.detect_stale_notes(records=records))
 
         return report
 
@@ -488,16 +642,16 @@ class AnalyticsManager:
         if not fleeting_dir.exists():
             return candidates
 
-        for note_file in fleeting_dir.glob("*.md"):
+        for record in self.vault_index.notes(fleeting_dir, recursive=False):
+            if not record.readable:
+                continue
             try:
-                quality_result = self.assess_quality(
-                    str(note_file.relative_to(self.base_dir))
-                )
+                quality_result = self._quality_from_record(record)
                 if quality_result["quality_score"] >= min_quality_score:
                     candidates.append(
                         {
-                            "note": note_file.name,
-                            "title": self._extract_title(note_file),
+                            "note": record.name,
+                            "title": record.title,
                             "quality_score": quality_result["quality_score"],
                             "metrics": quality_result.get("metrics", {}),
                             "rationale": self._generate_promotion_rationale(
@@ -510,27 +664,27 @@ class AnalyticsManager:
 
         return sorted(candidates, key=lambda x: x["quality_score"], reverse=True)
 
-    def _build_link_graph(self) -> Dict[str, Dict[str, List[str]]]:
+    def _build_link_graph(
+        self, records: Optional[List[NoteRecord]] = None
+    ) -> Dict[str, Dict[str, List[str]]]:
         """Build bidirectional link graph for all notes."""
+        if records is None:
+            records = self.vault_index.refresh()
+        resolver = LinkResolver(records)
         link_graph = {}
-        for md_file in self.base_dir.rglob("*.md"):
-            if ".git" in str(md_file):
-                continue
-            note_path = str(md_file.relative_to(self.base_dir))
-            link_graph[note_path] = {"incoming": [], "outgoing": []}
-            try:
-                content = md_file.read_text(encoding="utf-8")
-                links = re.findall(r"\[\[(.*?)\]\]", content)
-                link_graph[note_path]["outgoing"] = links
-            except Exception:
-                continue
+        for record in records:
+            link_graph[record.rel_path] = {
+                "incoming": [],
+                "outgoing": list(record.links),
+            }
 
         for source_path, links in link_graph.items():
-            for target_link in links["outgoing"]:
-                for target_path in link_graph.keys():
-                    if target_link in target_path:
-                        link_graph[target_path]["incoming"].append(source_path)
-                        break
+            targets = {
+                resolver.resolve(link, source_path) for link in links["outgoing"]
+            }
+            for target_path in targets:
+                if target_path is not None and target_path != source_path:
+                    link_graph[target_path]["incoming"].append(source_path)
 
         return link_graph
 
@@ -538,14 +692,10 @@ class AnalyticsManager:
         """Extract title from note file."""
         if isinstance(file_path, str):
             file_path = Path(file_path)
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-            if title_match:
-                return title_match.group(1).strip()
-        except Exception:
-            pass
-        return file_path.stem
+        if not file_path.is_absolute():
+            file_path = self.base_dir / file_path
+        record = self.vault_index.get(file_path)
+        return record.title if record is not None else file_path.stem
 
     def _generate_promotion_rationale(self, quality_result: AnalyticsResult) -> str:
         """Generate human-readable rationale for promotion recommendation."""
@@ -563,6 +713,202 @@ class AnalyticsManager:
         return "Meets quality threshold"
 
 
+# ---------------------------------------------------------------------------
+# LinkGraph
+# ---------------------------------------------------------------------------
+
+
+def normalize_link_target(target: str) -> str:
+    """Reduce a wiki-link target to its note key.
+
+    ``[[Folder/Note.md#Heading|Alias]]`` -> ``"note"``. Obsidian resolves
+    links case-insensitively, so keys are lower-cased.
+    """
+    target = target.split("|", 1)[0].rstrip("\\").split("#", 1)[0]
+    target = target.replace("\\", "/").rsplit("/", 1)[-1].strip()
+    if target.lower().endswith(".md"):
+        target = target[:-3]
+    return target.strip().lower()
+
+
+class LinkResolver:
+    """Resolve wiki-link targets to note paths with Obsidian's rules.
+
+    Lookup tables are built once per vault, so each link resolves in O(1)
+    instead of scanning every note. ``[[Folder/Note]]`` matches by relative
+    path (or path suffix), ``[[Note]]`` by exact stem, then case-insensitive
+    stem, then frontmatter ``aliases``. ``|alias`` and ``#heading`` suffixes
+    are ignored. When several notes share a stem, the one in the linking
+    note's folder wins, otherwise the shortest path.
+    """
+
+    def __init__(self, records: List[NoteRecord]):
+        self._by_path: Dict[str, str] = {}
+        self._by_stem: Dict[str, List[str]] = defaultdict(list)
+        self._by_lower_stem: Dict[str, List[str]] = defaultdict(list)
+        self._by_alias: Dict[str, List[str]] = defaultdict(list)
+        self._by_suffix: Dict[str, List[str]] = defaultdict(list)
+        for record in records:
+            rel_path = record.rel_path
+            key = self._path_key(rel_path)
+            self._by_path[key] = rel_path
+            # Trailing folder/stem runs of two or more segments, so that
+            # [[Folder/Note]] resolves without scanning every path.
+            parts = key.split("/")
+            for i in range(1, len(parts) - 1):
+                self._by_suffix["/".join(parts[i:])].append(rel_path)
+            self._by_stem[record.stem].append(rel_path)
+            self._by_lower_stem[record.stem.lower()].append(rel_path)
+            for alias in self._aliases(record.frontmatter):
+                self._by_alias[alias.lower()].append(rel_path)
+
+    @staticmethod
+    def _path_key(path: str) -> str:
+        path = path.replace("\\", "/").strip().strip("/")
+        if path.lower().endswith(".md"):
+            path = path[:-3]
+        return path.lower()
+
+    @staticmethod
+    def _aliases(frontmatter: Dict) -> List[str]:
+        aliases = frontmatter.get("aliases", frontmatter.get("alias")) or []
+        if isinstance(aliases, str):
+            aliases = [a.strip() for a in aliases.split(",")]
+        elif not isinstance(aliases, (list, tuple)):
+            aliases = [aliases]  # e.g. ``aliases: 2024``
+        return [str(a) for a in aliases if a]
+
+    @staticmethod
+    def _closest(candidates: List[str], source: Optional[str]) -> str:
+        if len(candidates) == 1 or source is None:
+            return min(candidates, key=len)
+        folder = str(Path(source).parent)
+        local = [c for c in candidates if str(Path(c).parent) == folder]
+        return min(local or candidates, key=len)
+
+    def resolve(self, link: str, source: Optional[str] = None) -> Optional[str]:
+        """Return the rel_path ``link`` points to, or None if unresolved."""
+        target = link.split("|", 1)[0].rstrip("\\").split("#", 1)[0].strip()
+        if not target:
+            return None
+        if "/" in target or "\\" in target:
+            key = self._path_key(target)
+            if key in self._by_path:
+                return self._by_path[key]
+            matches = self._by_suffix.get(key)
+            return self._closest(matches, source) if matches else None
+
+        if target.lower().endswith(".md"):
+            target = target[:-3]
+        for table, key in (
+            (self._by_stem, target),
+            (self._by_lower_stem, target.lower()),
+            (self._by_alias, target.lower()),
+        ):
+            candidates = table.get(key)
+            if candidates:
+                return self._closest(candidates, source)
+        return None
+
+
+class LinkGraph:
+    """Directed wiki-link graph keyed by normalized note stem.
+
+    Built in one pass over the notes (O(N + E)) with both the outgoing
+    adjacency and an inverted incoming-links map, so degree and orphan
+    queries are O(1) per note. Links to notes outside the graph still count
+    as outgoing links but do not create nodes.
+    """
+
+    def __init__(self):
+        self._outgoing: Dict[str, set] = {}
+        self._incoming: Dict[str, set] = defaultdict(set)
+
+    @classmethod
+    def from_records(cls, records: List[NoteRecord]) -> "LinkGraph":
+        graph = cls()
+        for record in records:
+            graph.add_note(record.stem, record.links)
+        return graph
+
+    def add_note(self, stem: str, links: List[str]):
+        source = normalize_link_target(stem)
+        targets = self._outgoing.setdefault(source, set())
+        for link in links:
+            target = normalize_link_target(link)
+            if not target:
+                continue
+            targets.add(target)
+            if target != source:
+                self._incoming[target].add(source)
+
+    def __contains__(self, stem: str) -> bool:
+        return normalize_link_target(stem) in self._outgoing
+
+    def __len__(self) -> int:
+        return len(self._outgoing)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._outgoing)
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self._outgoing.values())
+
+    def outgoing(self, stem: str) -> set:
+        return set(self._outgoing.get(normalize_link_target(stem), ()))
+
+    def incoming(self, stem: str) -> set:
+        return set(self._incoming.get(normalize_link_target(stem), ()))
+
+    def out_degree(self, stem: str) -> int:
+        return len(self._outgoing.get(normalize_link_target(stem), ()))
+
+    def in_degree(self, stem: str) -> int:
+        return len(self._incoming.get(normalize_link_target(stem), ()))
+
+    def neighbours(self, stem: str) -> set:
+        """Notes linked to or from stem (existing notes only)."""
+        key = normalize_link_target(stem)
+        linked = self._outgoing.get(key, set()) | self._incoming.get(key, set())
+        return {n for n in linked if n in self._outgoing and n != key}
+
+    def is_orphan(self, stem: str) -> bool:
+        return self.out_degree(stem) == 0 and self.in_degree(stem) == 0
+
+    def components(self) -> List[set]:
+        """Weakly connected components, largest first (union-find)."""
+        parent = {node: node for node in self._outgoing}
+
+        def find(node: str) -> str:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for source, targets in self._outgoing.items():
+            for target in targets:
+                if target in parent:
+                    root_a, root_b = find(source), find(target)
+                    if root_a != root_b:
+                        parent[root_a] = root_b
+
+        groups: Dict[str, set] = defaultdict(set)
+        for node in parent:
+            groups[find(node)].add(node)
+        return sorted(groups.values(), key=len, reverse=True)
+
+    def summary(self) -> Dict:
+        components = self.components()
+        return {
+            "nodes": len(self),
+            "links": self.edge_count,
+            "components": len(components),
+            "largest_component": len(components[0]) if components else 0,
+        }
+
+
 # ---------------------------------------------------------------------------
 # AnalyticsCoordinator
 # ---------------------------------------------------------------------------
@@ -576,192 +922,168 @@ class AnalyticsCoordinator:
     age distribution, and productivity metrics.
     """
 
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, vault_index: Optional[VaultIndex] = None):
         self.base_dir = Path(base_dir)
         self.inbox_dir = self.base_dir / "Inbox"
         self.fleeting_dir = self.base_dir / "Fleeting Notes"
         self.permanent_dir = self.base_dir / "Permanent Notes"
+        self.vault_index = (
+            vault_index if vault_index is not None else VaultIndex(self.base_dir)
+        )
 
     def detect_orphaned_notes(self) -> List[Dict]:
         """Detect notes that have no bidirectional links to other notes."""
-        all_notes = self._get_all_notes()
-        link_graph = self._build_link_graph(all_notes)
-        return [
-            self._create_orphaned_note_info(p)
-            for p in all_notes
-            if self._is_orphaned_note(p, link_graph)
-        ]
+        return self._orphaned_notes(self._get_all_records())
 
     def detect_orphaned_notes_comprehensive(self) -> List[Dict]:
         """Detect orphaned notes across the entire repository."""
-        all_notes = self._get_all_notes_comprehensive()
-        link_graph = self._build_link_graph(all_notes)
-        return [
-            self._create_orphaned_note_info(p)
-            for p in all_notes
-            if self._is_orphaned_note(p, link_graph)
-        ]
+        return self._orphaned_notes(self.vault_index.refresh())
+
+    def build_link_graph(self, records: Optional[List[NoteRecord]] = None) -> LinkGraph:
+        """Link graph over the workflow directories (or the given records)."""
+        if records is None:
+            records = self._get_all_records()
+        return LinkGraph.from_records(records)
 
     def detect_stale_notes(self, days_threshold: int = 90) -> List[Dict]:
         """Detect notes not modified within threshold period."""
-        stale_notes = []
-        cutoff_date = datetime.now() - timedelta(days=days_threshold)
-        for note_path in self._get_all_notes():
-            try:
-                last_modified = datetime.fromtimestamp(note_path.stat().st_mtime)
-                if last_modified < cutoff_date:
-                    days_since_modified = (datetime.now() - last_modified).days
-                    stale_notes.append(
-                        self._create_stale_note_info(
-                            note_path, last_modified, days_since_modified
-                        )
-                    )
-            except (OSError, AttributeError):
-                continue
-        stale_notes.sort(key=lambda x: x["days_since_modified"], reverse=True)
-        return stale_notes
+        return self._stale_notes(self._get_all_records(), days_threshold)
 
     def generate_enhanced_metrics(self) -> Dict:
         """Generate comprehensive metrics for weekly review."""
+        records = self._get_all_records()
+        link_graph = self.build_link_graph(records)
         metrics = {
             "generated_at": datetime.now().isoformat(),
-            "orphaned_notes": self.detect_orphaned_notes(),
-            "stale_notes": self.detect_stale_notes(),
-            "link_density": self._calculate_link_density(),
-            "note_age_distribution": self._calculate_note_age_distribution(),
-            "productivity_metrics": self._calculate_productivity_metrics(),
+            "orphaned_notes": self._orphaned_notes(records, link_graph),
+            "stale_notes": self._stale_notes(records),
+            "link_density": self._calculate_link_density(records, link_graph),
+            "link_graph": link_graph.summary(),
+            "note_age_distribution": self._calculate_note_age_distribution(records),
+            "productivity_metrics": self._calculate_productivity_metrics(records),
         }
         metrics["summary"] = {
             "total_orphaned": len(metrics["orphaned_notes"]),
             "total_stale": len(metrics["stale_notes"]),
             "avg_links_per_note": metrics["link_density"],
-            "total_notes": len(self._get_all_notes()),
+            "total_notes": len(records),
         }
         return metrics
 
+    def _get_all_records(self) -> List[NoteRecord]:
+        """Indexed notes from the workflow directories (one stat sweep)."""
+        records = []
+        for directory in [self.permanent_dir, self.fleeting_dir, self.inbox_dir]:
+            records.extend(self.vault_index.notes(directory, recursive=False))
+        return records
+
     def _get_all_notes(self) -> List[Path]:
         """Get all markdown notes from workflow directories."""
-        all_notes = []
-        for directory in [self.permanent_dir, self.fleeting_dir, self.inbox_dir]:
-            if directory.exists():
-                all_notes.extend(directory.glob("*.md"))
-        return all_notes
+        return [record.path for record in self._get_all_records()]
 
     def _get_all_notes_comprehensive(self) -> List[Path]:
         """Get all markdown notes from the entire repository."""
-        return list(self.base_dir.rglob("*.md"))
-
-    def _build_link_graph(self, all_notes: List[Path]) -> Dict[str, set]:
-        """Build a graph of note links."""
-        link_graph = {}
-        for note_path in all_notes:
-            note_name = note_path.stem
-            link_graph[note_name] = set()
-            try:
-                with open(note_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                wiki_links = re.findall(r"\[\[([^\]]+)\]\]", content)
-                for link in wiki_links:
-                    link_graph[note_name].add(link.replace(".md", ""))
-            except (UnicodeDecodeError, FileNotFoundError):
-                continue
-        return link_graph
+        return [record.path for record in self.vault_index.refresh()]
+
+    def _orphaned_notes(
+        self, records: List[NoteRecord], link_graph: Optional[LinkGraph] = None
+    ) -> List[Dict]:
+        """Notes outside the Inbox with no incoming or outgoing links."""
+        if link_graph is None:
+            link_graph = LinkGraph.from_records(records)
+        return [
+            self._orphaned_note_info(record)
+            for record in records
+            if record.directory != "Inbox" and link_graph.is_orphan(record.stem)
+        ]
 
-    def _is_orphaned_note(self, note_path: Path, link_graph: Dict[str, set]) -> bool:
-        """Check if a note is orphaned (no incoming or outgoing links)."""
-        if note_path.parent.name == "Inbox":
-            return False
-        note_name = note_path.stem
-        has_outgoing = len(link_graph.get(note_name, set())) > 0
-        has_incoming = any(
-            note_name in links
-            for other, links in link_graph.items()
-            if other != note_name
-        )
-        return not (has_outgoing or has_incoming)
+    def _stale_notes(
+        self, records: List[NoteRecord], days_threshold: int = 90
+    ) -> List[Dict]:
+        stale_notes = []
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=days_threshold)
+        for record in records:
+            last_modified = datetime.fromtimestamp(record.mtime)
+            if last_modified < cutoff_date:
+                stale_notes.append(
+                    {
+                        "path": str(record.path),
+                        "title": record.title,
+                        "last_modified": last_modified.isoformat(),
+                        "days_since_modified": (now - last_modified).days,
+                        "directory": record.directory,
+                    }
+                )
+        stale_notes.sort(key=lambda x: x["days_since_modified"], reverse=True)
+        return stale_notes
 
-    def _create_orphaned_note_info(self, note_path: Path) -> Dict:
-        """Create info dict for an orphaned note."""
-        try:
-            last_modified = datetime.fromtimestamp(note_path.stat().st_mtime)
-            title = self._extract_note_title(note_path)
-        except (OSError, AttributeError):
-            last_modified = None
-            title = note_path.stem
-        return {
-            "path": str(note_path),
-            "title": title,
-            "last_modified": last_modified.isoformat() if last_modified else None,
-            "directory": note_path.parent.name,
-        }
+    def _build_link_graph(self, all_notes: List[Path]) -> Dict[str, set]:
+        """Adjacency view (stem -> normalized link targets) of all_notes."""
+        records = [self.vault_index.get(note_path) for note_path in all_notes]
+        graph = LinkGraph.from_records([r for r in records if r is not None])
+        return {node: graph.outgoing(node) for node in graph.nodes}
 
-    def _create_stale_note_info(
-        self, note_path: Path, last_modified: datetime, days_since_modified: int
-    ) -> Dict:
-        """Create info dict for a stale note."""
+    def _orphaned_note_info(self, record: NoteRecord) -> Dict:
         return {
-            "path": str(note_path),
-            "title": self._extract_note_title(note_path),
-            "last_modified": last_modified.isoformat(),
-            "days_since_modified": days_since_modified,
-            "directory": note_path.parent.name,
+            "path": str(record.path),
+            "title": record.title,
+            "last_modified": datetime.fromtimestamp(record.mtime).isoformat(),
+            "directory": record.directory,
         }
 
     def _extract_note_title(self, note_path: Path) -> str:
         """Extract title from note (first # heading or filename)."""
-        try:
-            with open(note_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            heading_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-            if heading_match:
-                return heading_match.group(1).strip()
-            return note_path.stem
-        except (UnicodeDecodeError, FileNotFoundError):
-            return note_path.stem
-
-    def _calculate_link_density(self) -> float:
+        record = self.vault_index.get(note_path)
+        return record.title if record is not None else note_path.stem
+
+    def _calculate_link_density(
+        self,
+        records: Optional[List[NoteRecord]] = None,
+        link_graph: Optional[LinkGraph] = None,
+    ) -> float:
         """Calculate average number of links per note."""
-        all_notes = self._get_all_notes()
-        if not all_notes:
+        if records is None:
+            records = self._get_all_records()
+        if not records:
             return 0.0
-        link_graph = self._build_link_graph(all_notes)
-        total_links = sum(len(links) for links in link_graph.values())
-        return total_links / len(all_notes)
+        if link_graph is None:
+            link_graph = LinkGraph.from_records(records)
+        return link_graph.edge_count / len(records)
 
-    def _calculate_note_age_distribution(self) -> Dict:
+    def _calculate_note_age_distribution(
+        self, records: Optional[List[NoteRecord]] = None
+    ) -> Dict:
         """Calculate distribution of note ages."""
-        all_notes = self._get_all_notes()
+        if records is None:
+            records = self._get_all_records()
         age_buckets = {"new": 0, "recent": 0, "mature": 0, "old": 0}
         now = datetime.now()
-        for note_path in all_notes:
-            try:
-                created_time = datetime.fromtimestamp(note_path.stat().st_ctime)
-                age_days = (now - created_time).days
-                if age_days < 7:
-                    age_buckets["new"] += 1
-                elif age_days < 30:
-                    age_buckets["recent"] += 1
-                elif age_days < 90:
-                    age_buckets["mature"] += 1
-                else:
-                    age_buckets["old"] += 1
-            except (OSError, AttributeError):
+        for record in records:
+            age_days = (now - datetime.fromtimestamp(record.ctime)).days
+            if age_days < 7:
+                age_buckets["new"] += 1
+            elif age_days < 30:
+                age_buckets["recent"] += 1
+            elif age_days < 90:
+                age_buckets["mature"] += 1
+            else:
                 age_buckets["old"] += 1
         return age_buckets
 
-    def _calculate_productivity_metrics(self) -> Dict:
+    def _calculate_productivity_metrics(
+        self, records: Optional[List[NoteRecord]] = None
+    ) -> Dict:
         """Calculate productivity metrics like notes per week."""
-        all_notes = self._get_all_notes()
+        if records is None:
+            records = self._get_all_records()
         weekly_creation: Dict[str, int] = defaultdict(int)
         weekly_modification: Dict[str, int] = defaultdict(int)
-        for note_path in all_notes:
-            try:
-                created_time = datetime.fromtimestamp(note_path.stat().st_ctime)
-                modified_time = datetime.fromtimestamp(note_path.stat().st_mtime)
-                weekly_creation[created_time.strftime("%Y-W%U")] += 1
-                weekly_modification[modified_time.strftime("%Y-W%U")] += 1
-            except (OSError, AttributeError):
-                continue
+        for record in records:
+            created_time = datetime.fromtimestamp(record.ctime)
+            modified_time = datetime.fromtimestamp(record.mtime)
+            weekly_creation[created_time.strftime("%Y-W%U")] += 1
+            weekly_modification[modified_time.strftime("%Y-W%U")] += 1
         creation_counts = list(weekly_creation.values())
         modification_counts = list(weekly_modification.values())
         return {
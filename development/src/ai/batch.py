@@ -21,12 +21,15 @@ import json
 import logging
 import re
 import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Callable, Any
 from dataclasses import dataclass
 from datetime import datetime
 import uuid
 
+from src.utils.progress_events import ProgressBus, ProgressReporter
+
 logger = logging.getLogger(__name__)
 
 
@@ -601,13 +604,17 @@ class BatchProcessingCoordinator:
     """Coordinates batch processing of inbox notes with progress tracking."""
 
     def __init__(
-        self, inbox_dir: Path, process_callback: Optional[Callable[[str], Dict]] = None
+        self,
+        inbox_dir: Path,
+        process_callback: Optional[Callable[[str], Dict]] = None,
+        progress_bus: Optional[ProgressBus] = None,
     ):
         """Initialize the batch processing coordinator.
 
         Args:
             inbox_dir: Path to inbox directory
             process_callback: Optional callback for processing notes (can be set later)
+            progress_bus: Bus for progress events (default: the process-wide bus)
         """
         if not isinstance(inbox_dir, Path):
             inbox_dir = Path(inbox_dir)
@@ -628,6 +635,7 @@ class BatchProcessingCoordinator:
 
         self.inbox_dir = inbox_dir
         self.process_callback = process_callback
+        self.progress_bus = progress_bus
 
         logger.info(
             f"BatchProcessingCoordinator initialized: inbox_dir={inbox_dir}, "
@@ -656,6 +664,8 @@ class BatchProcessingCoordinator:
             },
         }
 
+        reporter = ProgressReporter("batch_process_inbox", total, self.progress_bus)
+
         for idx, note_file in enumerate(inbox_files, 1):
             if show_progress:
                 filename = note_file.name
@@ -667,6 +677,7 @@ class BatchProcessingCoordinator:
 
             logger.debug(f"Processing note [{idx}/{total}]: {note_file.name}")
 
+            started = time.perf_counter()
             try:
                 result = self.process_callback(str(note_file))
 
@@ -689,6 +700,11 @@ class BatchProcessingCoordinator:
                     )
 
                 results["results"].append(result)
+                reporter.note(
+                    note_file.name,
+                    latency=time.perf_counter() - started,
+                    error=str(result["error"]) if "error" in result else None,
+                )
 
             except Exception as e:
                 results["failed"] += 1
@@ -699,6 +715,11 @@ class BatchProcessingCoordinator:
                 results["results"].append(
                     {"original_file": str(note_file), "error": str(e)}
                 )
+                reporter.note(
+                    note_file.name, latency=time.perf_counter() - started, error=str(e)
+                )
+
+        reporter.finish()
 
         if show_progress and total > 0:
             sys.stderr.write("\r" + " " * 80 + "\r")
@@ -719,9 +740,185 @@ class BatchProcessingCoordinator:
 # note_processing_coordinator — AI-powered per-note processing
 # ===========================================================================
 
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+
 from src.utils.tags import sanitize_tags
 from src.utils.frontmatter import parse_frontmatter, build_frontmatter
 from src.utils.io import safe_write
+from .enrichment import PROMPT_VERSION
+from .llm_client import AsyncOllamaClient, request_timeout
+
+
+class NoteResultCache:
+    """Persistent cache of per-note AI results keyed by content hash.
+
+    Entries are keyed on (body hash, model names, prompt version, processing
+    config) and hold the raw tagger output, enhancer output and discovered
+    connections. Connections also depend on the corpus, so they are stored
+    with a corpus signature and only reused while it matches.
+
+    The SQLite file is opened lazily so constructing a WorkflowManager does
+    not touch the vault.
+    """
+
+    DB_PATH = Path(".embedding_cache") / "note_results.sqlite"
+
+    def __init__(self, db_path: Path, max_entries: int = 10000):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def for_vault(cls, vault_path: Path, **kwargs) -> "NoteResultCache":
+        return cls(Path(vault_path) / cls.DB_PATH, **kwargs)
+
+    # process_note appends this section itself; it must not change the key
+    _GENERATED_SECTION = re.compile(
+        r"^## Suggested Connections\n.*?(?=^## |\Z)", re.DOTALL | re.MULTILINE
+    )
+
+    @classmethod
+    def body_hash(cls, body: str) -> str:
+        """Hash of the user-written body, ignoring the generated section."""
+        body = cls._GENERATED_SECTION.sub("\n", body).strip()
+        return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_key(body_hash: str, models: Dict[str, Any], config: Dict) -> str:
+        material = json.dumps(
+            {
+                "body": body_hash,
+                "models": models,
+                "prompt_version": PROMPT_VERSION,
+                "config": config,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, body_hash TEXT NOT NULL, "
+                "payload TEXT NOT NULL, last_access REAL NOT NULL, "
+                "hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS results_body ON results(body_hash)"
+            )
+            self._db.commit()
+        return self._db
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached payload for key, or None on a miss."""
+        with self._lock:
+            try:
+                db = self._connect()
+                row = db.execute(
+                    "SELECT payload FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                db.execute(
+                    "UPDATE results SET last_access = ?, hits = hits + 1 "
+                    "WHERE key = ?",
+                    (time.time(), key),
+                )
+                db.commit()
+                self.hits += 1
+                return json.loads(row[0])
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning(f"Note result cache read failed: {e}")
+                self.misses += 1
+                return None
+
+    def put(self, key: str, body_hash: str, payload: Dict):
+        """Store payload for key, evicting least recently used entries."""
+        with self._lock:
+            try:
+                db = self._connect()
+                db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, 0)",
+                    (key, body_hash, json.dumps(payload, default=str), time.time()),
+                )
+                db.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM results "
+                    "ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Note result cache write failed: {e}")
+
+    def invalidate(self, body_hash: Optional[str] = None) -> int:
+        """Drop entries for one note body (or everything); returns the count."""
+        with self._lock:
+            if self._db is None and not self.db_path.exists():
+                return 0
+            db = self._connect()
+            if body_hash is None:
+                cursor = db.execute("DELETE FROM results")
+            else:
+                cursor = db.execute(
+                    "DELETE FROM results WHERE body_hash = ?", (body_hash,)
+                )
+            db.commit()
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, on-disk size, lifetime hits and this session's hit rate."""
+        with self._lock:
+            entries = lifetime_hits = 0
+            if self._db is not None or self.db_path.exists():
+                entries, lifetime_hits = (
+                    self._connect()
+                    .execute("SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM results")
+                    .fetchone()
+                )
+            lookups = self.hits + self.misses
+            return {
+                "path": str(self.db_path),
+                "entries": entries,
+                "lifetime_hits": lifetime_hits,
+                "size_bytes": (
+                    self.db_path.stat().st_size if self.db_path.exists() else 0
+                ),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def _corpus_signature(corpus_dir: Optional[Path]) -> Optional[str]:
+    """Cheap stat-only fingerprint of a connection corpus directory."""
+    if corpus_dir is None or not Path(corpus_dir).exists():
+        return None
+    digest = hashlib.sha256()
+    for entry in sorted(os.scandir(corpus_dir), key=lambda e: e.name):
+        if entry.name.endswith(".md") and entry.is_file():
+            stat = entry.stat()
+            digest.update(
+                f"{entry.name}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode()
+            )
+    return digest.hexdigest()
 
 
 class NoteProcessingCoordinator:
@@ -740,6 +937,7 @@ class NoteProcessingCoordinator:
         enhancer,
         connection_coordinator,
         config: Optional[Dict] = None,
+        result_cache: Optional[NoteResultCache] = None,
     ):
         """
         Initialize note processing coordinator.
@@ -750,11 +948,13 @@ class NoteProcessingCoordinator:
             enhancer: AI enhancer component for quality assessment
             connection_coordinator: Connection discovery coordinator
             config: Optional configuration dictionary
+            result_cache: Optional cache of AI results for unchanged note bodies
         """
         self.tagger = tagger
         self.summarizer = summarizer
         self.enhancer = enhancer
         self.connection_coordinator = connection_coordinator
+        self.result_cache = result_cache
 
         # Default configuration
         self.config = {
@@ -907,10 +1107,25 @@ class NoteProcessingCoordinator:
         # Track if any AI processing errors occurred
         ai_processing_errors = []
 
+        # Reuse AI results for an unchanged body (tags, quality, connections)
+        cache_key = body_hash = None
+        cached: Dict = {}
+        fresh: Dict = {}
+        if self.result_cache is not None:
+            body_hash = NoteResultCache.body_hash(body)
+            cache_key = NoteResultCache.make_key(
+                body_hash, self._model_fingerprint(), self.config
+            )
+            cached = self.result_cache.get(cache_key) or {}
+
         # Auto-tag if enabled (use body content only)
         if self.config["auto_tag_inbox"]:
             try:
-                suggested_tags = self.tagger.generate_tags(body)
+                if "tags" in cached:
+                    suggested_tags = cached["tags"]
+                else:
+                    suggested_tags = self.tagger.generate_tags(body)
+                    fresh["tags"] = suggested_tags
                 existing_tags = sanitize_tags(frontmatter.get("tags", []))
                 suggested_tags = sanitize_tags(suggested_tags)
 
@@ -937,7 +1152,11 @@ class NoteProcessingCoordinator:
 
         # Analyze note quality and suggest improvements
         try:
-            enhancement = self.enhancer.enhance_note(body)
+            if "enhancement" in cached:
+                enhancement = cached["enhancement"]
+            else:
+                enhancement = self.enhancer.enhance_note(body)
+                fresh["enhancement"] = enhancement
             quality_score = enhancement.get("quality_score", 0)
 
             results["processing"]["quality"] = {
@@ -978,9 +1197,20 @@ class NoteProcessingCoordinator:
         suggested_links = []
         try:
             if corpus_dir:
-                connections = self.connection_coordinator.discover_connections(
-                    body, corpus_dir=corpus_dir
+                corpus_signature = (
+                    _corpus_signature(corpus_dir) if cache_key is not None else None
                 )
+                if (
+                    "connections" in cached
+                    and cached.get("corpus_signature") == corpus_signature
+                ):
+                    connections = cached["connections"]
+                else:
+                    connections = self.connection_coordinator.discover_connections(
+                        body, corpus_dir=corpus_dir
+                    )
+                    fresh["connections"] = connections
+                    fresh["corpus_signature"] = corpus_signature
 
                 if connections:
                     results["processing"]["connections"] = {
@@ -1006,6 +1236,18 @@ class NoteProcessingCoordinator:
         except Exception as e:
             results["processing"]["connections"] = {"error": str(e)}
 
+        if cache_key is not None:
+            results["result_cache"] = (
+                "hit" if cached and not fresh else "partial" if cached else "miss"
+            )
+            if fresh and self._llm_degraded():
+                # Components degrade to heuristics (keyword tags, basic
+                # quality analysis, text similarity) when Ollama is down;
+                # don't pin those results for the lifetime of the body.
+                fresh = {}
+            if fresh:
+                self.result_cache.put(cache_key, body_hash, {**cached, **fresh})
+
         # Update note with AI enhancements (skip when dry_run)
         needs_ai_update = any(
             key in results["processing"] for key in ["tags", "quality"]
@@ -1073,6 +1315,100 @@ class NoteProcessingCoordinator:
 
         return results
 
+    def _model_fingerprint(self) -> Dict[str, Optional[str]]:
+        """Model names behind each AI component, for result cache keys."""
+        fingerprint = {}
+        for name, component in (
+            ("tagger", self.tagger),
+            ("enhancer", self.enhancer),
+            ("connections", getattr(self.connection_coordinator, "connections", None)),
+        ):
+            model = getattr(getattr(component, "ollama_client", None), "model", None)
+            fingerprint[name] = model if isinstance(model, str) else None
+        return fingerprint
+
+    def _llm_degraded(self) -> bool:
+        """True if any AI component's Ollama client is unreachable."""
+        seen = set()
+        for component in (
+            self.tagger,
+            self.enhancer,
+            getattr(self.connection_coordinator, "connections", None),
+        ):
+            client = getattr(component, "ollama_client", None)
+            if client is None or id(client) in seen:
+                continue
+            seen.add(id(client))
+            if not self._llm_available(component):
+                return True
+        return False
+
+    @staticmethod
+    def _llm_available(component: Any) -> bool:
+        client = getattr(component, "ollama_client", None)
+        if client is None:
+            return True
+        try:
+            return bool(client.health_check())
+        except Exception:
+            return False
+
+    async def aprocess_notes(
+        self,
+        note_paths: List[str],
+        max_concurrency: int = 4,
+        async_client: Optional[AsyncOllamaClient] = None,
+        timeout: Optional[float] = None,
+        **process_kwargs,
+    ) -> List[Dict]:
+        """
+        Process several notes concurrently so their LLM prompts overlap.
+
+        Each note runs the regular process_note pipeline under the
+        AsyncOllamaClient scheduler, so at most ``max_concurrency`` notes
+        (and their tagger/enhancer/embedding requests) are in flight.
+
+        Args:
+            note_paths: Notes to process
+            max_concurrency: In-flight limit when no async_client is given
+            async_client: Optional shared AsyncOllamaClient scheduler
+            timeout: Optional HTTP timeout in seconds for each Ollama request a
+                note makes. A note is never abandoned mid-pipeline, so its
+                result always describes what was written.
+            **process_kwargs: Forwarded to process_note (dry_run, fast, corpus_dir)
+
+        Returns:
+            One result dict per note, in input order
+        """
+        owns_client = async_client is None
+        if owns_client:
+            async_client = AsyncOllamaClient(max_concurrency=max_concurrency)
+
+        def process(note_path: str) -> Dict:
+            with request_timeout(timeout):
+                return self.process_note(note_path, **process_kwargs)
+
+        async def run(note_path: str) -> Dict:
+            try:
+                return await async_client.submit(process, note_path)
+            except Exception as e:
+                logger.error(f"Concurrent processing failed for {note_path}: {e}")
+                return {"original_file": str(note_path), "error": str(e)}
+
+        try:
+            return list(await asyncio.gather(*(run(p) for p in note_paths)))
+        finally:
+            if owns_client:
+                async_client.close()
+
+    def process_notes(
+        self, note_paths: List[str], max_concurrency: int = 4, **kwargs
+    ) -> List[Dict]:
+        """Synchronous wrapper around aprocess_notes."""
+        return asyncio.run(
+            self.aprocess_notes(note_paths, max_concurrency=max_concurrency, **kwargs)
+        )
+
     def _fix_template_placeholders(self, frontmatter: Dict, note_file: Path) -> bool:
         """
         Fix template placeholders in frontmatter, particularly {{date:...}} patterns.
@@ -1309,6 +1645,8 @@ class NoteProcessingCoordinator:
 # workflow_reporting_coordinator — status reports and health assessment
 # ===========================================================================
 
+from src.utils.vault_index import VaultIndex
+
 
 class WorkflowReportingCoordinator:
     """
@@ -1328,16 +1666,22 @@ class WorkflowReportingCoordinator:
     - Independent of other coordinators
     """
 
-    def __init__(self, base_dir: Path, analytics):
+    def __init__(
+        self, base_dir: Path, analytics, vault_index: Optional[VaultIndex] = None
+    ):
         """
         Initialize WorkflowReportingCoordinator.
 
         Args:
             base_dir: Base directory of the Zettelkasten vault
             analytics: NoteAnalytics instance for collection analysis
+            vault_index: Optional shared VaultIndex (one read per note per run)
         """
         self.base_dir = Path(base_dir)
         self.analytics = analytics
+        self.vault_index = (
+            vault_index if vault_index is not None else VaultIndex(self.base_dir)
+        )
 
         # Define standard directories
         self.inbox_dir = self.base_dir / "Inbox"
@@ -1399,10 +1743,9 @@ class WorkflowReportingCoordinator:
             ("Permanent Notes", self.permanent_dir),
             ("Archive", self.archive_dir),
         ]:
-            if dir_path.exists():
-                directory_counts[dir_name] = len(list(dir_path.glob("*.md")))
-            else:
-                directory_counts[dir_name] = 0
+            directory_counts[dir_name] = len(
+                self.vault_index.notes(dir_path, recursive=False)
+            )
 
         return directory_counts
 
@@ -1445,12 +1788,11 @@ class WorkflowReportingCoordinator:
         }
 
         # Scan all notes for AI features
-        for md_file in self.base_dir.rglob("*.md"):
+        for record in self.vault_index.refresh():
+            if not record.readable:
+                continue
             try:
-                with open(md_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                frontmatter, _ = parse_frontmatter(content)
+                frontmatter = record.frontmatter
                 usage_stats["total_analyzed"] += 1
 
                 # Check for AI summary
@@ -1470,7 +1812,7 @@ class WorkflowReportingCoordinator:
                         usage_stats["notes_with_ai_tags"] += 1
 
             except Exception:
-                # Skip files that can't be read or parsed
+                # Skip notes with malformed frontmatter values
                 continue
 
         return usage_stats
@@ -1533,6 +1875,53 @@ class WorkflowReportingCoordinator:
 # batch_inbox_processor — idempotent batch processing with skip logic
 # ===========================================================================
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:  # pragma: no cover - Windows
+    HAS_FCNTL = False
+
+
+class NoteLockedError(RuntimeError):
+    """Raised when another worker or process is already processing a note."""
+
+
+_notes_in_progress: set = set()
+_notes_in_progress_lock = threading.Lock()
+
+# Cross-process locks are taken on a sidecar file, never on the note itself:
+# safe_write replaces the note (a new inode) every time it is processed.
+NOTE_LOCK_DIR = Path(".embedding_cache") / "note_locks"
+
+
+def _note_lock_path(note_path: Path, vault_root: Optional[Path] = None) -> Path:
+    resolved = Path(note_path).resolve()
+    digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()
+    root = Path(vault_root) if vault_root is not None else resolved.parent
+    return root / NOTE_LOCK_DIR / f"{digest}.lock"
+
+
+def _open_locked(lock_path: Path, note_name: str):
+    """Open and flock lock_path, retrying if its holder unlinks it meanwhile."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        handle = open(lock_path, "a")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            raise NoteLockedError(f"{note_name} is locked by another process")
+        try:
+            if os.fstat(handle.fileno()).st_ino == os.stat(lock_path).st_ino:
+                return handle
+        except FileNotFoundError:
+            pass
+        handle.close()
+
 
 def is_note_eligible_for_processing(note_path: Path) -> bool:
     """
@@ -1640,11 +2029,94 @@ def process_single_note(
     }
 
 
+@contextmanager
+def note_lock(note_path: Path, vault_root: Optional[Path] = None):
+    """
+    Hold an exclusive lock on a note while it is being processed.
+
+    Guards against two workers in this process and, where ``fcntl`` is
+    available, against another process (e.g. a second ``inneros inbox`` run)
+    picking up the same note. The flock is held on a per-note file under
+    ``<vault_root>/.embedding_cache/note_locks/`` (vault_root defaults to the
+    note's folder), which is removed again on release. Raises
+    NoteLockedError instead of blocking.
+    """
+    key = str(Path(note_path).resolve())
+    with _notes_in_progress_lock:
+        if key in _notes_in_progress:
+            raise NoteLockedError(f"{Path(note_path).name} is already being processed")
+        _notes_in_progress.add(key)
+    handle = None
+    try:
+        if HAS_FCNTL:
+            lock_path = _note_lock_path(note_path, vault_root)
+            handle = _open_locked(lock_path, Path(note_path).name)
+        yield
+    finally:
+        if handle is not None:
+            # Unlink while still holding the flock; _open_locked notices
+            lock_path.unlink(missing_ok=True)
+            handle.close()
+        with _notes_in_progress_lock:
+            _notes_in_progress.discard(key)
+
+
+def _process_locked_note(
+    note_path: Path, workflow_manager: Optional[Any], vault_root: Optional[Path]
+) -> Dict:
+    with note_lock(note_path, vault_root):
+        return process_single_note(note_path, workflow_manager)
+
+
+def _process_locked_note_timed(
+    note_path: Path, workflow_manager: Optional[Any], vault_root: Optional[Path]
+) -> Tuple[Optional[Dict], Optional[Exception], float]:
+    """(result, exception, seconds) so pool callers can report latency."""
+    started = time.perf_counter()
+    try:
+        result = _process_locked_note(note_path, workflow_manager, vault_root)
+    except Exception as e:
+        return None, e, time.perf_counter() - started
+    return result, None, time.perf_counter() - started
+
+
+def _outcome_error(proc_result: Optional[Dict], error: Optional[str]) -> Optional[str]:
+    """Error message of one note's outcome, None when it succeeded."""
+    if error is not None:
+        return error
+    if proc_result.get("success"):
+        return None
+    return proc_result.get("error") or "Processing returned failure"
+
+
+def _record_note_outcome(
+    result: Dict, note_path: Path, proc_result: Optional[Dict], error: Optional[str]
+):
+    """Fold one note's processing outcome into the batch result dict."""
+    if error is None and proc_result.get("success"):
+        result["processed"] += 1
+        rec = proc_result.get("triage_recommendation")
+        if rec:
+            by_rec = result["summary"]["by_recommendation"]
+            by_rec[rec] = by_rec.get(rec, 0) + 1
+        return
+    result["errors"] += 1
+    result["error_details"].append(
+        {
+            "note": note_path.name,
+            "path": str(note_path),
+            "error": error if error is not None else "Processing returned failure",
+        }
+    )
+
+
 def batch_process_unprocessed_inbox(
     inbox_dir: Path,
     dry_run: bool = False,
     workflow_manager: Optional[Any] = None,
     show_progress: bool = True,
+    workers: int = 1,
+    progress_bus: Optional[ProgressBus] = None,
 ) -> Dict:
     """
     Process all unprocessed notes in the inbox.
@@ -1654,6 +2126,13 @@ def batch_process_unprocessed_inbox(
         dry_run: If True, don't modify files - just report what would be done
         workflow_manager: Optional WorkflowManager instance
         show_progress: If True, print progress to stderr
+        workers: Number of notes to process concurrently. Values above 1 fan
+            notes out to a thread pool (processing is bound on Ollama I/O);
+            results are reported in inbox order, so the returned dict
+            matches a sequential run. Either way each note is locked while
+            in flight (see note_lock).
+        progress_bus: Bus for per-note progress events (default: the
+            process-wide bus); events are published in completion order
 
     Returns:
         Dict with processed, skipped, errors, error_details, summary, dry_run
@@ -1677,41 +2156,66 @@ def batch_process_unprocessed_inbox(
         return result
 
     total = len(eligible_notes)
-    for idx, note_path in enumerate(eligible_notes, 1):
+    reporter = ProgressReporter("process_inbox", total, progress_bus)
+    vault_root = inbox_dir.parent
+
+    def report(done: int, note_path: Path):
         if show_progress:
-            pct = int((idx / total) * 100) if total > 0 else 100
-            sys.stderr.write(f"\r[{idx}/{total}] {pct}% - {note_path.name[:40]}...")
+            pct = int((done / total) * 100) if total > 0 else 100
+            sys.stderr.write(f"\r[{done}/{total}] {pct}% - {note_path.name[:40]}...")
             sys.stderr.flush()
 
-        try:
-            proc_result = process_single_note(note_path, workflow_manager)
-
-            if proc_result.get("success"):
-                result["processed"] += 1
-                rec = proc_result.get("triage_recommendation")
-                if rec:
-                    by_rec = result["summary"]["by_recommendation"]
-                    by_rec[rec] = by_rec.get(rec, 0) + 1
-            else:
-                result["errors"] += 1
-                result["error_details"].append(
-                    {
-                        "note": note_path.name,
-                        "path": str(note_path),
-                        "error": "Processing returned failure",
-                    }
+    if workers > 1 and total > 1:
+        if workflow_manager is None:
+            # One manager (and one set of pooled Ollama clients) for all workers
+            workflow_manager = WorkflowManager(str(inbox_dir.parent))
+        outcomes: List[Optional[Tuple[Optional[Dict], Optional[str]]]] = [None] * total
+        with ThreadPoolExecutor(
+            max_workers=min(workers, total), thread_name_prefix="inbox"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _process_locked_note_timed, note_path, workflow_manager, vault_root
+                ): i
+                for i, note_path in enumerate(eligible_notes)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                report(done, eligible_notes[i])
+                proc_result, e, latency = future.result()
+                if e is None:
+                    outcomes[i] = (proc_result, None)
+                else:
+                    outcomes[i] = (None, str(e))
+                    if not isinstance(e, NoteLockedError):
+                        logger.error(
+                            f"Error processing {eligible_notes[i].name}",
+                            exc_info=e,
+                        )
+                reporter.note(
+                    eligible_notes[i].name,
+                    latency=latency,
+                    error=_outcome_error(*outcomes[i]),
                 )
-
-        except Exception as e:
-            result["errors"] += 1
-            result["error_details"].append(
-                {
-                    "note": note_path.name,
-                    "path": str(note_path),
-                    "error": str(e),
-                }
+        for note_path, (proc_result, error) in zip(eligible_notes, outcomes):
+            _record_note_outcome(result, note_path, proc_result, error)
+    else:
+        for idx, note_path in enumerate(eligible_notes, 1):
+            report(idx, note_path)
+            proc_result, e, latency = _process_locked_note_timed(
+                note_path, workflow_manager, vault_root
             )
-            logger.exception(f"Error processing {note_path.name}")
+            if e is None:
+                _record_note_outcome(result, note_path, proc_result, None)
+                error = _outcome_error(proc_result, None)
+            else:
+                _record_note_outcome(result, note_path, None, str(e))
+                if not isinstance(e, NoteLockedError):
+                    logger.error(f"Error processing {note_path.name}", exc_info=e)
+                error = str(e)
+            reporter.note(note_path.name, latency=latency, error=error)
+
+    reporter.finish()
 
     if show_progress and total > 0:
         sys.stderr.write("\r" + " " * 60 + "\r")
@@ -1776,7 +2280,9 @@ class WorkflowManager:
         self.summarizer = AISummarizer()
         self.connections = AIConnections()  # Legacy support
         self.enhancer = AIEnhancer()
-        self.analytics = NoteAnalytics(str(self.base_dir))
+        # One index shared by analytics/reporting: each note is read once
+        self.vault_index = VaultIndex.for_vault(self.base_dir)
+        self.analytics = NoteAnalytics(str(self.base_dir), vault_index=self.vault_index)
 
         # ADR-002 Phase 1: Lifecycle manager extraction
         self.lifecycle_manager = NoteLifecycleManager(base_dir=self.base_dir)
@@ -1787,7 +2293,9 @@ class WorkflowManager:
         )
 
         # ADR-002 Phase 3: Analytics coordinator extraction
-        self.analytics_coordinator = AnalyticsCoordinator(self.base_dir)
+        self.analytics_coordinator = AnalyticsCoordinator(
+            self.base_dir, vault_index=self.vault_index
+        )
 
         # ADR-002 Phase 4: Promotion engine extraction
         self.promotion_engine = PromotionEngine(
@@ -1808,6 +2316,7 @@ class WorkflowManager:
             enhancer=self.enhancer,
             connection_coordinator=self.connection_coordinator,
             config=None,  # Will use default config
+            result_cache=NoteResultCache.for_vault(self.base_dir),
         )
 
         # Initialize image safety components (GREEN phase)
@@ -1853,12 +2362,14 @@ class WorkflowManager:
 
         # ADR-002 Phase 9: Fleeting analysis coordinator extraction
         self.fleeting_analysis_coordinator = FleetingAnalysisCoordinator(
-            fleeting_dir=self.fleeting_dir
+            fleeting_dir=self.fleeting_dir, vault_index=self.vault_index
         )
 
         # ADR-002 Phase 10: Workflow reporting coordinator extraction
         self.reporting_coordinator = WorkflowReportingCoordinator(
-            base_dir=self.base_dir, analytics=self.analytics
+            base_dir=self.base_dir,
+            analytics=self.analytics,
+            vault_index=self.vault_index,
         )
 
         # ADR-002 Phase 11: Batch processing coordinator extraction
@@ -2414,9 +2925,12 @@ __all__ = [
     "IntegrityMonitoringManager",
     "ConcurrentSessionManager",
     "PerformanceMetricsCollector",
+    "NoteLockedError",
+    "NoteResultCache",
     # Functions
     "batch_process_unprocessed_inbox",
     "is_note_eligible_for_processing",
     "scan_eligible_notes",
     "process_single_note",
+    "note_lock",
 ]
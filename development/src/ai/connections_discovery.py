@@ -2,18 +2,135 @@
 connections_discovery — semantic connection finding for Zettelkasten notes.
 
 Consolidates connections.py + connection_coordinator.py (issue #120).
-Pure compute: no filesystem writes. Takes a note corpus, returns ranked
-similarity candidates. Filesystem mutations live in connections_insertion.py.
+Takes a note corpus, returns ranked similarity candidates. The only files
+written here are the persistent ANN index under ``.embedding_cache/``; note
+mutations live in connections_insertion.py.
 
-Import boundary: imports from llm_client only. Does NOT import from enrichment.
+Import boundary: imports from llm_client and src.utils (atomic writes) only.
+Does NOT import from enrichment.
 """
 
+import hashlib
+import heapq
+import json
+import logging
+import os
+import random
 import re
 import math
+import operator
+import threading
+from array import array
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Set, Tuple
 
-from .llm_client import OllamaClient, EmbeddingCache
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from src.utils.io import safe_write
+from .llm_client import EmbeddingCache, get_ollama_client
+
+logger = logging.getLogger(__name__)
+
+
+def _content_signature(content: str) -> Tuple[int, int]:
+    """Cheap identity for a note body (str hashes are cached by CPython)."""
+    return (len(content), hash(content))
+
+
+class EmbeddingMatrix:
+    """Pre-normalized corpus embeddings with a filename index.
+
+    Scoring a query is a single matrix-vector product followed by top-k
+    selection. Uses a float32 NumPy matrix when NumPy is installed and falls
+    back to normalized Python lists otherwise.
+    """
+
+    def __init__(
+        self,
+        filenames: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        signatures: Dict[str, Tuple[int, int]],
+    ):
+        self.filenames: List[str] = list(filenames)
+        self.index: Dict[str, int] = {f: i for i, f in enumerate(self.filenames)}
+        self.signatures = signatures
+        self.dimension = len(vectors[0]) if vectors else 0
+        if HAS_NUMPY:
+            matrix = np.asarray(vectors, dtype=np.float32).reshape(
+                len(self.filenames), self.dimension
+            )
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._matrix = matrix / norms
+        else:
+            self._matrix = [self._normalize(v) for v in vectors]
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> List[float]:
+        mag = math.sqrt(sum(a * a for a in vector))
+        if mag == 0:
+            return [0.0] * len(vector)
+        return [a / mag for a in vector]
+
+    def covers(self, note_corpus: Dict[str, str]) -> bool:
+        """True if every note in note_corpus is indexed with identical content."""
+        signatures = self.signatures
+        return all(
+            signatures.get(f) == _content_signature(c) for f, c in note_corpus.items()
+        )
+
+    def top_k(
+        self,
+        query: Sequence[float],
+        k: int,
+        threshold: float = 0.0,
+        allowed: Optional[Set[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return up to k (filename, score) pairs with score >= threshold.
+
+        Scores are cosine similarities clamped to [0, 1]. Ties keep corpus
+        order. ``allowed`` restricts results to a subset of indexed filenames.
+        """
+        if not self.filenames or k <= 0 or len(query) != self.dimension:
+            return []
+        if HAS_NUMPY:
+            return self._top_k_numpy(query, k, threshold, allowed)
+        q = self._normalize(query)
+        scored = []
+        for i, row in enumerate(self._matrix):
+            name = self.filenames[i]
+            if allowed is not None and name not in allowed:
+                continue
+            score = max(0.0, min(1.0, sum(a * b for a, b in zip(row, q))))
+            if score >= threshold:
+                scored.append((score, -i, name))
+        best = heapq.nlargest(k, scored)
+        return [(name, score) for score, _, name in best]
+
+    def _top_k_numpy(self, query, k, threshold, allowed):
+        q = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        if norm == 0:
+            return []
+        scores = np.clip(self._matrix @ (q / norm), 0.0, 1.0)
+        if allowed is not None:
+            mask = np.zeros(len(self.filenames), dtype=bool)
+            mask[[self.index[f] for f in allowed if f in self.index]] = True
+            scores = np.where(mask, scores, -1.0)
+        candidates = np.flatnonzero(scores >= threshold)
+        if candidates.size > k:
+            part = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[part]
+        order = np.lexsort((candidates, -scores[candidates]))
+        return [(self.filenames[i], float(scores[i])) for i in candidates[order]]
 
 
 class AIConnections:
@@ -26,16 +143,23 @@ class AIConnections:
         config: Optional[Dict[str, Any]] = None,
         use_cache: bool = True,
     ):
-        self.ollama_client = OllamaClient(config=config)
+        self.ollama_client = get_ollama_client(config)
         self.similarity_threshold = similarity_threshold
         self.max_suggestions = max_suggestions
         self.use_cache = use_cache
         self.embedding_cache = EmbeddingCache() if use_cache else None
+        self._embedding_matrix: Optional[EmbeddingMatrix] = None
+        # Concurrent callers wait for one rebuild instead of racing their own
+        self._matrix_lock = threading.Lock()
 
     def find_similar_notes(
         self, target_note: str, note_corpus: Dict[str, str]
     ) -> List[Tuple[str, float]]:
-        """Return (filename, score) pairs above threshold, sorted descending."""
+        """Return (filename, score) pairs above threshold, sorted descending.
+
+        Scores against a cached corpus embedding matrix when every embedding
+        is available; falls back to per-note scoring otherwise.
+        """
         if not note_corpus:
             return []
 
@@ -43,6 +167,22 @@ class AIConnections:
         if not target_content.strip():
             return []
 
+        matrix = self._get_embedding_matrix(note_corpus)
+        if matrix is not None:
+            try:
+                query = self._generate_ollama_embedding(target_content)
+            except Exception:
+                query = None
+            if query:
+                allowed = (
+                    None
+                    if len(note_corpus) == len(matrix.signatures)
+                    else set(note_corpus)
+                )
+                return matrix.top_k(
+                    query, self.max_suggestions, self.similarity_threshold, allowed
+                )
+
         similarities = []
         for filename, content in note_corpus.items():
             note_content = self._extract_content(content)
@@ -77,6 +217,8 @@ class AIConnections:
         self, note_corpus: Dict[str, str]
     ) -> Dict[str, List[Tuple[str, float]]]:
         """Return full pairwise connection map for all notes in corpus."""
+        # Build the matrix once; each per-note query below reuses it as a subset.
+        self._get_embedding_matrix(note_corpus)
         return {
             filename: self.find_similar_notes(
                 content,
@@ -85,6 +227,51 @@ class AIConnections:
             for filename, content in note_corpus.items()
         }
 
+    def build_embedding_matrix(
+        self, note_corpus: Dict[str, str]
+    ) -> Optional[EmbeddingMatrix]:
+        """Embed every non-empty note in corpus into a fresh EmbeddingMatrix.
+
+        Returns None if any embedding cannot be generated (e.g. Ollama down).
+        """
+        filenames: List[str] = []
+        texts: List[str] = []
+        signatures: Dict[str, Tuple[int, int]] = {}
+        for filename, content in note_corpus.items():
+            signatures[filename] = _content_signature(content)
+            note_content = self._extract_content(content)
+            if not note_content.strip():
+                continue
+            filenames.append(filename)
+            texts.append(note_content)
+        try:
+            vectors = self._generate_ollama_embeddings(texts) if texts else []
+        except Exception:
+            return None
+        if any(not v or len(v) != len(vectors[0]) for v in vectors):
+            return None
+        return EmbeddingMatrix(filenames, vectors, signatures)
+
+    def _get_embedding_matrix(
+        self, note_corpus: Dict[str, str]
+    ) -> Optional[EmbeddingMatrix]:
+        """Return the cached matrix if it covers note_corpus, else rebuild it."""
+        cached = self._embedding_matrix
+        if cached is not None and cached.covers(note_corpus):
+            return cached
+        with self._matrix_lock:
+            cached = self._embedding_matrix
+            if cached is not None and cached.covers(note_corpus):
+                return cached
+            matrix = self.build_embedding_matrix(note_corpus)
+            if matrix is not None:
+                self._embedding_matrix = matrix
+            return matrix
+
+    def clear_embedding_matrix(self):
+        """Drop the cached corpus embedding matrix."""
+        self._embedding_matrix = None
+
     def _extract_content(self, note_content: str) -> str:
         content = re.sub(r"^---\s*\n.*?\n---\s*\n", "", note_content, flags=re.DOTALL)
         content = re.sub(r"\[\[([^\]|]+)\|([^\]]+)\]\]", r"\2", content)
@@ -120,6 +307,20 @@ class AIConnections:
         except Exception as e:
             raise Exception(f"Failed to generate embedding: {e}")
 
+    def _generate_ollama_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Batch embedding: cache hits locally, misses via ``/api/embed``."""
+        if self.embedding_cache:
+            try:
+                return self.embedding_cache.get_or_generate_embeddings(texts)
+            except Exception as e:
+                raise Exception(f"Failed to generate embedding: {e}")
+        if not self.ollama_client.health_check():
+            raise Exception("Ollama service is not available")
+        try:
+            return self.ollama_client.generate_embeddings(texts)
+        except Exception as e:
+            raise Exception(f"Failed to generate embedding: {e}")
+
     def _simple_text_similarity(self, text1: str, text2: str) -> float:
         w1 = set(self._normalize_text(text1).split())
         w2 = set(self._normalize_text(text2).split())
@@ -138,11 +339,315 @@ class AIConnections:
         return dot / (mag1 * mag2)
 
 
+class NoteEmbeddingIndex:
+    """Persistent approximate-nearest-neighbour index of note embeddings.
+
+    Random-projection LSH: each of ``num_tables`` tables hashes a normalized
+    vector to ``num_bits`` sign bits. A query probes its bucket and all 1-bit
+    neighbours in every table, then reranks the candidates by exact cosine.
+    Indexes smaller than ``exhaustive_below`` are scanned exhaustively.
+
+    Entries are keyed by note path and carry the content hash plus
+    (mtime_ns, size) so callers can insert, update and delete incrementally.
+    All methods are thread-safe. On disk: ``index.json`` metadata plus raw float32 ``vectors.f32`` and
+    ``planes.f32`` files.
+    """
+
+    META_FILE = "index.json"
+    VECTOR_FILE = "vectors.f32"
+    PLANES_FILE = "planes.f32"
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        index_dir: Optional[Path] = None,
+        num_tables: int = 8,
+        num_bits: int = 12,
+        seed: int = 1729,
+        exhaustive_below: int = 512,
+    ):
+        self.index_dir = Path(index_dir) if index_dir is not None else None
+        self.num_tables = num_tables
+        self.num_bits = num_bits
+        self.seed = seed
+        self.exhaustive_below = exhaustive_below
+        self.dimension = 0
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._vectors: Dict[str, array] = {}
+        self._planes: List[List[array]] = []
+        self._buckets: List[Dict[int, Set[str]]] = [{} for _ in range(num_tables)]
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self.entries)
+
+    # -- bookkeeping -------------------------------------------------------
+
+    def is_current(self, key: str, mtime_ns: int, size: int) -> bool:
+        """True if key is indexed with matching file stat."""
+        with self._lock:
+            entry = self.entries.get(key)
+        return (
+            entry is not None
+            and entry["mtime_ns"] == mtime_ns
+            and entry["size"] == size
+        )
+
+    def content_hash(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self.entries.get(key)
+        return entry["hash"] if entry else None
+
+    def touch(self, key: str, mtime_ns: int, size: int):
+        """Record a new file stat for an entry whose content is unchanged."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry["mtime_ns"] = mtime_ns
+                entry["size"] = size
+                self._dirty = True
+
+    def upsert(
+        self,
+        key: str,
+        vector: Optional[Sequence[float]],
+        content_hash: str,
+        mtime_ns: int = 0,
+        size: int = 0,
+    ):
+        """Insert or replace an entry. vector=None records an unembeddable note.
+
+        Raises ValueError if vector's dimension differs from the index's.
+        """
+        with self._lock:
+            self.remove(key)
+            entry: Dict[str, Any] = {
+                "hash": content_hash,
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "signature": None,
+            }
+            if vector:
+                if self.dimension and len(vector) != self.dimension:
+                    raise ValueError(
+                        f"Embedding dimension {len(vector)} does not match the "
+                        f"index ({self.dimension}); clear() it first"
+                    )
+                if not self.dimension:
+                    self._init_planes(len(vector))
+                normalized = self._normalize(vector)
+                signature = self._signature(normalized)
+                entry["signature"] = signature
+                self._vectors[key] = normalized
+                self._add_to_buckets(key, signature)
+            self.entries[key] = entry
+            self._dirty = True
+
+    def remove(self, key: str):
+        with self._lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return
+            self._vectors.pop(key, None)
+            if entry["signature"] is not None:
+                for table, sig in zip(self._buckets, entry["signature"]):
+                    bucket = table.get(sig)
+                    if bucket is not None:
+                        bucket.discard(key)
+                        if not bucket:
+                            del table[sig]
+            self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self.dimension = 0
+            self.entries.clear()
+            self._vectors.clear()
+            self._planes = []
+            self._buckets = [{} for _ in range(self.num_tables)]
+            self._dirty = True
+
+    # -- querying ----------------------------------------------------------
+
+    def query(
+        self, vector: Sequence[float], k: int, threshold: float = 0.0
+    ) -> List[Tuple[str, float]]:
+        """Return up to k (key, score) pairs with clamped cosine >= threshold."""
+        with self._lock:
+            if not self._vectors or k <= 0 or len(vector) != self.dimension:
+                return []
+            q = self._normalize(vector)
+            if len(self._vectors) <= self.exhaustive_below:
+                candidates: Iterable[str] = self._vectors
+            else:
+                candidates = self._candidates(self._signature(q))
+            scored = []
+            for key in candidates:
+                score = max(0.0, min(1.0, _dot(self._vectors[key], q)))
+                if score >= threshold:
+                    scored.append((score, key))
+            best = heapq.nlargest(k, scored, key=lambda item: item[0])
+            return [(key, score) for score, key in best]
+
+    def _candidates(self, signature: List[int]) -> Set[str]:
+        found: Set[str] = set()
+        for table, sig in zip(self._buckets, signature):
+            found.update(table.get(sig, ()))
+            for bit in range(self.num_bits):
+                found.update(table.get(sig ^ (1 << bit), ()))
+        return found
+
+    # -- hashing -----------------------------------------------------------
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> array:
+        mag = math.sqrt(sum(a * a for a in vector))
+        if mag == 0:
+            return array("f", bytes(4 * len(vector)))
+        return array("f", (a / mag for a in vector))
+
+    def _init_planes(self, dimension: int):
+        rng = random.Random(self.seed)
+        self.dimension = dimension
+        self._planes = [
+            [
+                array("f", (rng.gauss(0.0, 1.0) for _ in range(dimension)))
+                for _ in range(self.num_bits)
+            ]
+            for _ in range(self.num_tables)
+        ]
+
+    def _signature(self, vector: array) -> List[int]:
+        signature = []
+        for planes in self._planes:
+            bits = 0
+            for bit, plane in enumerate(planes):
+                if _dot(plane, vector) >= 0:
+                    bits |= 1 << bit
+            signature.append(bits)
+        return signature
+
+    def _add_to_buckets(self, key: str, signature: List[int]):
+        for table, sig in zip(self._buckets, signature):
+            table.setdefault(sig, set()).add(key)
+
+    # -- persistence -------------------------------------------------------
+
+    @classmethod
+    def load(cls, index_dir: Path, **kwargs) -> "NoteEmbeddingIndex":
+        """Load an index from index_dir, or return an empty one."""
+        index = cls(index_dir, **kwargs)
+        meta_file = Path(index_dir) / cls.META_FILE
+        if not meta_file.exists():
+            return index
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            if meta.get("version") != cls.FORMAT_VERSION or (
+                meta["num_tables"],
+                meta["num_bits"],
+            ) != (index.num_tables, index.num_bits):
+                logger.info(f"Discarding incompatible connection index: {index_dir}")
+                return index
+            dimension = meta["dimension"]
+            vectors = array("f")
+            vectors.frombytes((Path(index_dir) / cls.VECTOR_FILE).read_bytes())
+            planes = array("f")
+            if dimension:
+                planes.frombytes((Path(index_dir) / cls.PLANES_FILE).read_bytes())
+            if len(planes) != dimension * index.num_tables * index.num_bits:
+                raise ValueError("planes file does not match metadata")
+            index.dimension = dimension
+            index._planes = [
+                [
+                    planes[start : start + dimension]
+                    for start in range(
+                        (t * index.num_bits) * dimension,
+                        ((t + 1) * index.num_bits) * dimension,
+                        dimension,
+                    )
+                ]
+                for t in range(index.num_tables)
+            ]
+            for key, entry in meta["entries"].items():
+                row = entry.pop("row", None)
+                if row is not None:
+                    start = row * dimension
+                    vector = vectors[start : start + dimension]
+                    if len(vector) != dimension:
+                        raise ValueError("vectors file is truncated")
+                    index._vectors[key] = vector
+                    index._add_to_buckets(key, entry["signature"])
+                index.entries[key] = entry
+        except Exception as e:
+            logger.warning(f"Could not load connection index {index_dir}: {e}")
+            return cls(index_dir, **kwargs)
+        return index
+
+    def save(self):
+        """Persist the index if it changed since the last load/save."""
+        with self._lock:
+            if not self._dirty or self.index_dir is None:
+                return
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            vectors = array("f")
+            entries: Dict[str, Dict[str, Any]] = {}
+            for row, (key, vector) in enumerate(self._vectors.items()):
+                vectors.extend(vector)
+                entries[key] = dict(self.entries[key], row=row)
+            for key, entry in self.entries.items():
+                entries.setdefault(key, dict(entry, row=None))
+            planes = array("f")
+            for table in self._planes:
+                for plane in table:
+                    planes.extend(plane)
+            _atomic_write_bytes(self.index_dir / self.VECTOR_FILE, vectors.tobytes())
+            _atomic_write_bytes(self.index_dir / self.PLANES_FILE, planes.tobytes())
+            safe_write(
+                self.index_dir / self.META_FILE,
+                json.dumps(
+                    {
+                        "version": self.FORMAT_VERSION,
+                        "dimension": self.dimension,
+                        "num_tables": self.num_tables,
+                        "num_bits": self.num_bits,
+                        "entries": entries,
+                    }
+                ),
+            )
+            self._dirty = False
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(map(operator.mul, a, b))
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 class ConnectionCoordinator:
     """Coordinates connection discovery across a note corpus directory."""
 
     def __init__(
-        self, base_directory: str, min_similarity: float = 0.7, max_suggestions: int = 5
+        self,
+        base_directory: str,
+        min_similarity: float = 0.7,
+        max_suggestions: int = 5,
+        use_index: bool = True,
+        index_dir: Optional[Path] = None,
     ):
         self.base_directory = base_directory
         self.base_dir = Path(base_directory)
@@ -151,6 +656,17 @@ class ConnectionCoordinator:
         self.connections = AIConnections(
             similarity_threshold=min_similarity, max_suggestions=max_suggestions
         )
+        self.use_index = use_index
+        self.index_dir = (
+            Path(index_dir)
+            if index_dir is not None
+            else self.base_dir / ".embedding_cache" / "connection_index"
+        )
+        self._indexes: Dict[str, NoteEmbeddingIndex] = {}
+        # Inbox workers share one coordinator: one thread syncs an index at a
+        # time; queries only take the index's own lock
+        self._index_lock = threading.RLock()
+        self._stats_lock = threading.Lock()
         self._corpus_cache: Dict[str, Dict[str, str]] = {}
         self._total_discoveries = 0
         self._total_similarity_sum = 0.0
@@ -176,20 +692,142 @@ class ConnectionCoordinator:
             return []
         if corpus_dir is None:
             corpus_dir = self.base_dir / "Permanent Notes"
+        if self.use_index and corpus_dir.exists():
+            index = self.sync_index(corpus_dir)
+            similar = (
+                self._query_index(index, target_content) if index is not None else None
+            )
+            if similar is not None:
+                return self._record_results(similar)
         corpus = self.load_corpus(corpus_dir)
         if not corpus:
             return []
         try:
             similar = self.connections.find_similar_notes(target_content, corpus)
-            results = []
-            for filename, similarity in similar:
-                results.append({"filename": filename, "similarity": similarity})
-                self._total_discoveries += 1
-                self._total_similarity_sum += similarity
-            return results
+            return self._record_results(similar)
         except Exception:
             return []
 
+    def get_index(self, corpus_dir: Path) -> NoteEmbeddingIndex:
+        """Return the (lazily loaded) ANN index for corpus_dir."""
+        key = str(corpus_dir)
+        with self._index_lock:
+            if key not in self._indexes:
+                try:
+                    rel = (
+                        Path(corpus_dir).resolve().relative_to(self.base_dir.resolve())
+                    )
+                    name = str(rel) if str(rel) != "." else "root"
+                except ValueError:
+                    name = hashlib.sha256(key.encode()).hexdigest()[:16]
+                slug = re.sub(r"[^\w.-]+", "_", name)
+                self._indexes[key] = NoteEmbeddingIndex.load(self.index_dir / slug)
+            return self._indexes[key]
+
+    def sync_index(self, corpus_dir: Path) -> Optional[NoteEmbeddingIndex]:
+        """Bring the ANN index in line with corpus_dir and persist it.
+
+        Unchanged files are skipped by (mtime_ns, size); touched files with
+        the same content hash are not re-embedded; deleted files are removed.
+        Returns None if a needed embedding cannot be generated. Concurrent
+        callers are serialized, so each change is embedded once.
+        """
+        with self._index_lock:
+            return self._sync_index(corpus_dir)
+
+    def _sync_index(
+        self, corpus_dir: Path, rebuilding: bool = False
+    ) -> Optional[NoteEmbeddingIndex]:
+        index = self.get_index(corpus_dir)
+        seen: Set[str] = set()
+        pending: List[Tuple[str, str, os.stat_result, str]] = []
+        for md_file in corpus_dir.glob("*.md"):
+            try:
+                stat = md_file.stat()
+            except OSError:
+                continue
+            name = md_file.name
+            seen.add(name)
+            if index.is_current(name, stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                content = md_file.read_text(encoding="utf-8")
+            except Exception:
+                index.remove(name)
+                continue
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            if index.content_hash(name) == digest:
+                index.touch(name, stat.st_mtime_ns, stat.st_size)
+                continue
+            note_content = self.connections._extract_content(content)
+            if note_content.strip():
+                pending.append((name, digest, stat, note_content))
+            else:
+                index.upsert(name, None, digest, stat.st_mtime_ns, stat.st_size)
+
+        complete = True
+        batch_size = self.connections.ollama_client.embed_batch_size
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            try:
+                vectors = self.connections._generate_ollama_embeddings(
+                    [note_content for _, _, _, note_content in chunk]
+                )
+            except Exception as e:
+                logger.debug(f"Connection index sync stopped: {e}")
+                complete = False
+                break
+            dimensions = {len(vector) for vector in vectors if vector}
+            if len(dimensions) > 1:
+                logger.debug("Connection index sync stopped: mixed dimensions")
+                complete = False
+                break
+            if index.dimension and dimensions and dimensions != {index.dimension}:
+                if rebuilding:
+                    complete = False
+                    break
+                # A new embedding model invalidates every stored vector, so
+                # re-embed the whole corpus instead of dropping it piecemeal
+                logger.info(
+                    f"Embedding dimension changed ({index.dimension} -> "
+                    f"{dimensions.pop()}); rebuilding connection index"
+                )
+                index.clear()
+                return self._sync_index(corpus_dir, rebuilding=True)
+            for (name, digest, stat, _), vector in zip(chunk, vectors):
+                index.upsert(name, vector, digest, stat.st_mtime_ns, stat.st_size)
+
+        if complete:
+            for name in set(index.keys()) - seen:
+                index.remove(name)
+        try:
+            index.save()
+        except OSError as e:
+            logger.warning(f"Could not save connection index: {e}")
+        return index if complete else None
+
+    def _query_index(
+        self, index: NoteEmbeddingIndex, target_content: str
+    ) -> Optional[List[Tuple[str, float]]]:
+        content = self.connections._extract_content(target_content)
+        if not content.strip():
+            return []
+        try:
+            vector = self.connections._generate_ollama_embedding(content)
+        except Exception:
+            return None
+        return index.query(vector, self.max_suggestions, self.min_similarity)
+
+    def _record_results(self, similar: List[Tuple[str, float]]) -> List[Dict]:
+        results = [
+            {"filename": filename, "similarity": similarity}
+            for filename, similarity in similar
+        ]
+        with self._stats_lock:
+            self._total_discoveries += len(results)
+            self._total_similarity_sum += sum(s for _, s in similar)
+        return results
+
     def validate_connections(self, connections: List[Dict]) -> List[Dict]:
         """Deduplicate by filename, keep highest similarity, filter below threshold."""
         if not connections:
@@ -220,5 +858,8 @@ class ConnectionCoordinator:
         return {"total_discoveries": self._total_discoveries, "average_similarity": avg}
 
     def clear_cache(self):
-        """Clear the loaded corpus cache."""
-        self._corpus_cache.clear()
+        """Clear the loaded corpus cache, in-memory indexes and embedding matrix."""
+        with self._index_lock:
+            self._corpus_cache.clear()
+            self._indexes.clear()
+            self.connections.clear_embedding_matrix()
@@ -8,7 +8,7 @@ Consolidates five former modules:
   - ai_enhancement_manager → AIEnhancementManager
   - metadata_repair_engine → MetadataRepairEngine
 
-Import boundary: imports from llm_client (OllamaClient) and src.utils only.
+Import boundary: imports from llm_client (get_ollama_client) and src.utils only.
 Does NOT import from any other src.ai module.
 """
 
@@ -19,10 +19,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from .llm_client import AIEnhancementResult, ConfigDict, OllamaClient
+from .llm_client import AIEnhancementResult, ConfigDict, get_ollama_client
 from src.utils.bug_reporter import BugReporter
 from src.utils.tags import sanitize_tags
 
+# Bump whenever the tagger/enhancer prompts or parsing change; cached
+# per-note results (NoteResultCache) keyed on an older version are ignored.
+PROMPT_VERSION = 1
 
 # ---------------------------------------------------------------------------
 # AITagger
@@ -35,7 +38,7 @@ class AITagger:
     def __init__(
         self, min_confidence: float = 0.7, config: Optional[Dict[str, Any]] = None
     ):
-        self.ollama_client = OllamaClient(config=config)
+        self.ollama_client = get_ollama_client(config)
         self.min_confidence = min_confidence
 
     def generate_tags(
@@ -140,7 +143,7 @@ class AISummarizer:
         max_summary_ratio: float = 0.3,
         config: Optional[Dict[str, Any]] = None,
     ):
-        self.ollama_client = OllamaClient(config=config)
+        self.ollama_client = get_ollama_client(config)
         self.min_length = min_length
         self.max_summary_ratio = max_summary_ratio
 
@@ -244,7 +247,7 @@ class AIEnhancer:
     def __init__(
         self, model_name: str = "gemma4:latest", min_quality_score: float = 0.6
     ):
-        self.ollama_client = OllamaClient(config={"model": model_name})
+        self.ollama_client = get_ollama_client({"model": model_name})
         self.min_quality_score = min_quality_score
 
     def analyze_note_quality(self, content: str) -> Dict[str, Any]:
@@ -1327,6 +1327,7 @@ class PromotionEngine:
 # ---------------------------------------------------------------------------
 
 from src.utils.frontmatter import parse_frontmatter as _parse_frontmatter
+from src.utils.vault_index import VaultIndex
 from dataclasses import dataclass as _dc, field
 
 
@@ -1356,12 +1357,14 @@ class FleetingAnalysisCoordinator:
     Handles age categorization, statistics aggregation, and health report generation.
     """
 
-    def __init__(self, fleeting_dir: Path):
+    def __init__(self, fleeting_dir: Path, vault_index: Optional[VaultIndex] = None):
         """
         Initialize FleetingAnalysisCoordinator.
 
         Args:
             fleeting_dir: Path to fleeting notes directory
+            vault_index: Optional shared (persistent) VaultIndex; notes are
+                only re-read when they changed since the last sweep
 
         Raises:
             TypeError: If fleeting_dir is None
@@ -1374,6 +1377,9 @@ class FleetingAnalysisCoordinator:
             fleeting_dir = Path(fleeting_dir)
 
         self.fleeting_dir = fleeting_dir
+        self.vault_index = (
+            vault_index if vault_index is not None else VaultIndex(fleeting_dir)
+        )
 
     def analyze_fleeting_notes(self) -> FleetingAnalysis:
         """
@@ -1391,11 +1397,13 @@ class FleetingAnalysisCoordinator:
 
         current_date = datetime.now()
 
-        for note_path in self.fleeting_dir.glob("*.md"):
+        for record in self.vault_index.notes(self.fleeting_dir, recursive=False):
+            note_path = record.path
             try:
+                if not record.readable:
+                    continue
                 # Get note age from metadata or file stats
-                content = note_path.read_text(encoding="utf-8")
-                frontmatter, _ = _parse_frontmatter(content)
+                frontmatter = record.frontmatter
 
                 # Try to get created date from frontmatter
                 created_str = frontmatter.get("created", "")
@@ -1410,12 +1418,10 @@ class FleetingAnalysisCoordinator:
                             created_date = datetime.strptime(created_str, "%Y-%m-%d")
                         except ValueError:
                             # Fall back to file modification time
-                            created_date = datetime.fromtimestamp(
-                                note_path.stat().st_mtime
-                            )
+                            created_date = datetime.fromtimestamp(record.mtime)
                 else:
                     # Use file modification time as fallback
-                    created_date = datetime.fromtimestamp(note_path.stat().st_mtime)
+                    created_date = datetime.fromtimestamp(record.mtime)
 
                 # Calculate age in days
                 age_delta = current_date - created_date
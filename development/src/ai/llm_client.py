@@ -2,7 +2,7 @@
 llm_client — base LLM I/O layer for InnerOS.
 
 Consolidates three former modules:
-  - ollama_client.py  → OllamaClient
+  - ollama_client.py  → OllamaClient (+ AsyncOllamaClient)
   - embedding_cache.py → EmbeddingCache
   - types.py          → shared type aliases
 
@@ -10,11 +10,35 @@ Nothing in this module imports from any other src.ai module.
 All other modules that need LLM access import from here.
 """
 
+import asyncio
+import functools
 import hashlib
 import json
-import requests
+import logging
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:  # pragma: no cover - Windows
+    HAS_FCNTL = False
+
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -37,13 +61,103 @@ PromotionCandidate = Dict[str, Any]
 ReviewCandidate = List[Dict[str, Any]]
 
 
+# ---------------------------------------------------------------------------
+# Pooled HTTP sessions + shared client registry
+# ---------------------------------------------------------------------------
+
+DEFAULT_POOL_MAXSIZE = 10
+
+_registry_lock = threading.Lock()
+_sessions: Dict[str, requests.Session] = {}
+_session_pool_sizes: Dict[str, int] = {}
+_clients: Dict[Tuple, "OllamaClient"] = {}
+
+
+def get_http_session(
+    base_url: str, pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+) -> requests.Session:
+    """Return the process-wide keep-alive session for base_url.
+
+    The session's connection pool holds at least ``pool_maxsize`` connections;
+    asking for a larger pool later remounts the adapter with the new size.
+    urllib3 pools are thread-safe, so one session serves concurrent callers.
+    """
+    with _registry_lock:
+        session = _sessions.get(base_url)
+        if session is None:
+            session = requests.Session()
+            _sessions[base_url] = session
+            _session_pool_sizes[base_url] = 0
+        if pool_maxsize > _session_pool_sizes[base_url]:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=pool_maxsize
+            )
+            session.mount(base_url, adapter)
+            _session_pool_sizes[base_url] = pool_maxsize
+        return session
+
+
+def get_ollama_client(config: Optional[ConfigDict] = None) -> "OllamaClient":
+    """Return a shared OllamaClient for config, creating it on first use.
+
+    Components built from the same config (tagger, summarizer, enhancer,
+    connections) share one client, its session and its health-check cache.
+    """
+    key = tuple(sorted((k, repr(v)) for k, v in (config or {}).items()))
+    with _registry_lock:
+        client = _clients.get(key)
+    if client is None:
+        client = OllamaClient(config=config)
+        with _registry_lock:
+            client = _clients.setdefault(key, client)
+    return client
+
+
+_request_timeout = threading.local()
+
+
+@contextmanager
+def request_timeout(seconds: Optional[float]):
+    """Bound each generation/embedding request made by this thread.
+
+    Overrides the clients' ``timeout`` (None keeps it) for every Ollama call
+    the current thread makes inside the block, e.g. a whole note pipeline.
+    """
+    previous = current_request_timeout()
+    _request_timeout.value = seconds
+    try:
+        yield
+    finally:
+        _request_timeout.value = previous
+
+
+def current_request_timeout() -> Optional[float]:
+    """The request_timeout() override active in this thread, if any."""
+    return getattr(_request_timeout, "value", None)
+
+
+def close_http_sessions():
+    """Close pooled sessions and forget shared clients (tests, shutdown)."""
+    with _registry_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _session_pool_sizes.clear()
+        _clients.clear()
+
+
 # ---------------------------------------------------------------------------
 # OllamaClient
 # ---------------------------------------------------------------------------
 
 
 class OllamaClient:
-    """Client for interacting with the Ollama local AI service."""
+    """Client for interacting with the Ollama local AI service.
+
+    Requests go through the pooled keep-alive session for ``base_url``
+    (``pool_maxsize`` config key). Prefer ``get_ollama_client`` to share one
+    client per config across components.
+    """
 
     def __init__(self, config: Optional[ConfigDict] = None):
         if config is None:
@@ -51,17 +165,38 @@ class OllamaClient:
         self.base_url = config.get("base_url", "http://localhost:11434")
         self.timeout = config.get("timeout", 30)
         self.model = config.get("model", "gemma4:latest")
-
-    def health_check(self) -> bool:
+        self.embed_batch_size = max(1, int(config.get("embed_batch_size", 32)))
+        self.health_check_ttl = config.get("health_check_ttl", 30.0)
+        self._health: Optional[Tuple[float, bool]] = None
+        self.session = get_http_session(
+            self.base_url, config.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)
+        )
+
+    def health_check(self, use_cache: bool = True) -> bool:
+        """Return True if Ollama answers /api/tags.
+
+        The result is reused for ``health_check_ttl`` seconds so callers that
+        check before every request don't double the round-trips.
+        """
+        if use_cache and self._health is not None:
+            checked_at, healthy = self._health
+            if time.monotonic() - checked_at < self.health_check_ttl:
+                return healthy
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=self.timeout)
-            return response.status_code == 200
+            response = self.session.get(
+                f"{self.base_url}/api/tags", timeout=self.timeout
+            )
+            healthy = response.status_code == 200
         except (requests.ConnectionError, requests.Timeout):
-            return False
+            healthy = False
+        self._health = (time.monotonic(), healthy)
+        return healthy
 
     def is_model_available(self, model_name: str) -> bool:
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=self.timeout)
+            response = self.session.get(
+                f"{self.base_url}/api/tags", timeout=self.timeout
+            )
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 return any(m.get("name") == model_name for m in models)
@@ -69,8 +204,18 @@ class OllamaClient:
         except (requests.ConnectionError, requests.Timeout):
             return False
 
+    def _request_timeout(self, timeout: Optional[float] = None) -> float:
+        if timeout is not None:
+            return timeout
+        override = current_request_timeout()
+        return override if override is not None else self.timeout
+
     def generate_completion(
-        self, prompt: str, system_prompt: str = "", max_tokens: int = -1
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        max_tokens: int = -1,
+        timeout: Optional[float] = None,
     ) -> str:
         """Generate text via Ollama. max_tokens=-1 omits num_predict (required for thinking models)."""
         try:
@@ -85,8 +230,10 @@ class OllamaClient:
                 "stream": False,
                 "options": options,
             }
-            response = requests.post(
-                f"{self.base_url}/api/generate", json=payload, timeout=self.timeout
+            response = self.session.post(
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=self._request_timeout(timeout),
             )
             if response.status_code == 200:
                 return response.json().get("response", "").strip()
@@ -104,11 +251,15 @@ class OllamaClient:
         """Alias for generate_completion."""
         return self.generate_completion(prompt, system_prompt, max_tokens)
 
-    def generate_embedding(self, text: str) -> List[float]:
+    def generate_embedding(
+        self, text: str, timeout: Optional[float] = None
+    ) -> List[float]:
         try:
             payload = {"model": self.model, "prompt": text}
-            response = requests.post(
-                f"{self.base_url}/api/embeddings", json=payload, timeout=self.timeout
+            response = self.session.post(
+                f"{self.base_url}/api/embeddings",
+                json=payload,
+                timeout=self._request_timeout(timeout),
             )
             if response.status_code == 200:
                 return response.json().get("embedding", [])
@@ -125,6 +276,169 @@ class OllamaClient:
                 raise
             raise Exception(f"Unexpected error generating embedding: {e}")
 
+    def generate_embeddings(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[List[float]]:
+        """Embed many texts via the batch ``/api/embed`` endpoint.
+
+        Sends ``batch_size`` (default ``embed_batch_size``) texts per request
+        and returns embeddings in input order. Falls back to one
+        ``/api/embeddings`` call per text on servers without ``/api/embed``.
+        """
+        size = max(1, batch_size or self.embed_batch_size)
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), size):
+            chunk = texts[start : start + size]
+            try:
+                payload = {"model": self.model, "input": chunk}
+                response = self.session.post(
+                    f"{self.base_url}/api/embed",
+                    json=payload,
+                    timeout=self._request_timeout(timeout),
+                )
+                if response.status_code == 404:
+                    embeddings.extend(
+                        self.generate_embedding(t, timeout) for t in chunk
+                    )
+                    continue
+                if response.status_code != 200:
+                    raise Exception(
+                        f"Embedding API error: {response.status_code} - {response.text}"
+                    )
+                batch = response.json().get("embeddings", [])
+                if len(batch) != len(chunk):
+                    raise Exception(
+                        f"Embedding API error: expected {len(chunk)} embeddings, "
+                        f"got {len(batch)}"
+                    )
+                embeddings.extend(batch)
+            except requests.ConnectionError:
+                raise Exception("Failed to connect to Ollama service")
+            except requests.Timeout:
+                raise Exception("Request to Ollama service timed out")
+            except Exception as e:
+                known = ("Embedding API error", "Failed to connect", "timed out")
+                if any(k in str(e) for k in known):
+                    raise
+                raise Exception(f"Unexpected error generating embeddings: {e}")
+        return embeddings
+
+
+# ---------------------------------------------------------------------------
+# AsyncOllamaClient
+# ---------------------------------------------------------------------------
+
+
+class AsyncOllamaClient:
+    """asyncio front-end for OllamaClient with bounded concurrency.
+
+    At most ``max_concurrency`` requests are in flight at once; each runs on
+    a dedicated worker thread over the pooled keep-alive session, so no
+    async HTTP dependency is needed. ``request_timeout`` (seconds, config
+    key, default: the client's ``timeout``) is the HTTP timeout of each
+    request, so a request that times out has really stopped.
+
+    ``submit`` schedules any blocking callable under the same limit, which
+    lets callers such as NoteProcessingCoordinator fan out whole per-note
+    pipelines.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ConfigDict] = None,
+        max_concurrency: int = 4,
+        client: Optional[OllamaClient] = None,
+    ):
+        config = config or {}
+        self.client = client or get_ollama_client(config or None)
+        self.max_concurrency = max(1, max_concurrency)
+        self.request_timeout = config.get("request_timeout", self.client.timeout)
+        # Make sure the shared pool can hold every in-flight request.
+        get_http_session(self.client.base_url, self.max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="ollama-async"
+        )
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop_id = id(asyncio.get_running_loop())
+        if loop_id not in self._semaphores:
+            self._semaphores[loop_id] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop_id]
+
+    async def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call under the concurrency limit.
+
+        A worker thread can't be interrupted, so its slot is held until the
+        call returns, even if the awaiting task is cancelled. Bound the time
+        with HTTP timeouts (``request_timeout()``) instead.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore()
+        await semaphore.acquire()
+        try:
+            future = loop.run_in_executor(
+                self._executor, functools.partial(fn, *args, **kwargs)
+            )
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(lambda _: semaphore.release())
+        return await asyncio.shield(future)
+
+    async def agenerate_completion(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        max_tokens: int = -1,
+        timeout: Optional[float] = None,
+    ) -> str:
+        return await self.submit(
+            self.client.generate_completion,
+            prompt,
+            system_prompt,
+            max_tokens,
+            timeout if timeout is not None else self.request_timeout,
+        )
+
+    async def agenerate_embedding(
+        self, text: str, timeout: Optional[float] = None
+    ) -> List[float]:
+        return await self.submit(
+            self.client.generate_embedding,
+            text,
+            timeout if timeout is not None else self.request_timeout,
+        )
+
+    async def agenerate_embeddings(
+        self, texts: List[str], timeout: Optional[float] = None
+    ) -> List[List[float]]:
+        """Embed texts, one /api/embed request per chunk, chunks in parallel."""
+        size = self.client.embed_batch_size
+        chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+        results = await asyncio.gather(
+            *(
+                self.submit(
+                    self.client.generate_embeddings,
+                    chunk,
+                    size,
+                    timeout if timeout is not None else self.request_timeout,
+                )
+                for chunk in chunks
+            )
+        )
+        return [vector for chunk in results for vector in chunk]
+
+    async def ahealth_check(self) -> bool:
+        return await self.submit(self.client.health_check)
+
+    def close(self):
+        """Shut down the worker threads (pending calls finish first)."""
+        self._executor.shutdown(wait=True)
+
 
 # ---------------------------------------------------------------------------
 # EmbeddingCache
@@ -132,93 +446,286 @@ class OllamaClient:
 
 
 class EmbeddingCache:
-    """Disk-backed LRU cache for text embeddings."""
+    """Disk-backed LRU cache for text embeddings.
+
+    Layout inside ``cache_dir``:
+      - ``vectors.bin``   append-only records, read through ``mmap``; each is a
+        header (text hash, CRC-32, dimension) followed by float64 values
+      - ``index.sqlite``  text hash -> (offset, dimension, text_length, last_access)
+      - ``vectors.lock``  ``flock`` target serialising writers across processes
+
+    The LRU order is an ``OrderedDict`` (O(1) hits); access order is flushed
+    to SQLite on the next write. Space left by evicted entries is reclaimed
+    by compacting ``vectors.bin`` once it is mostly garbage. Legacy
+    JSON-file-per-entry caches are migrated on first open.
+
+    Several processes may share a cache directory. Appends, index writes
+    and compaction happen under the lock file, and every read is checked
+    against its record header, so an offset made stale by another process
+    is re-resolved from the index instead of returning the wrong vector.
+    """
+
+    VECTOR_FILE = "vectors.bin"
+    DB_FILE = "index.sqlite"
+    LOCK_FILE = "vectors.lock"
+    LEGACY_INDEX_FILE = "index.json"
+    # vectors.bin record layout, stamped into the index's user_version
+    FORMAT_VERSION = 1
+    _ITEM = array("d").itemsize
+    _HEADER = struct.Struct("<8sII")  # text hash, crc32(values), dimension
 
     def __init__(self, cache_dir: str = ".embedding_cache", max_cache_size: int = 1000):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.max_cache_size = max_cache_size
-        self.client = OllamaClient()
-        self.index_file = self.cache_dir / "index.json"
-        self.cache_index = self._load_index()
-
-    def _load_index(self) -> Dict:
-        if self.index_file.exists():
+        self.client = get_ollama_client()
+        self.vector_file = self.cache_dir / self.VECTOR_FILE
+        self.vector_file.touch(exist_ok=True)
+        self.lock_file = self.cache_dir / self.LOCK_FILE
+        self._lock = threading.RLock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._clock = 0
+        self._touched: Dict[str, int] = {}
+        # hash -> (offset, dimension, text_length), least recently used first
+        self._entries: "OrderedDict[str, Tuple[int, int, int]]" = OrderedDict()
+        self._db = sqlite3.connect(
+            str(self.cache_dir / self.DB_FILE), check_same_thread=False
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "hash TEXT PRIMARY KEY, offset INTEGER NOT NULL, "
+            "dimension INTEGER NOT NULL, text_length INTEGER NOT NULL, "
+            "last_access INTEGER NOT NULL)"
+        )
+        self._db.commit()
+        self._check_format()
+        self._load_index()
+        self._migrate_legacy_cache()
+
+    # -- index ---------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool = True):
+        """Cross-process lock on the vector file and index (no-op without fcntl)."""
+        if not HAS_FCNTL:
+            yield
+            return
+        with open(self.lock_file, "a") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
             try:
-                with open(self.index_file) as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return {"entries": {}, "access_order": []}
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _check_format(self):
+        with self._file_lock():
+            if not self._db.execute("PRAGMA user_version").fetchone()[0]:
+                self._db.execute(f"PRAGMA user_version = {self.FORMAT_VERSION}")
+                self._db.commit()
+
+    def _load_index(self):
+        rows = self._db.execute(
+            "SELECT hash, offset, dimension, text_length, last_access "
+            "FROM entries ORDER BY last_access"
+        ).fetchall()
+        for h, offset, dimension, text_length, last_access in rows:
+            self._entries[h] = (offset, dimension, text_length)
+            self._clock = max(self._clock, last_access)
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def _flush_access_order(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE entries SET last_access = ? WHERE hash = ?",
+                [(tick, h) for h, tick in self._touched.items()],
+            )
+            self._touched.clear()
 
-    def _save_index(self):
-        try:
-            with open(self.index_file, "w") as f:
-                json.dump(self.cache_index, f, indent=2)
-        except Exception:
-            pass
+    def flush(self):
+        """Persist pending LRU access order."""
+        with self._lock:
+            self._flush_access_order()
+            self._db.commit()
 
     def _hash(self, text: str) -> str:
         return hashlib.sha256(text.encode()).hexdigest()[:16]
 
-    def _cache_file(self, text_hash: str) -> Path:
-        return self.cache_dir / f"{text_hash}.json"
+    # -- vector file -----------------------------------------------------------
+
+    def _mapped(self, start: int, end: int) -> Optional[bytes]:
+        if self._mmap is None or end > len(self._mmap):
+            self._close_mmap()
+            size = self.vector_file.stat().st_size
+            if size == 0 or end > size:
+                return None
+            with open(self.vector_file, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap[start:end]
+
+    def _read_record(
+        self, text_hash: str, offset: int, dimension: int
+    ) -> Optional[bytes]:
+        """The verified record for text_hash at offset, or None."""
+        end = offset + self._HEADER.size + dimension * self._ITEM
+        for _ in range(2):
+            record = self._mapped(offset, end)
+            if record is not None:
+                digest, crc, stored_dimension = self._HEADER.unpack_from(record)
+                if (
+                    digest == bytes.fromhex(text_hash)
+                    and stored_dimension == dimension
+                    and zlib.crc32(record[self._HEADER.size :]) == crc
+                ):
+                    return record
+            # vectors.bin may have been replaced by another process's compaction
+            self._close_mmap()
+        return None
+
+    def _read_vector(
+        self, text_hash: str, offset: int, dimension: int
+    ) -> Optional[List[float]]:
+        record = self._read_record(text_hash, offset, dimension)
+        if record is None:
+            return None
+        return array("d", record[self._HEADER.size :]).tolist()
+
+    def _append_vector(self, text_hash: str, embedding: List[float]) -> int:
+        """Append one record; callers must hold _file_lock()."""
+        values = array("d", embedding).tobytes()
+        header = self._HEADER.pack(
+            bytes.fromhex(text_hash), zlib.crc32(values), len(embedding)
+        )
+        with open(self.vector_file, "ab") as f:
+            offset = os.fstat(f.fileno()).st_size
+            f.write(header + values)
+        return offset
+
+    def _close_mmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _maybe_compact(self):
+        """Rewrite vectors.bin without evicted records once it is >50% garbage.
+
+        Callers must hold _file_lock(). The index, not this process's view
+        of it, decides what is live, so rows other processes added survive.
+        """
+        rows = self._db.execute(
+            "SELECT hash, offset, dimension FROM entries"
+        ).fetchall()
+        live = sum(self._HEADER.size + dim * self._ITEM for _, _, dim in rows)
+        size = self.vector_file.stat().st_size
+        if size < 1024 * 1024 or live * 2 > size:
+            return
+        tmp = self.vector_file.with_name(self.VECTOR_FILE + ".tmp")
+        moved = {}
+        with open(tmp, "wb") as out:
+            for h, offset, dimension in rows:
+                record = self._read_record(h, offset, dimension)
+                if record is None:
+                    continue
+                moved[h] = out.tell()
+                out.write(record)
+            out.flush()
+            os.fsync(out.fileno())
+        self._close_mmap()
+        os.replace(tmp, self.vector_file)
+        for h, _, _ in rows:
+            if h not in moved:
+                self._remove(h)
+        for h, offset in moved.items():
+            if h in self._entries:
+                _, dimension, text_length = self._entries[h]
+                self._entries[h] = (offset, dimension, text_length)
+        self._db.executemany(
+            "UPDATE entries SET offset = ? WHERE hash = ?",
+            [(offset, h) for h, offset in moved.items()],
+        )
+
+    # -- LRU -------------------------------------------------------------------
 
     def _evict(self):
-        entries = self.cache_index["entries"]
-        order = self.cache_index["access_order"]
-        while len(entries) > self.max_cache_size:
-            oldest = order.pop(0)
-            if oldest in entries:
-                self._cache_file(oldest).unlink(missing_ok=True)
-                del entries[oldest]
+        while len(self._entries) > self.max_cache_size:
+            oldest, _ = self._entries.popitem(last=False)
+            self._touched.pop(oldest, None)
+            self._db.execute("DELETE FROM entries WHERE hash = ?", (oldest,))
 
     def _remove(self, text_hash: str):
-        entries = self.cache_index["entries"]
-        if text_hash in entries:
-            self._cache_file(text_hash).unlink(missing_ok=True)
-            del entries[text_hash]
-        order = self.cache_index["access_order"]
-        if text_hash in order:
-            order.remove(text_hash)
+        self._entries.pop(text_hash, None)
+        self._touched.pop(text_hash, None)
+        self._db.execute("DELETE FROM entries WHERE hash = ?", (text_hash,))
+
+    def _lookup(self, text_hash: str) -> Optional[Tuple[int, int, int]]:
+        entry = self._entries.get(text_hash)
+        if entry is None:
+            # Another process sharing this cache may have stored it.
+            row = self._db.execute(
+                "SELECT offset, dimension, text_length FROM entries WHERE hash = ?",
+                (text_hash,),
+            ).fetchone()
+            if row is not None:
+                entry = (row[0], row[1], row[2])
+                self._entries[text_hash] = entry
+        return entry
+
+    # -- public API --------------------------------------------------------------
 
     def get_embedding(self, text: str) -> Optional[List[float]]:
         h = self._hash(text)
-        if h not in self.cache_index["entries"]:
-            return None
-        f = self._cache_file(h)
-        if not f.exists():
-            return None
-        try:
-            with open(f) as fp:
-                data = json.load(fp)
-            order = self.cache_index["access_order"]
-            if h in order:
-                order.remove(h)
-            order.append(h)
-            return data["embedding"]
-        except Exception:
-            self._remove(h)
-            return None
+        with self._lock:
+            entry = self._lookup(h)
+            if entry is None:
+                return None
+            try:
+                vector = self._read_vector(h, entry[0], entry[1])
+                if vector is None:
+                    # Our offset may predate another process's compaction
+                    with self._file_lock(exclusive=False):
+                        self._entries.pop(h, None)
+                        current = self._lookup(h)
+                        if current is not None and current != entry:
+                            vector = self._read_vector(h, current[0], current[1])
+            except Exception:
+                vector = None
+            if vector is None:
+                self._remove(h)
+                return None
+            self._entries.move_to_end(h)
+            self._touched[h] = self._tick()
+            return vector
+
+    def _store_locked(self, text: str, embedding: List[float]):
+        h = self._hash(text)
+        offset = self._append_vector(h, embedding)
+        self._entries[h] = (offset, len(embedding), len(text))
+        self._entries.move_to_end(h)
+        self._touched.pop(h, None)
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (h, offset, len(embedding), len(text), self._tick()),
+        )
 
     def store_embedding(self, text: str, embedding: List[float]):
-        h = self._hash(text)
-        f = self._cache_file(h)
-        try:
-            with open(f, "w") as fp:
-                json.dump(
-                    {"text_hash": h, "text_length": len(text), "embedding": embedding},
-                    fp,
-                )
-            self.cache_index["entries"][h] = {"file": f.name, "text_length": len(text)}
-            order = self.cache_index["access_order"]
-            if h in order:
-                order.remove(h)
-            order.append(h)
-            self._evict()
-            self._save_index()
-        except Exception:
-            pass
+        self.store_embeddings([(text, embedding)])
+
+    def store_embeddings(self, items: List[Tuple[str, List[float]]]):
+        """Store several (text, embedding) pairs with a single commit."""
+        with self._lock:
+            try:
+                with self._file_lock():
+                    for text, embedding in items:
+                        self._store_locked(text, embedding)
+                    self._evict()
+                    self._maybe_compact()
+                    self._flush_access_order()
+                    self._db.commit()
+            except Exception as e:
+                self._db.rollback()
+                logger.debug(f"Failed to store embeddings: {e}")
 
     def get_or_generate_embedding(self, text: str) -> List[float]:
         cached = self.get_embedding(text)
@@ -230,20 +737,87 @@ class EmbeddingCache:
         self.store_embedding(text, embedding)
         return embedding
 
+    def get_or_generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Batch variant: cache hits are served locally, misses are embedded
+        with one health check and ``ceil(misses / batch_size)`` requests."""
+        results: List[Optional[List[float]]] = [self.get_embedding(t) for t in texts]
+        missing = list(dict.fromkeys(t for t, r in zip(texts, results) if r is None))
+        if missing:
+            if not self.client.health_check():
+                raise Exception("Ollama service is not available")
+            generated = dict(zip(missing, self.client.generate_embeddings(missing)))
+            self.store_embeddings(list(generated.items()))
+            results = [
+                r if r is not None else generated[t] for t, r in zip(texts, results)
+            ]
+        return results
+
     def clear_cache(self):
-        for f in self.cache_dir.glob("*.json"):
-            if f.name != "index.json":
-                f.unlink()
-        self.cache_index = {"entries": {}, "access_order": []}
-        self._save_index()
+        with self._lock, self._file_lock():
+            self._close_mmap()
+            self.vector_file.write_bytes(b"")
+            self._entries.clear()
+            self._touched.clear()
+            self._db.execute("DELETE FROM entries")
+            self._db.commit()
+
+    def close(self):
+        """Flush pending state and release the mmap and database handles."""
+        with self._lock:
+            self._flush_access_order()
+            self._db.commit()
+            self._close_mmap()
+            self._db.close()
 
     def get_cache_stats(self) -> Dict:
         return {
-            "total_entries": len(self.cache_index["entries"]),
+            "total_entries": len(self._entries),
             "max_size": self.max_cache_size,
             "cache_dir": str(self.cache_dir),
             "disk_usage_mb": sum(
-                f.stat().st_size for f in self.cache_dir.glob("*.json")
+                f.stat().st_size for f in self.cache_dir.iterdir() if f.is_file()
             )
             / (1024 * 1024),
         }
+
+    # -- migration ---------------------------------------------------------------
+
+    def _migrate_legacy_cache(self):
+        """Import a JSON-file-per-entry cache (index.json + <hash>.json) once."""
+        legacy_index = self.cache_dir / self.LEGACY_INDEX_FILE
+        if not legacy_index.exists():
+            return
+        try:
+            with open(legacy_index) as f:
+                index = json.load(f)
+        except Exception:
+            index = {"entries": {}, "access_order": []}
+        entries = index.get("entries", {})
+        order = [h for h in index.get("access_order", []) if h in entries]
+        ordered = set(order)
+        order += [h for h in entries if h not in ordered]
+        migrated = 0
+        with self._lock, self._file_lock():
+            for h in order:
+                legacy_file = self.cache_dir / f"{h}.json"
+                if h in self._entries or not legacy_file.exists():
+                    continue
+                try:
+                    with open(legacy_file) as fp:
+                        data = json.load(fp)
+                    embedding = data["embedding"]
+                    text_length = data.get("text_length", 0)
+                except Exception:
+                    continue
+                offset = self._append_vector(h, embedding)
+                self._entries[h] = (offset, len(embedding), text_length)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (h, offset, len(embedding), text_length, self._tick()),
+                )
+                migrated += 1
+            self._evict()
+            self._db.commit()
+        for f in self.cache_dir.glob("*.json"):
+            f.unlink(missing_ok=True)
+        logger.info(f"Migrated {migrated} legacy embedding cache entries")
@@ -17,6 +17,15 @@ Usage:
     # Create backup with JSON output for automation
     python3 backup_cli.py backup --format json
 
+    # Incremental snapshot: hard-link files unchanged since the last backup
+    python3 backup_cli.py backup --incremental
+
+    # Deduplicated snapshot in the content-addressed store
+    python3 backup_cli.py backup --store
+
+    # Restore selected files from a store snapshot
+    python3 backup_cli.py restore knowledge-20250101-120000 --path "Inbox/note.md"
+
     # Prune old backups (keep 5 most recent)
     python3 backup_cli.py prune-backups --keep 5
 
@@ -25,6 +34,9 @@ Usage:
 
     # JSON output for automation
     python3 backup_cli.py prune-backups --keep 5 --format json
+
+    # Dry-run report of the moves organizing the vault would make
+    python3 backup_cli.py plan-moves
 """
 
 import sys
@@ -32,7 +44,7 @@ import json
 import argparse
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from src.cli.cli_output_contract import build_json_response
 from src.cli.cli_logging import configure_cli_logging, log_cli_context
@@ -47,8 +59,10 @@ class BackupCLI:
     Dedicated CLI for backup management operations
 
     Responsibilities:
-    - Backup creation (timestamped backups)
+    - Backup creation (timestamped backups or store snapshots)
+    - Selective restore from store snapshots
     - Backup pruning (keep N most recent)
+    - Dry-run report of directory organization moves
     - Handle output formatting (normal/JSON)
 
     Uses DirectoryOrganizer for actual implementation
@@ -74,12 +88,19 @@ class BackupCLI:
         """Check if output should be suppressed (JSON mode)."""
         return output_format == "json"
 
-    def backup(self, output_format: str = "normal") -> int:
+    def backup(
+        self,
+        output_format: str = "normal",
+        incremental: bool = False,
+        store: bool = False,
+    ) -> int:
         """
         Create a timestamped backup of the vault.
 
         Args:
             output_format: 'normal' or 'json'
+            incremental: Snapshot against the previous backup, copying only changes
+            store: Snapshot into the content-addressed store instead
 
         Returns:
             Exit code (0 for success, 1 for failure)
@@ -98,12 +119,17 @@ class BackupCLI:
                 print("💾 Creating timestamped backup...")
 
             # Execute backup using DirectoryOrganizer
-            backup_path = self.organizer.create_backup()
+            backup_path = self.organizer.create_backup(
+                incremental=incremental, store=store
+            )
+            data = {"backup_path": str(backup_path)}
+            if incremental or store:
+                data["snapshot"] = self.organizer.last_snapshot_stats
 
             # Build contract-compliant response
             response = build_json_response(
                 success=True,
-                data={"backup_path": str(backup_path)},
+                data=data,
                 errors=[],
                 cli_name="backup_cli",
                 subcommand="backup",
@@ -116,6 +142,17 @@ class BackupCLI:
                 self._print_header("BACKUP CREATED")
                 print("✅ Backup created successfully")
                 print(f"📁 Location: {backup_path}")
+                stats = self.organizer.last_snapshot_stats
+                if store:
+                    print(
+                        f"🧱 {stats['files']} files, {stats['hashed']} hashed, "
+                        f"{stats['bytes_stored']} new bytes stored"
+                    )
+                elif incremental:
+                    print(
+                        f"🔗 {stats['linked']} unchanged files linked, "
+                        f"{stats['copied']} copied ({stats['bytes_copied']} bytes)"
+                    )
 
             return 0
 
@@ -135,6 +172,74 @@ class BackupCLI:
             logger.exception("Error in backup")
             return 1
 
+    def restore(
+        self,
+        snapshot: str,
+        paths: Optional[List[str]] = None,
+        output_format: str = "normal",
+    ) -> int:
+        """
+        Restore files from a store snapshot into the vault.
+
+        Args:
+            snapshot: Snapshot name
+            paths: Vault-relative files or folders to restore (default: all)
+            output_format: 'normal' or 'json'
+
+        Returns:
+            Exit code (0 for success, 1 for failure)
+        """
+        quiet = self._is_quiet_mode(output_format)
+        log_cli_context(
+            logger=logger,
+            cli_name="backup_cli",
+            subcommand="restore",
+            vault_path=self.vault_path,
+            output_format=output_format,
+        )
+
+        try:
+            if not quiet:
+                print(f"♻️  Restoring from snapshot {snapshot}...")
+
+            restored = self.organizer.restore_snapshot(snapshot, paths)
+
+            response = build_json_response(
+                success=True,
+                data={"snapshot": snapshot, "restored": restored},
+                errors=[],
+                cli_name="backup_cli",
+                subcommand="restore",
+            )
+
+            if quiet:
+                print(json.dumps(response, indent=2, default=str))
+            else:
+                self._print_header("RESTORE COMPLETE")
+                print(f"✅ Restored {len(restored)} path(s)")
+                for rel_path in restored[:20]:
+                    print(f"  - {rel_path}")
+                if len(restored) > 20:
+                    print(f"  ... and {len(restored) - 20} more")
+
+            return 0
+
+        except Exception as e:
+            error_msg = str(e)
+            if quiet:
+                response = build_json_response(
+                    success=False,
+                    data={},
+                    errors=[error_msg],
+                    cli_name="backup_cli",
+                    subcommand="restore",
+                )
+                print(json.dumps(response, indent=2, default=str))
+            else:
+                print(f"❌ Error restoring snapshot: {e}", file=sys.stderr)
+            logger.exception("Error in restore")
+            return 1
+
     def prune_backups(
         self, keep: int = 5, dry_run: bool = False, output_format: str = "normal"
     ) -> int:
@@ -178,6 +283,8 @@ class BackupCLI:
                     "keep": keep,
                     "dry_run": dry_run,
                     "to_prune": prune_result.get("to_prune", []),
+                    "snapshots_to_prune": prune_result.get("snapshots_to_prune", []),
+                    "journals_to_prune": prune_result.get("journals_to_prune", []),
                     "deleted": prune_result.get("deleted", []),
                 },
                 errors=prune_result.get("errors", []),
@@ -196,10 +303,18 @@ class BackupCLI:
                 print(f"✅ Backups to keep: {keep}")
                 print(f"🗑️  Backups to prune: {len(response['data']['to_prune'])}")
 
-                if response["data"]["to_prune"]:
+                if (
+                    response["data"]["to_prune"]
+                    or response["data"]["snapshots_to_prune"]
+                    or response["data"]["journals_to_prune"]
+                ):
                     print("\nBackups marked for deletion:")
                     for backup in response["data"]["to_prune"]:
                         print(f"  - {backup}")
+                    for snapshot in response["data"]["snapshots_to_prune"]:
+                        print(f"  - store snapshot {snapshot}")
+                    for operation_id in response["data"]["journals_to_prune"]:
+                        print(f"  - journal {operation_id}")
 
                     if dry_run:
                         print(
@@ -228,6 +343,31 @@ class BackupCLI:
             logger.exception("Error in prune_backups")
             return 1
 
+    def plan_moves(self) -> int:
+        """
+        Print the directory organization dry run report (Markdown).
+
+        Moves are printed as notes are classified rather than after the
+        whole vault has been planned.
+
+        Returns:
+            Exit code (0 for success, 1 for failure)
+        """
+        log_cli_context(
+            logger=logger,
+            cli_name="backup_cli",
+            subcommand="plan-moves",
+            vault_path=self.vault_path,
+            dry_run=True,
+        )
+        try:
+            self.organizer.write_dry_run_report(sys.stdout)
+            return 0
+        except Exception as e:
+            print(f"❌ Error planning moves: {e}", file=sys.stderr)
+            logger.exception("Error in plan-moves")
+            return 1
+
 
 def create_parser() -> argparse.ArgumentParser:
     """
@@ -247,6 +387,13 @@ Examples:
   # Create backup with JSON output
   %(prog)s backup --format json
   
+  # Incremental snapshot (hard-links unchanged files)
+  %(prog)s backup --incremental
+  
+  # Deduplicated snapshot, then restore one note from it
+  %(prog)s backup --store
+  %(prog)s restore knowledge-20250101-120000 --path "Inbox/note.md"
+  
   # Prune backups (keep 5 most recent)
   %(prog)s prune-backups --keep 5
   
@@ -255,6 +402,9 @@ Examples:
   
   # JSON output for automation
   %(prog)s prune-backups --keep 5 --format json
+  
+  # Dry-run report of directory organization moves
+  %(prog)s plan-moves
         """,
     )
 
@@ -277,6 +427,32 @@ Examples:
     backup_parser.add_argument(
         "--format", choices=["normal", "json"], default="normal", help="Output format"
     )
+    backup_mode = backup_parser.add_mutually_exclusive_group()
+    backup_mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Hard-link files unchanged since the previous backup",
+    )
+    backup_mode.add_argument(
+        "--store",
+        action="store_true",
+        help="Snapshot into the content-addressed, deduplicated backup store",
+    )
+
+    # restore subcommand (selective restore from the store)
+    restore_parser = subparsers.add_parser(
+        "restore", help="Restore files from a store snapshot"
+    )
+    restore_parser.add_argument("snapshot", help="Snapshot name")
+    restore_parser.add_argument(
+        "--path",
+        dest="paths",
+        action="append",
+        help="Vault-relative file or folder to restore (repeatable; default: all)",
+    )
+    restore_parser.add_argument(
+        "--format", choices=["normal", "json"], default="normal", help="Output format"
+    )
 
     # prune-backups subcommand
     prune_parser = subparsers.add_parser(
@@ -292,6 +468,11 @@ Examples:
         "--format", choices=["normal", "json"], default="normal", help="Output format"
     )
 
+    # plan-moves subcommand (dry run of directory organization)
+    subparsers.add_parser(
+        "plan-moves", help="Print the moves organizing the vault would make"
+    )
+
     return parser
 
 
@@ -330,11 +511,21 @@ def main():
     # Execute command
     try:
         if args.command == "backup":
-            return cli.backup(output_format=args.format)
+            return cli.backup(
+                output_format=args.format,
+                incremental=args.incremental,
+                store=args.store,
+            )
+        elif args.command == "restore":
+            return cli.restore(
+                snapshot=args.snapshot, paths=args.paths, output_format=args.format
+            )
         elif args.command == "prune-backups":
             return cli.prune_backups(
                 keep=args.keep, dry_run=args.dry_run, output_format=args.format
             )
+        elif args.command == "plan-moves":
+            return cli.plan_moves()
         else:
             parser.print_help()
             return 1
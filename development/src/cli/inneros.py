@@ -7,16 +7,20 @@ point. Each domain is a top-level subcommand; secondary actions are nested
 subcommands under that domain.
 
 Usage:
-    inneros --vault /path/to/vault backup
+    inneros --vault /path/to/vault backup [--incremental | --store]
     inneros --vault /path/to/vault backup prune [--keep N] [--dry-run]
+    inneros --vault /path/to/vault backup restore SNAPSHOT [--path PATH ...]
     inneros --vault /path/to/vault fleeting health [--format json]
     inneros --vault /path/to/vault fleeting triage [--quality-threshold 0.8] [--mutate]
     inneros --vault /path/to/vault review [--preview] [--export] [--format json]
     inneros --vault /path/to/vault review metrics [--format json]
-    inneros --vault /path/to/vault inbox [--dry-run] [--format json]
+    inneros --vault /path/to/vault inbox [--dry-run] [--workers N] [--format json]
+    inneros --vault /path/to/vault cache stats [--format json]
+    inneros --vault /path/to/vault cache clear [--note PATH]
 """
 
 import sys
+import json
 import argparse
 import logging
 from pathlib import Path
@@ -48,12 +52,24 @@ def create_parser() -> argparse.ArgumentParser:
     _add_fleeting_subcommand(subparsers)
     _add_review_subcommand(subparsers)
     _add_inbox_subcommand(subparsers)
+    _add_cache_subcommand(subparsers)
 
     return parser
 
 
 def _add_backup_subcommand(subparsers):
     backup = subparsers.add_parser("backup", help="Vault backup operations")
+    mode = backup.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Hard-link files unchanged since the previous backup",
+    )
+    mode.add_argument(
+        "--store",
+        action="store_true",
+        help="Snapshot into the content-addressed, deduplicated backup store",
+    )
     backup_sub = backup.add_subparsers(dest="subcommand", metavar="subcommand")
 
     prune = backup_sub.add_parser("prune", help="Prune old backups")
@@ -65,6 +81,16 @@ def _add_backup_subcommand(subparsers):
     )
     prune.add_argument("--format", choices=["text", "json"], default="text")
 
+    restore = backup_sub.add_parser("restore", help="Restore from a store snapshot")
+    restore.add_argument("snapshot", help="Snapshot name")
+    restore.add_argument(
+        "--path",
+        dest="paths",
+        action="append",
+        help="Vault-relative file or folder to restore (repeatable; default: all)",
+    )
+    restore.add_argument("--format", choices=["text", "json"], default="text")
+
 
 def _add_fleeting_subcommand(subparsers):
     fleeting = subparsers.add_parser("fleeting", help="Fleeting note operations")
@@ -111,6 +137,37 @@ def _add_inbox_subcommand(subparsers):
         "--dry-run", action="store_true", help="Scan only, no processing"
     )
     inbox.add_argument("--format", choices=["text", "json"], default="text")
+    inbox.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="Process N notes concurrently (default: 1)",
+    )
+
+
+def _add_cache_subcommand(subparsers):
+    cache = subparsers.add_parser("cache", help="AI result cache operations")
+    cache_sub = cache.add_subparsers(dest="subcommand", metavar="subcommand")
+    cache_sub.required = True
+
+    stats = cache_sub.add_parser("stats", help="Show result cache statistics")
+    stats.add_argument("--format", choices=["text", "json"], default="text")
+
+    clear = cache_sub.add_parser("clear", help="Invalidate cached AI results")
+    clear.add_argument(
+        "--note", metavar="PATH", help="Only invalidate results for this note"
+    )
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
 
 
 # ---------------------------------------------------------------------------
@@ -129,7 +186,17 @@ def _run_backup(args) -> int:
             dry_run=args.dry_run,
             output_format=getattr(args, "format", "normal"),
         )
-    return cli.backup(output_format=getattr(args, "format", "normal"))
+    if subcommand == "restore":
+        return cli.restore(
+            snapshot=args.snapshot,
+            paths=args.paths,
+            output_format=getattr(args, "format", "normal"),
+        )
+    return cli.backup(
+        output_format=getattr(args, "format", "normal"),
+        incremental=getattr(args, "incremental", False),
+        store=getattr(args, "store", False),
+    )
 
 
 def _run_fleeting(args) -> int:
@@ -164,11 +231,47 @@ def _run_inbox(args) -> int:
 
     vault = Path(args.vault)
     inbox_dir = vault / "Inbox"
-    result = batch_process_unprocessed_inbox(inbox_dir, dry_run=args.dry_run)
+    result = batch_process_unprocessed_inbox(
+        inbox_dir, dry_run=args.dry_run, workers=args.workers
+    )
     errors = result.get("errors", 0)
     return 1 if errors and errors > 0 else 0
 
 
+def _run_cache(args) -> int:
+    from src.ai.batch import NoteResultCache
+    from src.utils.frontmatter import parse_frontmatter
+
+    cache = NoteResultCache.for_vault(Path(args.vault))
+    try:
+        if args.subcommand == "clear":
+            body_hash = None
+            if args.note:
+                note = Path(args.note)
+                if not note.is_absolute():
+                    note = Path(args.vault) / note
+                if not note.exists():
+                    print(f"Note not found: {note}", file=sys.stderr)
+                    return 1
+                _, body = parse_frontmatter(note.read_text(encoding="utf-8"))
+                body_hash = NoteResultCache.body_hash(body)
+            removed = cache.invalidate(body_hash)
+            print(f"Removed {removed} cached result(s)")
+            return 0
+
+        stats = cache.stats()
+        if args.format == "json":
+            print(json.dumps(stats, indent=2))
+        else:
+            print(f"Result cache: {stats['path']}")
+            print(f"  Entries: {stats['entries']}")
+            print(f"  Size:    {stats['size_bytes'] / 1024:.1f} KiB")
+            print(f"  Hits:    {stats['lifetime_hits']}")
+        return 0
+    finally:
+        cache.close()
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -186,6 +289,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         "fleeting": _run_fleeting,
         "review": _run_review,
         "inbox": _run_inbox,
+        "cache": _run_cache,
     }
 
     handler = dispatch.get(args.command)
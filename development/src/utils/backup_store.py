@@ -0,0 +1,337 @@
+"""
+Content-addressed, deduplicated backup store.
+
+Directory backups copy the whole vault every time, even though most files
+never change between backups. The store keeps each distinct file content
+once, as a blob named by its SHA-256, and records every snapshot as a small
+JSON manifest mapping vault-relative paths to blob hashes, sizes and mtimes:
+
+    <store>/objects/ab/abcdef...      # blob contents
+    <store>/manifests/<name>.json     # one per snapshot
+
+A snapshot only hashes files whose size or mtime changed since the previous
+manifest, and only writes blobs that are not already stored. Pruning deletes
+manifests and then garbage-collects blobs no remaining manifest references.
+Sizes come from manifests, and any subset of paths can be restored.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import tempfile
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from src.utils.io import safe_write
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class BackupStoreError(Exception):
+    """Raised when a store snapshot cannot be written, read or restored."""
+
+    pass
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupStore:
+    """
+    Deduplicated snapshot store rooted at ``root``.
+
+    Usage:
+        store = BackupStore(backup_root / "store")
+        manifest = store.snapshot(vault_root, "knowledge-20250101-120000")
+        store.restore(manifest["name"], vault_root, paths=["Inbox/note.md"])
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+
+    # ------------------------------------------------------------------
+    # Layout helpers
+    # ------------------------------------------------------------------
+
+    def blob_path(self, blob_hash: str) -> Path:
+        return self.objects_dir / blob_hash[:2] / blob_hash
+
+    def manifest_path(self, name: str) -> Path:
+        return self.manifests_dir / f"{name}.json"
+
+    def list_snapshots(self) -> List[str]:
+        """Snapshot names, newest first (names embed sortable timestamps)."""
+        if not self.manifests_dir.exists():
+            return []
+        return sorted((p.stem for p in self.manifests_dir.glob("*.json")), reverse=True)
+
+    def has_snapshot(self, name: str) -> bool:
+        return self.manifest_path(name).exists()
+
+    def load_manifest(self, name: str) -> Dict[str, Any]:
+        path = self.manifest_path(name)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise BackupStoreError(f"Snapshot not found: {name}")
+        except (OSError, ValueError) as e:
+            raise BackupStoreError(f"Unreadable manifest {path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+
+    def snapshot(
+        self,
+        source: Union[str, Path],
+        name: str,
+        ignore: Optional[Callable[[str, List[str]], Iterable[str]]] = None,
+        previous: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Record ``source`` as snapshot ``name`` and return its manifest.
+
+        Args:
+            source: Directory to snapshot
+            name: Snapshot name (manifest file stem); must not exist yet
+            ignore: ``shutil.copytree``-style ignore callable
+            previous: Snapshot whose hashes are reused for files with the
+                same size and mtime (defaults to the newest snapshot)
+
+        Raises:
+            BackupStoreError: If the name exists or the snapshot fails
+        """
+        source = Path(source)
+        if self.has_snapshot(name):
+            raise BackupStoreError(f"Snapshot already exists: {name}")
+
+        if previous is None:
+            existing = self.list_snapshots()
+            previous = existing[0] if existing else None
+        known = self.load_manifest(previous)["files"] if previous else {}
+
+        files: Dict[str, Dict[str, Any]] = {}
+        symlinks: Dict[str, str] = {}
+        stored_bytes = 0
+        hashed = 0
+
+        try:
+            for dir_path, dir_names, file_names in os.walk(source):
+                ignored = (
+                    set(ignore(dir_path, dir_names + file_names)) if ignore else set()
+                )
+                rel_dir = Path(dir_path).relative_to(source)
+                entries = [n for n in file_names if n not in ignored]
+                kept_dirs = []
+                for dir_name in dir_names:
+                    if dir_name in ignored:
+                        continue
+                    if os.path.islink(os.path.join(dir_path, dir_name)):
+                        entries.append(dir_name)
+                    else:
+                        kept_dirs.append(dir_name)
+                dir_names[:] = sorted(kept_dirs)
+
+                for entry in sorted(entries):
+                    path = Path(dir_path) / entry
+                    rel_path = (rel_dir / entry).as_posix()
+                    if path.is_symlink():
+                        symlinks[rel_path] = os.readlink(path)
+                        continue
+
+                    st = path.stat()
+                    prior = known.get(rel_path)
+                    if (
+                        prior
+                        and prior["size"] == st.st_size
+                        and prior["mtime_ns"] == st.st_mtime_ns
+                        and self.blob_path(prior["hash"]).exists()
+                    ):
+                        blob_hash = prior["hash"]
+                    else:
+                        blob_hash = hash_file(path)
+                        hashed += 1
+                        if self._store_blob(path, blob_hash):
+                            stored_bytes += st.st_size
+
+                    files[rel_path] = {
+                        "hash": blob_hash,
+                        "size": st.st_size,
+                        "mtime_ns": st.st_mtime_ns,
+                        "mode": stat.S_IMODE(st.st_mode),
+                    }
+        except OSError as e:
+            raise BackupStoreError(f"Failed to snapshot {source}: {e}")
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "name": name,
+            "created": datetime.now().isoformat(),
+            "source": str(source),
+            "previous": previous,
+            "files": files,
+            "symlinks": symlinks,
+            "file_count": len(files),
+            "total_size": sum(f["size"] for f in files.values()),
+            "stored_bytes": stored_bytes,
+            "hashed_files": hashed,
+        }
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        safe_write(self.manifest_path(name), json.dumps(manifest, indent=1))
+        logger.info(
+            f"Snapshot {name}: {len(files)} files, {hashed} hashed, "
+            f"{stored_bytes} new bytes stored"
+        )
+        return manifest
+
+    def _store_blob(self, path: Path, blob_hash: str) -> bool:
+        """Copy path into the store under blob_hash; False if already stored."""
+        target = self.blob_path(blob_hash)
+        if target.exists():
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp, open(path, "rb") as src:
+                shutil.copyfileobj(src, tmp, HASH_CHUNK_SIZE)
+            os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return True
+
+    # ------------------------------------------------------------------
+    # Restore
+    # ------------------------------------------------------------------
+
+    def restore(
+        self,
+        name: str,
+        destination: Union[str, Path],
+        paths: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """
+        Restore files from snapshot ``name`` into ``destination``.
+
+        Args:
+            name: Snapshot to restore from
+            destination: Directory to restore into (existing files are replaced)
+            paths: Vault-relative files or directories to restore (default: all)
+
+        Returns:
+            Restored relative paths
+
+        Raises:
+            BackupStoreError: If a requested path is not in the snapshot or a
+                blob is missing
+        """
+        manifest = self.load_manifest(name)
+        destination = Path(destination)
+        selected = self._select(manifest, paths)
+
+        restored = []
+        for rel_path in selected:
+            target = destination / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.is_symlink() or target.is_file():
+                target.unlink()
+
+            if rel_path in manifest["symlinks"]:
+                os.symlink(manifest["symlinks"][rel_path], target)
+            else:
+                entry = manifest["files"][rel_path]
+                blob = self.blob_path(entry["hash"])
+                if not blob.exists():
+                    raise BackupStoreError(
+                        f"Missing blob {entry['hash']} for {rel_path}"
+                    )
+                shutil.copyfile(blob, target)
+                os.chmod(target, entry["mode"])
+                os.utime(target, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            restored.append(rel_path)
+
+        logger.info(f"Restored {len(restored)} path(s) from snapshot {name}")
+        return restored
+
+    @staticmethod
+    def _select(manifest: Dict[str, Any], paths: Optional[Iterable[str]]) -> List[str]:
+        every = sorted(list(manifest["files"]) + list(manifest["symlinks"]))
+        if paths is None:
+            return every
+
+        selected = []
+        for requested in paths:
+            key = Path(requested).as_posix().strip("/")
+            matches = [p for p in every if p == key or p.startswith(key + "/")]
+            if not matches:
+                raise BackupStoreError(
+                    f"Path not in snapshot {manifest['name']}: {requested}"
+                )
+            selected.extend(m for m in matches if m not in selected)
+        return selected
+
+    # ------------------------------------------------------------------
+    # Sizes, pruning and garbage collection
+    # ------------------------------------------------------------------
+
+    def snapshot_size(self, name: str) -> int:
+        """Logical size in bytes of snapshot ``name``, from its manifest."""
+        return self.load_manifest(name)["total_size"]
+
+    def delete_snapshot(self, name: str) -> None:
+        """Delete a snapshot's manifest; run gc() to reclaim its blobs."""
+        try:
+            self.manifest_path(name).unlink()
+        except FileNotFoundError:
+            raise BackupStoreError(f"Snapshot not found: {name}")
+
+    def refcounts(self) -> Counter:
+        """Number of manifest entries referencing each blob hash."""
+        counts: Counter = Counter()
+        for name in self.list_snapshots():
+            for entry in self.load_manifest(name)["files"].values():
+                counts[entry["hash"]] += 1
+        return counts
+
+    def gc(self, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Delete blobs no manifest references.
+
+        Returns:
+            Dict with ``removed`` blob count and ``freed_bytes``
+        """
+        live = self.refcounts()
+        removed = freed = 0
+        if self.objects_dir.exists():
+            for blob in self.objects_dir.glob("*/*"):
+                if blob.name.startswith(".tmp-") or live[blob.name] > 0:
+                    continue
+                freed += blob.stat().st_size
+                removed += 1
+                if not dry_run:
+                    blob.unlink()
+        logger.info(f"Store gc: {removed} unreferenced blob(s), {freed} bytes")
+        return {"removed": removed, "freed_bytes": freed}
+
+    def stored_size(self) -> int:
+        """Bytes used by all blobs currently in the store."""
+        if not self.objects_dir.exists():
+            return 0
+        return sum(blob.stat().st_size for blob in self.objects_dir.glob("*/*"))
@@ -46,12 +46,16 @@ Version: 1.0.0 (P0-1 TDD Implementation)
 import shutil
 import logging
 import json
+import os
+import stat
 import yaml
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Set, Tuple, Optional
+from typing import List, Dict, Any, Set, Tuple, Optional, Iterable, Iterator, TextIO
 
 # Image linking system integration
 try:
@@ -61,6 +65,71 @@ try:
 except ImportError:
     IMAGE_LINK_SUPPORT = False
 
+from .backup_store import BackupStore
+from .io import safe_write
+from .move_journal import JournalError, MoveJournal
+
+# Copy-on-write clones (reflinks) for snapshots where the filesystem allows it
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:  # pragma: no cover - Windows
+    HAS_FCNTL = False
+
+FICLONE = 0x40049409  # Linux ioctl: clone src into dst (btrfs, XFS, APFS-on-Linux)
+
+
+# Whole-file wiki-link pattern: [[Note]], [[Note#Heading]], [[Note|Alias]], ![[Embed]].
+# Character classes exclude newlines so a match never spans lines.
+WIKI_LINK_PATTERN = re.compile(
+    r"(?P<embed>!?)\[\[(?P<target>[^\]|#\n]+?)(?:#(?P<heading>[^\]|\n]*?))?"
+    r"(?:\|(?P<display>[^\]\n]*?))?\]\]"
+)
+
+# Below this many files process start-up costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 200
+
+# plan_moves: note type → home directory, and the directories it scans
+TYPE_TO_DIRECTORY = {
+    "permanent": "Permanent Notes",
+    "literature": "Literature Notes",
+    "fleeting": "Fleeting Notes",
+}
+PLAN_SCAN_DIRECTORIES = [
+    "Inbox",
+    "Permanent Notes",
+    "Literature Notes",
+    "Fleeting Notes",
+]
+
+# Frontmatter-only reads: chunk size and the point at which we give up
+# looking for the closing delimiter and read the rest of the file
+FRONTMATTER_CHUNK_SIZE = 1024
+FRONTMATTER_READ_LIMIT = 8 * 1024
+
+
+def read_frontmatter_block(path: Path, limit: int = FRONTMATTER_READ_LIMIT) -> str:
+    """
+    Read a note only as far as its frontmatter.
+
+    Returns the text up to and including the closing ``---`` (or just the
+    first three characters when the note has no frontmatter), which is all
+    ``DirectoryOrganizer._parse_frontmatter`` looks at. Frontmatter longer
+    than ``limit`` characters falls back to reading the whole file.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(3)
+        if head != "---":
+            return head
+        while True:
+            chunk = f.read(FRONTMATTER_CHUNK_SIZE)
+            head += chunk
+            if head.find("---", 3) != -1 or not chunk:
+                return head
+            if len(head) >= limit:
+                return head + f.read()
+
 
 class BackupError(Exception):
     """Raised when backup operations fail."""
@@ -121,6 +190,51 @@ class MovePlan:
     link_updates: List[LinkUpdate] = field(default_factory=list)  # P0-3 extension
 
 
+def extract_wiki_links(content: str, pattern: re.Pattern = None) -> List[WikiLink]:
+    """
+    Extract wiki-links from a whole file in one regex pass.
+
+    Line numbers and line-relative positions are derived lazily from match
+    offsets by counting newlines between consecutive matches, so files
+    without links never have their lines counted.
+    """
+    pattern = pattern or WIKI_LINK_PATTERN
+    links = []
+    line_number, line_start, scanned = 1, 0, 0
+
+    for match in pattern.finditer(content):
+        newlines = content.count("\n", scanned, match.start())
+        if newlines:
+            line_number += newlines
+            line_start = content.rfind("\n", scanned, match.start()) + 1
+        scanned = match.start()
+
+        target_note = match.group("target").strip()
+        display_text = match.group("display") or target_note
+        links.append(
+            WikiLink(
+                original_text=match.group(0),
+                target_note=target_note,
+                display_text=display_text.strip(),
+                is_embed=bool(match.group("embed")),
+                line_number=line_number,
+                start_pos=match.start() - line_start,
+                end_pos=match.end() - line_start,
+            )
+        )
+
+    return links
+
+
+def _scan_file_links(md_file: Path) -> Tuple[Path, List[WikiLink], Optional[str]]:
+    """Read and scan one file; module-level so process pools can pickle it."""
+    try:
+        content = md_file.read_text(encoding="utf-8")
+    except Exception as e:
+        return md_file, [], str(e)
+    return md_file, extract_wiki_links(content), None
+
+
 class DirectoryOrganizer:
     """
     Safety-first directory organization system.
@@ -191,6 +305,18 @@ class DirectoryOrganizer:
             except Exception as e:
                 self.logger.warning(f"Could not initialize image link manager: {e}")
 
+        # Link target lookup (normalized stem/suffix → file), built per scan
+        self._target_table: Optional[Dict[str, Path]] = None
+
+        # Counts from the most recent incremental snapshot
+        self.last_snapshot_stats: Optional[Dict[str, int]] = None
+
+        # Content-addressed snapshot store (blobs + manifests) under backup_root
+        self.store = BackupStore(self.backup_root / "store")
+
+        # Per-operation journals for targeted rollback of execute_moves
+        self.journal_root = self.backup_root / "journals"
+
         # P0 Guardrail: Prevent recursive backup nesting
         self._validate_backup_path_not_nested()
 
@@ -306,19 +432,38 @@ class DirectoryOrganizer:
 
         return ignore_function
 
-    def create_backup(self) -> str:
+    def create_backup(self, incremental: bool = False, store: bool = False) -> str:
         """
         Create timestamped backup of entire vault.
 
         Creates a complete copy of the vault with timestamp-based naming
         to ensure uniqueness. Preserves all files, symlinks, and hidden content.
 
+        With ``incremental=True`` the backup is a snapshot against the most
+        recent backup (rsync ``--link-dest`` style): files whose size and mtime
+        are unchanged are hard-linked to the previous snapshot and only new or
+        changed files are copied (reflinked where supported). Each snapshot is
+        still a complete, independently restorable tree. Counts are recorded
+        in ``self.last_snapshot_stats``.
+
+        With ``store=True`` the vault is recorded in the content-addressed
+        store instead (see ``create_store_snapshot``) and the manifest path
+        is returned.
+
+        Args:
+            incremental: Hard-link unchanged files against the previous backup
+            store: Snapshot into the deduplicated backup store
+
         Returns:
-            str: Path to created backup directory
+            str: Path to created backup directory (or snapshot manifest)
 
         Raises:
             BackupError: If backup creation fails
         """
+        if store:
+            name = self.create_store_snapshot()
+            return str(self.store.manifest_path(name))
+
         # Generate timestamp with collision prevention
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         backup_name = f"knowledge-{timestamp}"
@@ -341,6 +486,21 @@ class DirectoryOrganizer:
             if not self.backup_root.is_dir():
                 raise BackupError(f"Cannot create backup directory: {self.backup_root}")
 
+            if incremental:
+                previous = self.list_backups()
+                link_dest = previous[0] if previous else None
+                self.logger.info(
+                    f"Incremental snapshot against: {link_dest or 'none (full copy)'}"
+                )
+                stats = self._snapshot_tree(
+                    backup_path, link_dest, self._create_ignore_function()
+                )
+                self.logger.info(
+                    f"Snapshot created successfully: {stats['linked']} files linked, "
+                    f"{stats['copied']} copied ({stats['bytes_copied']} bytes)"
+                )
+                return str(backup_path)
+
             # Count files for progress logging (before exclusions)
             file_count = sum(1 for _ in self.vault_root.rglob("*") if _.is_file())
             self.logger.info(
@@ -393,20 +553,277 @@ class DirectoryOrganizer:
                     )
             raise BackupError(error_msg)
 
-    def rollback(self, backup_path: str) -> None:
+    def create_store_snapshot(self) -> str:
+        """
+        Record the vault in the content-addressed backup store.
+
+        Only files whose size or mtime changed since the previous snapshot
+        are hashed, and only content not already in the store is written.
+        Exclude patterns apply as for directory backups.
+
+        Returns:
+            str: Name of the new snapshot
+
+        Raises:
+            BackupError: If the snapshot fails
+        """
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        name = f"knowledge-{timestamp}"
+        collision_counter = 0
+        while self.store.has_snapshot(name):
+            collision_counter += 1
+            name = f"knowledge-{timestamp}-{collision_counter:02d}"
+
+        self.logger.info(f"Creating store snapshot: {name}")
+        try:
+            manifest = self.store.snapshot(
+                self.vault_root, name, ignore=self._create_ignore_function()
+            )
+        except Exception as e:
+            error_msg = f"Failed to create store snapshot: {e}"
+            self.logger.error(error_msg)
+            raise BackupError(error_msg)
+
+        self.last_snapshot_stats = {
+            "files": manifest["file_count"],
+            "hashed": manifest["hashed_files"],
+            "total_size": manifest["total_size"],
+            "bytes_stored": manifest["stored_bytes"],
+        }
+        return name
+
+    def list_snapshots(self) -> List[str]:
+        """List store snapshot names, newest first."""
+        return self.store.list_snapshots()
+
+    def restore_snapshot(self, name: str, paths: List[str] = None) -> List[str]:
+        """
+        Restore files from a store snapshot into the vault.
+
+        Unlike ``rollback`` this leaves every other vault file untouched, so a
+        single note or folder can be recovered.
+
+        Args:
+            name: Snapshot name (as returned by ``list_snapshots``)
+            paths: Vault-relative files or folders to restore (default: all)
+
+        Returns:
+            List of restored vault-relative paths
+
+        Raises:
+            BackupError: If the snapshot or a requested path does not exist
+        """
+        try:
+            return self.store.restore(name, self.vault_root, paths)
+        except Exception as e:
+            error_msg = f"Failed to restore from snapshot {name}: {e}"
+            self.logger.error(error_msg)
+            raise BackupError(error_msg)
+
+    def _rollback_paths(self, backup_path: Path, paths: List[str]) -> None:
+        """Restore selected paths from a directory backup."""
+        missing = [p for p in paths if not (backup_path / p).exists()]
+        if not backup_path.is_dir() or missing:
+            error_msg = f"Paths not found in backup {backup_path}: {missing or paths}"
+            self.logger.error(error_msg)
+            raise BackupError(error_msg)
+
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        emergency_backup = self.backup_root / f"emergency-before-rollback-{timestamp}"
+        collision_counter = 0
+        while emergency_backup.exists():
+            collision_counter += 1
+            emergency_backup = self.backup_root / (
+                f"emergency-before-rollback-{timestamp}-{collision_counter:02d}"
+            )
+
+        try:
+            for rel_path in paths:
+                current = self.vault_root / rel_path
+                saved = emergency_backup / rel_path
+                if current.is_dir() and not current.is_symlink():
+                    shutil.copytree(current, saved, symlinks=True)
+                elif current.exists() or current.is_symlink():
+                    saved.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(current, saved, follow_symlinks=False)
+
+            for rel_path in paths:
+                source = backup_path / rel_path
+                target = self.vault_root / rel_path
+                if target.is_dir() and not target.is_symlink():
+                    shutil.rmtree(target)
+                elif target.exists() or target.is_symlink():
+                    target.unlink()
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if source.is_dir() and not source.is_symlink():
+                    shutil.copytree(source, target, symlinks=True)
+                else:
+                    shutil.copy2(source, target, follow_symlinks=False)
+
+        except Exception as e:
+            error_msg = f"Failed to rollback paths {paths}: {e}"
+            self.logger.error(error_msg)
+            if emergency_backup.exists():
+                self.logger.error(f"Emergency backup available at: {emergency_backup}")
+            raise BackupError(error_msg)
+
+        shutil.rmtree(emergency_backup, ignore_errors=True)
+        self.logger.info(f"Rolled back {len(paths)} path(s) from {backup_path}")
+
+    def _snapshot_tree(
+        self, destination: Path, link_dest: Optional[Path] = None, ignore=None
+    ) -> Dict[str, int]:
+        """
+        Snapshot the vault into destination, hard-linking unchanged files.
+
+        A file is unchanged when ``link_dest`` holds a regular file at the same
+        relative path with the same size and mtime (copy2 preserves mtimes, so
+        snapshot files keep the vault's). Everything else is cloned or copied.
+        Symlinks are recreated as symlinks, as with ``copytree(symlinks=True)``.
+
+        Returns:
+            Dict with ``files``, ``linked``, ``copied`` and ``bytes_copied``
+        """
+        stats = {"files": 0, "linked": 0, "copied": 0, "bytes_copied": 0}
+        copied_dirs = []
+
+        try:
+            for dir_path, dir_names, file_names in os.walk(self.vault_root):
+                rel_dir = Path(dir_path).relative_to(self.vault_root)
+                target_dir = destination / rel_dir
+                target_dir.mkdir(parents=True, exist_ok=rel_dir != Path("."))
+                copied_dirs.append((Path(dir_path), target_dir))
+
+                ignored = (
+                    set(ignore(dir_path, dir_names + file_names)) if ignore else set()
+                )
+                entries = [n for n in file_names if n not in ignored]
+                kept_dirs = []
+                for name in dir_names:
+                    if name in ignored:
+                        continue
+                    if os.path.islink(os.path.join(dir_path, name)):
+                        entries.append(name)
+                    else:
+                        kept_dirs.append(name)
+                dir_names[:] = kept_dirs
+
+                for name in entries:
+                    src = Path(dir_path) / name
+                    dst = target_dir / name
+                    if src.is_symlink():
+                        os.symlink(os.readlink(src), dst)
+                        continue
+
+                    src_stat = src.stat()
+                    stats["files"] += 1
+                    if link_dest is not None and self._link_unchanged(
+                        link_dest / rel_dir / name, dst, src_stat
+                    ):
+                        stats["linked"] += 1
+                        continue
+
+                    self._clone_file(src, dst)
+                    stats["copied"] += 1
+                    stats["bytes_copied"] += src_stat.st_size
+
+            # Directory mtimes change as entries are added, so copy them last
+            for src_dir, target_dir in reversed(copied_dirs):
+                shutil.copystat(src_dir, target_dir)
+
+        except Exception:
+            if destination.exists():
+                shutil.rmtree(destination, ignore_errors=True)
+            raise
+
+        self.last_snapshot_stats = stats
+        return stats
+
+    @staticmethod
+    def _link_unchanged(previous: Path, dst: Path, src_stat: os.stat_result) -> bool:
+        """Hard-link previous to dst if it matches src_stat; False otherwise."""
+        try:
+            prev_stat = os.lstat(previous)
+        except OSError:
+            return False
+        if (
+            not stat.S_ISREG(prev_stat.st_mode)
+            or prev_stat.st_size != src_stat.st_size
+            or prev_stat.st_mtime_ns != src_stat.st_mtime_ns
+        ):
+            return False
+        try:
+            os.link(previous, dst)
+        except OSError:
+            # Cross-device, link-count limit or no hard-link support
+            return False
+        return True
+
+    @staticmethod
+    def _clone_file(src: Path, dst: Path) -> None:
+        """Copy src to dst with metadata, as a reflink when the filesystem can."""
+        if HAS_FCNTL:
+            try:
+                with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                    fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                pass  # Not supported here; fall through to a byte copy
+        shutil.copy2(src, dst)
+
+    def list_operations(self) -> List[str]:
+        """List journaled execute_moves operation ids, newest first."""
+        return MoveJournal.list_operations(self.journal_root)
+
+    def rollback_operation(self, operation_id: str) -> List[str]:
+        """
+        Undo a single execute_moves operation from its journal.
+
+        Moves are reversed and edited files restored from their journaled
+        originals, newest step first; directories the operation created are
+        removed if empty. Only the touched paths are copied to an emergency
+        area beforehand. The rest of the vault is not read or written.
+
+        Args:
+            operation_id: Id returned as ``operation_id`` by execute_moves
+
+        Returns:
+            List of restored vault-relative paths
+
+        Raises:
+            BackupError: If the journal is missing or a step cannot be undone
+        """
+        self.logger.info(f"Rolling back operation: {operation_id}")
+        try:
+            journal = MoveJournal.load(self.vault_root, self.journal_root, operation_id)
+            return journal.rollback()
+        except Exception as e:
+            error_msg = f"Failed to rollback operation {operation_id}: {e}"
+            self.logger.error(error_msg)
+            raise BackupError(error_msg)
+
+    def rollback(self, backup_path: str, paths: List[str] = None) -> None:
         """
         Rollback vault to previous backup state.
 
         Completely replaces the current vault with the contents of the specified
         backup. This is a destructive operation - use with caution!
 
+        With ``paths`` only those vault-relative files or folders are restored
+        from the backup (and only they are emergency-copied first); everything
+        else in the vault is left as is.
+
         Args:
             backup_path: Path to backup directory to restore from
+            paths: Optional vault-relative files/folders to restore
 
         Raises:
             BackupError: If rollback fails
         """
         backup_path_obj = Path(backup_path)
+        if paths is not None:
+            return self._rollback_paths(backup_path_obj, paths)
 
         # Comprehensive validation of backup
         if not backup_path_obj.exists():
@@ -433,24 +850,18 @@ class DirectoryOrganizer:
         emergency_backup = None
         try:
             if self.vault_root.exists():
-                current_file_count = sum(
-                    1 for _ in self.vault_root.rglob("*") if _.is_file()
-                )
-                self.logger.info(
-                    f"Creating emergency backup of current state ({current_file_count} files)"
-                )
+                self.logger.info("Creating emergency backup of current state")
 
                 timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
                 emergency_backup_name = f"emergency-before-rollback-{timestamp}"
                 emergency_backup = self.backup_root / emergency_backup_name
 
-                shutil.copytree(
-                    src=self.vault_root,
-                    dst=emergency_backup,
-                    symlinks=True,
-                    ignore_dangling_symlinks=True,
+                # Files unchanged since the target backup are hard-linked to it
+                stats = self._snapshot_tree(emergency_backup, link_dest=backup_path_obj)
+                self.logger.info(
+                    f"Emergency backup created: {emergency_backup} "
+                    f"({stats['files']} files, {stats['linked']} linked)"
                 )
-                self.logger.info(f"Emergency backup created: {emergency_backup}")
 
         except Exception as e:
             self.logger.warning(f"Failed to create emergency backup: {e}")
@@ -542,6 +953,11 @@ class DirectoryOrganizer:
                 - execution_time_seconds: Total execution time
                 - status: 'success', 'success_no_moves_needed', or error details
                 - validation_results: Summary of pre-execution validation
+                - operation_id: Journal id for ``rollback_operation``
+
+        Every move and edit is journaled before it happens, so a failed run is
+        undone by reversing just those steps (``rollback_operation``); the full
+        ``rollback`` from backup is only the fallback.
 
         Raises:
             BackupError: If backup creation, validation, or file operations fail
@@ -586,8 +1002,13 @@ class DirectoryOrganizer:
         execution_start = datetime.now()
         moves_executed = 0
         files_processed = 0
+        journal = None
 
         try:
+            journal = MoveJournal.begin(
+                self.vault_root, self.journal_root, backup_path=backup_path
+            )
+
             # Use move plan if available, otherwise create minimal plan
             if validate_first:
                 moves_to_execute = move_plan.moves
@@ -597,11 +1018,25 @@ class DirectoryOrganizer:
 
             self.logger.info(f"Executing {len(moves_to_execute)} file moves")
 
+            # Rewrite links to renamed notes first, while referencing files
+            # are still at the paths the link index recorded
+            link_results = {"files_rewritten": 0, "links_rewritten": 0}
+            if move_plan.link_updates:
+                link_results = self.apply_link_updates(
+                    move_plan.link_updates, journal=journal
+                )
+
+            # Index vault filenames once for the pre-flight embed checks;
+            # moving notes does not change which media files exist
+            if self.image_manager and moves_to_execute:
+                self.image_manager.refresh_media_index()
+
             # Progress tracking setup
             total_moves = len(moves_to_execute)
 
             for i, move in enumerate(moves_to_execute, 1):
                 # Ensure target directory exists
+                journal.record_mkdir(move.target.parent)
                 move.target.parent.mkdir(parents=True, exist_ok=True)
 
                 # Verify source still exists (race condition protection)
@@ -646,7 +1081,9 @@ class DirectoryOrganizer:
                                 content, move.source, move.target
                             )
                         )
-                        move.source.write_text(updated_content, encoding="utf-8")
+                        if updated_content != content:
+                            journal.record_edit(move.source)
+                            move.source.write_text(updated_content, encoding="utf-8")
                         self.logger.debug(
                             f"Updated image links for: {move.source.name}"
                         )
@@ -657,6 +1094,7 @@ class DirectoryOrganizer:
                         # Continue with move even if image link update fails
 
                 try:
+                    journal.record_move(move.source, move.target)
                     shutil.move(str(move.source), str(move.target))
                     self.logger.debug(f"Successfully moved: {move.source.name}")
                 except Exception as move_error:
@@ -679,6 +1117,7 @@ class DirectoryOrganizer:
                         )
 
             execution_time = (datetime.now() - execution_start).total_seconds()
+            journal.finish("success")
 
             self.logger.info(
                 f"Successfully executed {moves_executed} moves in {execution_time:.2f} seconds"
@@ -692,6 +1131,9 @@ class DirectoryOrganizer:
                 "backup_path": backup_path,
                 "execution_time_seconds": execution_time,
                 "status": "success",
+                "operation_id": journal.operation_id,
+                "links_rewritten": link_results["links_rewritten"],
+                "files_rewritten": link_results["files_rewritten"],
                 "validation_results": {
                     "total_moves_planned": len(moves_to_execute),
                     "conflicts_detected": len(getattr(move_plan, "conflicts", [])),
@@ -705,14 +1147,23 @@ class DirectoryOrganizer:
         except Exception as e:
             self.logger.error(f"Error during file move execution: {e}")
 
-            # Rollback on error if requested and backup exists
-            if rollback_on_error and backup_path:
+            # Rollback on error: undo journaled steps, full restore as fallback
+            if rollback_on_error and (journal or backup_path):
                 self.logger.info("Rolling back due to execution error")
                 try:
-                    self.rollback(backup_path)
-                    self.logger.info("Rollback completed successfully")
-                except Exception as rollback_error:
-                    self.logger.error(f"Rollback failed: {rollback_error}")
+                    if journal is None:
+                        raise BackupError("No journal for this operation")
+                    journal.finish("failed")
+                    self.rollback_operation(journal.operation_id)
+                    self.logger.info("Targeted rollback completed successfully")
+                except Exception as targeted_error:
+                    self.logger.warning(f"Targeted rollback failed: {targeted_error}")
+                    if backup_path:
+                        try:
+                            self.rollback(backup_path)
+                            self.logger.info("Rollback completed successfully")
+                        except Exception as rollback_error:
+                            self.logger.error(f"Rollback failed: {rollback_error}")
 
             raise BackupError(f"File move execution failed: {e}")
 
@@ -724,6 +1175,10 @@ class DirectoryOrganizer:
         plan for organizing files based on their type field. Uses robust YAML
         parsing and provides detailed conflict detection and reporting.
 
+        The full list of moves is needed here for link-update analysis and
+        execute_moves; to only report the moves, ``write_dry_run_report``
+        streams them from ``iter_moves`` instead.
+
         P0-2 Features:
         - Comprehensive YAML frontmatter parsing with error handling
         - Type-based move planning (permanent/literature/fleeting → correct directories)
@@ -739,110 +1194,18 @@ class DirectoryOrganizer:
         """
         self.logger.info("Starting comprehensive dry run analysis")
 
-        moves = []
-        conflicts = []
-        unknown_types = []
-        malformed_files = []
-
-        # Enhanced type to directory mapping
-        type_to_dir = {
-            "permanent": "Permanent Notes",
-            "literature": "Literature Notes",
-            "fleeting": "Fleeting Notes",
-        }
-
-        # Statistics tracking
-        total_files = 0
-        files_with_frontmatter = 0
-        correctly_placed_files = 0
+        plan = MovePlan(
+            moves=[], conflicts=[], unknown_types=[], malformed_files=[], summary={}
+        )
 
         try:
-            # Scan all directories for markdown files
-            directories_to_scan = [
-                self.vault_root / "Inbox",
-                self.vault_root / "Permanent Notes",
-                self.vault_root / "Literature Notes",
-                self.vault_root / "Fleeting Notes",
-            ]
-
-            for directory in directories_to_scan:
-                if not directory.exists():
-                    self.logger.info(
-                        f"Directory does not exist, will be created: {directory}"
-                    )
-                    continue
-
-                self.logger.debug(f"Scanning directory: {directory}")
-
-                for md_file in directory.glob("*.md"):
-                    total_files += 1
-
-                    try:
-                        content = md_file.read_text(encoding="utf-8")
-                    except UnicodeDecodeError:
-                        self.logger.warning(
-                            f"Unable to decode file as UTF-8: {md_file}"
-                        )
-                        malformed_files.append(md_file)
-                        continue
-                    except PermissionError:
-                        self.logger.warning(
-                            f"Permission denied reading file: {md_file}"
-                        )
-                        malformed_files.append(md_file)
-                        continue
-
-                    # Parse YAML frontmatter with comprehensive error handling
-                    frontmatter_data = self._parse_frontmatter(content, md_file)
-
-                    if frontmatter_data is None:
-                        # No frontmatter or parsing failed
-                        continue
-
-                    files_with_frontmatter += 1
-
-                    # Extract and validate type field
-                    file_type = frontmatter_data.get("type", "").strip().lower()
-
-                    if not isinstance(file_type, str) or not file_type:
-                        self.logger.debug(
-                            f"Invalid type value in {md_file}: {file_type}"
-                        )
-                        malformed_files.append(md_file)
-                        continue
-
-                    # Check if file needs to be moved
-                    current_dir = md_file.parent.name
-                    expected_dir = type_to_dir.get(file_type)
-
-                    if file_type not in type_to_dir:
-                        unknown_types.append(md_file)
-                        continue
-
-                    if current_dir == expected_dir:
-                        correctly_placed_files += 1
-                        continue
-
-                    # File needs to be moved
-                    target_dir = self.vault_root / expected_dir
-                    target_path = target_dir / md_file.name
-
-                    # Check for conflicts
-                    if target_path.exists():
-                        conflict_msg = f"Target already exists: {target_path}"
-                        self.logger.warning(conflict_msg)
-                        conflicts.append(conflict_msg)
-                        continue
-
-                    # Create move operation
-                    move_reason = f"Type '{file_type}' belongs in {expected_dir}/"
-                    moves.append(
-                        MoveOperation(
-                            source=md_file, target=target_path, reason=move_reason
-                        )
-                    )
-
-                    self.logger.debug(f"Planned move: {md_file.name} → {expected_dir}/")
+            moves = list(self.iter_moves(plan=plan))
+            conflicts = plan.conflicts
+            unknown_types = plan.unknown_types
+            malformed_files = plan.malformed_files
+            total_files = plan.summary["total_files"]
+            files_with_frontmatter = plan.summary["files_with_frontmatter"]
+            correctly_placed_files = plan.summary["correctly_placed_files"]
 
             # Generate comprehensive summary
             summary = {
@@ -909,6 +1272,129 @@ class DirectoryOrganizer:
             self.logger.error(error_msg)
             raise BackupError(error_msg)
 
+    def iter_moves(
+        self, workers: Optional[int] = None, plan: Optional[MovePlan] = None
+    ) -> Iterator[MoveOperation]:
+        """
+        Yield planned moves as notes are classified.
+
+        Notes are classified on a thread pool from a frontmatter-only read
+        (see ``read_frontmatter_block``), with a bounded number of files in
+        flight, so the first moves arrive immediately and memory stays flat
+        on huge vaults. Results are yielded in scan order.
+
+        Args:
+            workers: Classifier threads (default: min(32, CPU count + 4))
+            plan: Optional MovePlan that collects conflicts, unknown types,
+                malformed files and counters (``summary``) while iterating
+
+        Yields:
+            MoveOperation for each note outside its type's directory
+        """
+        if plan is not None:
+            plan.summary.update(
+                total_files=0, files_with_frontmatter=0, correctly_placed_files=0
+            )
+
+        def note_files() -> Iterator[Path]:
+            for directory_name in PLAN_SCAN_DIRECTORIES:
+                directory = self.vault_root / directory_name
+                if not directory.exists():
+                    self.logger.info(
+                        f"Directory does not exist, will be created: {directory}"
+                    )
+                    continue
+                self.logger.debug(f"Scanning directory: {directory}")
+                yield from directory.glob("*.md")
+
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 1) + 4)
+
+        for md_file, (outcome, detail) in self._bounded_map(
+            self._classify_note, note_files(), workers
+        ):
+            if plan is not None:
+                plan.summary["total_files"] += 1
+                if outcome != "no_frontmatter" and detail != "unreadable":
+                    plan.summary["files_with_frontmatter"] += 1
+
+            if outcome == "move":
+                self.logger.debug(
+                    f"Planned move: {md_file.name} → {detail.target.parent.name}/"
+                )
+                yield detail
+            elif plan is None:
+                continue
+            elif outcome == "conflict":
+                plan.conflicts.append(detail)
+            elif outcome == "unknown":
+                plan.unknown_types.append(md_file)
+            elif outcome == "malformed":
+                plan.malformed_files.append(md_file)
+            elif outcome == "correct":
+                plan.summary["correctly_placed_files"] += 1
+
+    @staticmethod
+    def _bounded_map(func, items: Iterable, workers: int):
+        """Like ThreadPoolExecutor.map, yielding (item, result) in order with
+        at most ``workers * 4`` items in flight."""
+        if workers <= 1:
+            for item in items:
+                yield item, func(item)
+            return
+
+        window = workers * 4
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for item in items:
+                pending.append((item, pool.submit(func, item)))
+                if len(pending) >= window:
+                    item, future = pending.popleft()
+                    yield item, future.result()
+            while pending:
+                item, future = pending.popleft()
+                yield item, future.result()
+
+    def _classify_note(self, md_file: Path) -> Tuple[str, Any]:
+        """Decide what plan_moves should do with one note (thread-safe)."""
+        try:
+            head = read_frontmatter_block(md_file)
+        except UnicodeDecodeError:
+            self.logger.warning(f"Unable to decode file as UTF-8: {md_file}")
+            return "malformed", "unreadable"
+        except PermissionError:
+            self.logger.warning(f"Permission denied reading file: {md_file}")
+            return "malformed", "unreadable"
+
+        # Parse YAML frontmatter with comprehensive error handling
+        frontmatter_data = self._parse_frontmatter(head, md_file)
+        if frontmatter_data is None:
+            return "no_frontmatter", None
+
+        # Extract and validate type field
+        file_type = frontmatter_data.get("type", "")
+        file_type = file_type.strip().lower() if isinstance(file_type, str) else ""
+        if not file_type:
+            self.logger.debug(f"Invalid type value in {md_file}: {file_type}")
+            return "malformed", "invalid_type"
+
+        expected_dir = TYPE_TO_DIRECTORY.get(file_type)
+        if expected_dir is None:
+            return "unknown", file_type
+        if md_file.parent.name == expected_dir:
+            return "correct", None
+
+        target_path = self.vault_root / expected_dir / md_file.name
+        if target_path.exists():
+            conflict_msg = f"Target already exists: {target_path}"
+            self.logger.warning(conflict_msg)
+            return "conflict", conflict_msg
+
+        move_reason = f"Type '{file_type}' belongs in {expected_dir}/"
+        return "move", MoveOperation(
+            source=md_file, target=target_path, reason=move_reason
+        )
+
     def _parse_frontmatter(self, content: str, file_path: Path) -> Dict[str, Any]:
         """
         Parse YAML frontmatter from markdown content with comprehensive error handling.
@@ -999,41 +1485,109 @@ class DirectoryOrganizer:
 
     def _generate_markdown_report(self, move_plan: MovePlan) -> str:
         """Generate Markdown format report."""
-        lines = [
+        lines = self._markdown_header_lines(move_plan.summary["vault_root"])
+        lines += self._markdown_summary_lines(move_plan.summary)
+        lines += ["## Planned Moves", ""]
+
+        if move_plan.moves:
+            lines.extend(self._MARKDOWN_MOVES_TABLE)
+            lines.extend(self._markdown_move_row(move) for move in move_plan.moves)
+        else:
+            lines.append("*No moves needed - all files are properly organized!*")
+
+        lines += self._markdown_issue_lines(move_plan, bool(move_plan.moves))
+        return "\n".join(lines)
+
+    def write_dry_run_report(
+        self, out: TextIO, workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Stream the Markdown dry run report to out while notes are classified.
+
+        Each planned move is written as soon as ``iter_moves`` yields it and
+        no list of moves is kept, so on a huge vault the first rows appear
+        immediately. The summary therefore follows the moves table, and the
+        link-update analysis (which needs every move) is left to plan_moves.
+
+        Args:
+            out: Text stream to write to (e.g. sys.stdout)
+            workers: Classifier threads, as for iter_moves
+
+        Returns:
+            The report summary (plan_moves' keys, without link statistics)
+        """
+        plan = MovePlan(
+            moves=[], conflicts=[], unknown_types=[], malformed_files=[], summary={}
+        )
+        out.write(
+            "\n".join(
+                self._markdown_header_lines(str(self.vault_root))
+                + ["## Planned Moves", ""]
+            )
+            + "\n"
+        )
+        total_moves = 0
+        for move in self.iter_moves(workers=workers, plan=plan):
+            if not total_moves:
+                out.write("\n".join(self._MARKDOWN_MOVES_TABLE) + "\n")
+            total_moves += 1
+            out.write(self._markdown_move_row(move) + "\n")
+            out.flush()
+        if not total_moves:
+            out.write("*No moves needed - all files are properly organized!*\n")
+
+        plan.summary.update(
+            total_moves=total_moves,
+            conflicts=len(plan.conflicts),
+            unknown_types=len(plan.unknown_types),
+            malformed_files=len(plan.malformed_files),
+            vault_root=str(self.vault_root),
+            analysis_timestamp=datetime.now().isoformat(),
+        )
+        lines = [""] + self._markdown_summary_lines(plan.summary)
+        lines += self._markdown_issue_lines(plan, total_moves > 0)
+        out.write("\n".join(lines).rstrip("\n") + "\n")
+        out.flush()
+        return plan.summary
+
+    _MARKDOWN_MOVES_TABLE = (
+        "| Current Path | Target Path | Reason |",
+        "|--------------|-------------|--------|",
+    )
+
+    @staticmethod
+    def _markdown_header_lines(vault_root: str) -> List[str]:
+        return [
             "# Directory Organization Dry Run Report",
             "",
             f'**Generated**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
-            f'**Vault**: {move_plan.summary["vault_root"]}',
+            f"**Vault**: {vault_root}",
             "",
+        ]
+
+    @staticmethod
+    def _markdown_summary_lines(summary: Dict[str, Any]) -> List[str]:
+        return [
             "## Summary",
             "",
-            f'- **Total files analyzed**: {move_plan.summary["total_files"]}',
-            f'- **Files with frontmatter**: {move_plan.summary["files_with_frontmatter"]}',
-            f'- **Correctly placed files**: {move_plan.summary["correctly_placed_files"]}',
-            f'- **Moves planned**: {move_plan.summary["total_moves"]}',
-            f'- **Conflicts detected**: {move_plan.summary["conflicts"]}',
-            f'- **Unknown types**: {move_plan.summary["unknown_types"]}',
-            f'- **Malformed files**: {move_plan.summary["malformed_files"]}',
-            "",
-            "## Planned Moves",
+            f'- **Total files analyzed**: {summary["total_files"]}',
+            f'- **Files with frontmatter**: {summary["files_with_frontmatter"]}',
+            f'- **Correctly placed files**: {summary["correctly_placed_files"]}',
+            f'- **Moves planned**: {summary["total_moves"]}',
+            f'- **Conflicts detected**: {summary["conflicts"]}',
+            f'- **Unknown types**: {summary["unknown_types"]}',
+            f'- **Malformed files**: {summary["malformed_files"]}',
             "",
         ]
 
-        if move_plan.moves:
-            lines.extend(
-                [
-                    "| Current Path | Target Path | Reason |",
-                    "|--------------|-------------|--------|",
-                ]
-            )
-
-            for move in move_plan.moves:
-                source_rel = move.source.relative_to(self.vault_root)
-                target_rel = move.target.relative_to(self.vault_root)
-                lines.append(f"| {source_rel} | {target_rel} | {move.reason} |")
-        else:
-            lines.append("*No moves needed - all files are properly organized!*")
+    def _markdown_move_row(self, move: MoveOperation) -> str:
+        source_rel = move.source.relative_to(self.vault_root)
+        target_rel = move.target.relative_to(self.vault_root)
+        return f"| {source_rel} | {target_rel} | {move.reason} |"
 
+    def _markdown_issue_lines(self, move_plan: MovePlan, has_moves: bool) -> List[str]:
+        """Unknown types, malformed files, conflicts and the safety notice."""
+        lines: List[str] = []
         if move_plan.unknown_types:
             lines.extend(["", "## Unknown Types", ""])
             for file_path in move_plan.unknown_types:
@@ -1054,7 +1608,7 @@ class DirectoryOrganizer:
                 lines.append(f"- {conflict}")
 
         # Add safety notice
-        if move_plan.moves or move_plan.conflicts:
+        if has_moves or move_plan.conflicts:
             lines.extend(
                 [
                     "",
@@ -1065,20 +1619,25 @@ class DirectoryOrganizer:
                     "",
                 ]
             )
+        return lines
 
-        return "\n".join(lines)
-
-    def scan_wiki_links(self) -> LinkIndex:
+    def scan_wiki_links(self, workers: Optional[int] = None) -> LinkIndex:
         """
         Scan entire vault for wiki-style links and create comprehensive index.
 
         P0-3 Features:
         - Comprehensive regex patterns for all wiki-link variants
         - Support for [[Note]], [[Note|Alias]], [[Note#Heading]], ![[Embed]]
-        - Line-by-line scanning with position tracking
+        - Whole-file scanning with line/position tracking
         - Broken link detection and reporting
         - Bidirectional link mapping (file → links, target → referencing files)
 
+        Files are scanned across a process pool once the vault has at least
+        PARALLEL_SCAN_MIN_FILES notes; smaller vaults are scanned in-process.
+
+        Args:
+            workers: Scanner processes (defaults to CPU count; 1 disables the pool)
+
         Returns:
             LinkIndex: Complete index of all wiki-links in vault
 
@@ -1087,43 +1646,31 @@ class DirectoryOrganizer:
         """
         self.logger.info("Starting comprehensive wiki-link scanning")
 
-        # Comprehensive regex patterns for all wiki-link variants
-        wiki_link_patterns = [
-            # Standard links: [[Note Name]], [[Note Name|Display Text]]
-            r"(?P<embed>!?)\[\[(?P<target>[^\]|#]+?)(?:#(?P<heading>[^\]|]*?))?(?:\|(?P<display>[^\]]*?))?\]\]",
-        ]
-
         link_index = LinkIndex()
 
         try:
             # Get all markdown files in vault
             all_md_files = list(self.vault_root.rglob("*.md"))
             self.logger.info(f"Scanning {len(all_md_files)} files for wiki-links")
+            self._build_target_table(all_md_files)
 
-            for md_file in all_md_files:
-                try:
-                    content = md_file.read_text(encoding="utf-8")
-                    file_links = self._extract_wiki_links(
-                        content, md_file, wiki_link_patterns
-                    )
-
-                    if file_links:
-                        link_index.links_by_file[md_file] = file_links
-
-                        # Build reverse index (target → referencing files)
-                        for link in file_links:
-                            target_key = self._normalize_link_target(link.target_note)
+            for md_file, file_links, error in self._scan_files(all_md_files, workers):
+                if error:
+                    self.logger.warning(f"Failed to scan links in {md_file}: {error}")
+                    continue
+                if not file_links:
+                    continue
 
-                            if target_key not in link_index.links_to_file:
-                                link_index.links_to_file[target_key] = set()
-                            link_index.links_to_file[target_key].add(md_file)
+                link_index.links_by_file[md_file] = file_links
 
-                            # Check if target exists
-                            if not self._find_target_file(link.target_note):
-                                link_index.broken_links.add((md_file, link.target_note))
+                # Build reverse index (target → referencing files)
+                for link in file_links:
+                    target_key = self._normalize_link_target(link.target_note)
+                    link_index.links_to_file.setdefault(target_key, set()).add(md_file)
 
-                except Exception as e:
-                    self.logger.warning(f"Failed to scan links in {md_file}: {e}")
+                    # Check if target exists
+                    if not self._find_target_file(link.target_note):
+                        link_index.broken_links.add((md_file, link.target_note))
 
             # Log statistics
             total_links = sum(len(links) for links in link_index.links_by_file.values())
@@ -1138,46 +1685,41 @@ class DirectoryOrganizer:
             self.logger.error(error_msg)
             raise BackupError(error_msg)
 
+    def _scan_files(self, md_files: List[Path], workers: Optional[int] = None):
+        """Return (file, links, error) for each file, in input order."""
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers > 1 and len(md_files) >= PARALLEL_SCAN_MIN_FILES:
+            chunksize = max(1, len(md_files) // (workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(
+                        pool.map(_scan_file_links, md_files, chunksize=chunksize)
+                    )
+            except (OSError, RuntimeError) as e:
+                self.logger.warning(
+                    f"Parallel link scan unavailable ({e}); scanning in-process"
+                )
+
+        return [_scan_file_links(md_file) for md_file in md_files]
+
     def _extract_wiki_links(
-        self, content: str, file_path: Path, patterns: List[str]
+        self, content: str, file_path: Path, patterns: List[str] = None
     ) -> List[WikiLink]:
         """Extract wiki-links from file content using regex patterns."""
-        links = []
-        lines = content.split("\n")
-
-        for line_num, line in enumerate(lines, 1):
+        if patterns:
+            links = []
             for pattern in patterns:
-                for match in re.finditer(pattern, line):
-                    embed_marker = match.group("embed")
-                    target_note = match.group("target").strip()
-                    heading = (
-                        match.group("heading")
-                        if "heading" in match.groupdict() and match.group("heading")
-                        else ""
-                    )
-                    display_text = (
-                        match.group("display")
-                        if "display" in match.groupdict() and match.group("display")
-                        else target_note
-                    )
-
-                    # Include heading in target if present
-                    full_target = f"{target_note}#{heading}" if heading else target_note
-
-                    wiki_link = WikiLink(
-                        original_text=match.group(0),
-                        target_note=target_note,
-                        display_text=display_text.strip(),
-                        is_embed=bool(embed_marker),
-                        line_number=line_num,
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                    )
+                links.extend(extract_wiki_links(content, re.compile(pattern)))
+        else:
+            links = extract_wiki_links(content)
 
-                    links.append(wiki_link)
-                    self.logger.debug(
-                        f"Found link in {file_path.name}:{line_num}: {wiki_link.original_text}"
-                    )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for link in links:
+                self.logger.debug(
+                    f"Found link in {file_path.name}:{link.line_number}: {link.original_text}"
+                )
 
         return links
 
@@ -1192,23 +1734,35 @@ class DirectoryOrganizer:
 
         return target.strip().lower()
 
-    def _find_target_file(self, target_note: str) -> Path:
-        """Find the actual file that corresponds to a link target."""
-        normalized_target = self._normalize_link_target(target_note)
+    def _build_target_table(self, md_files: List[Path] = None) -> Dict[str, Path]:
+        """
+        Build the link target lookup table for the vault in one pass.
 
-        # Search for files with matching names
-        for md_file in self.vault_root.rglob("*.md"):
-            file_stem = md_file.stem.lower()
+        Maps each normalized file stem, and every ``-``-separated suffix of it
+        (so ``[[note-name]]`` finds ``fleeting-20250816-note-name.md``), to its
+        file. Exact stems take precedence over suffix matches; otherwise the
+        first file in scan order wins.
+        """
+        if md_files is None:
+            md_files = list(self.vault_root.rglob("*.md"))
 
-            # Direct name match
-            if file_stem == normalized_target:
-                return md_file
+        table: Dict[str, Path] = {}
+        for md_file in md_files:
+            table.setdefault(md_file.stem.lower(), md_file)
 
-            # Handle files with prefixes (like fleeting-20250816-note-name)
-            if file_stem.endswith(f"-{normalized_target}"):
-                return md_file
+        for md_file in md_files:
+            parts = md_file.stem.lower().split("-")
+            for i in range(1, len(parts)):
+                table.setdefault("-".join(parts[i:]), md_file)
 
-        return None
+        self._target_table = table
+        return table
+
+    def _find_target_file(self, target_note: str) -> Path:
+        """Find the actual file that corresponds to a link target."""
+        if self._target_table is None:
+            self._build_target_table()
+        return self._target_table.get(self._normalize_link_target(target_note))
 
     def plan_link_updates(
         self, move_plan: MovePlan, link_index: LinkIndex
@@ -1228,28 +1782,35 @@ class DirectoryOrganizer:
         """
         link_updates = []
 
-        # Create mapping of old path → new path for moved files
-        move_mapping = {str(move.source): str(move.target) for move in move_plan.moves}
-
         self.logger.info(f"Planning link updates for {len(move_plan.moves)} file moves")
 
+        if self._target_table is None:
+            self._build_target_table()
+
+        # Invert the lookup table once: file → every link key resolving to it
+        keys_by_file: Dict[Path, List[str]] = {}
+        for key, target_file in self._target_table.items():
+            keys_by_file.setdefault(target_file, []).append(key)
+
         for move in move_plan.moves:
             old_name = move.source.stem
             new_name = move.target.stem
 
             # If filename changes, update all links pointing to this file
             if old_name != new_name:
-                normalized_old = self._normalize_link_target(old_name)
+                link_keys = keys_by_file.get(move.source) or [
+                    self._normalize_link_target(old_name)
+                ]
 
-                if normalized_old in link_index.links_to_file:
-                    referencing_files = link_index.links_to_file[normalized_old]
+                for link_key in link_keys:
+                    referencing_files = link_index.links_to_file.get(link_key, ())
 
                     for ref_file in referencing_files:
                         if ref_file in link_index.links_by_file:
                             for link in link_index.links_by_file[ref_file]:
                                 if (
                                     self._normalize_link_target(link.target_note)
-                                    == normalized_old
+                                    == link_key
                                 ):
                                     # Plan link update
                                     new_link_text = self._generate_updated_link_text(
@@ -1284,6 +1845,86 @@ class DirectoryOrganizer:
             # Standard link without custom display
             return f"{embed_prefix}[[{new_target}]]"
 
+    def apply_link_updates(
+        self, link_updates: List[LinkUpdate], journal: Optional[MoveJournal] = None
+    ) -> Dict[str, Any]:
+        """
+        Apply planned link updates, rewriting each referencing file once.
+
+        Updates are grouped by file. Each file is read once, every link is
+        replaced at its recorded line/position (from the end of the file
+        backwards, so earlier offsets stay valid) and the result is written
+        once with ``safe_write``. An update whose recorded text no longer
+        matches the file is skipped rather than guessed at.
+
+        Args:
+            link_updates: Updates from ``plan_link_updates``
+            journal: Optional journal; files are recorded before rewriting
+
+        Returns:
+            Dict with ``files_rewritten``, ``links_rewritten`` and ``skipped``
+        """
+        by_file: Dict[Path, List[LinkUpdate]] = {}
+        for update in link_updates:
+            by_file.setdefault(update.file_path, []).append(update)
+
+        result = {"files_rewritten": 0, "links_rewritten": 0, "skipped": []}
+
+        for file_path, updates in by_file.items():
+            try:
+                with open(file_path, "r", encoding="utf-8", newline="") as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                self.logger.warning(f"Cannot rewrite links in {file_path}: {e}")
+                result["skipped"].extend(u.old_link.original_text for u in updates)
+                continue
+
+            line_starts = [0]
+            position = content.find("\n")
+            while position != -1:
+                line_starts.append(position + 1)
+                position = content.find("\n", position + 1)
+
+            replacements = {}
+            for update in updates:
+                link = update.old_link
+                if link.line_number > len(line_starts):
+                    result["skipped"].append(link.original_text)
+                    continue
+                start = line_starts[link.line_number - 1] + link.start_pos
+                end = line_starts[link.line_number - 1] + link.end_pos
+                if content[start:end] != link.original_text:
+                    self.logger.warning(
+                        f"Stale link update skipped in {file_path.name}: "
+                        f"{link.original_text}"
+                    )
+                    result["skipped"].append(link.original_text)
+                    continue
+                replacements[(start, end)] = update.new_link_text
+
+            if not replacements:
+                continue
+
+            pieces = []
+            cursor = len(content)
+            for (start, end), new_text in sorted(replacements.items(), reverse=True):
+                pieces.append(content[end:cursor])
+                pieces.append(new_text)
+                cursor = start
+            pieces.append(content[:cursor])
+
+            if journal is not None:
+                journal.record_edit(file_path)
+            safe_write(file_path, "".join(reversed(pieces)))
+            result["files_rewritten"] += 1
+            result["links_rewritten"] += len(replacements)
+
+        self.logger.info(
+            f"Rewrote {result['links_rewritten']} links in "
+            f"{result['files_rewritten']} files ({len(result['skipped'])} skipped)"
+        )
+        return result
+
     def validate_move_integrity(self, backup_path: str = None) -> Dict[str, Any]:
         """
         Validate the integrity of the vault after moves have been executed.
@@ -1526,10 +2167,11 @@ class DirectoryOrganizer:
             validation_result = self.validate_move_integrity(backup_path)
 
             # Step 3: Auto-rollback on validation failure
+            operation_id = execution_result.get("operation_id")
             if (
                 not validation_result["validation_passed"]
                 and auto_rollback
-                and backup_path
+                and (operation_id or backup_path)
             ):
                 critical_errors = [
                     error
@@ -1542,7 +2184,10 @@ class DirectoryOrganizer:
                         "Critical validation errors detected - initiating auto-rollback"
                     )
                     try:
-                        self.rollback(backup_path)
+                        if operation_id:
+                            self.rollback_operation(operation_id)
+                        else:
+                            self.rollback(backup_path)
                         execution_result["status"] = (
                             "rolled_back_due_to_validation_failure"
                         )
@@ -1591,6 +2236,10 @@ class DirectoryOrganizer:
         """
         Remove old backup directories, keeping only the most recent N backups.
 
+        Operation journals are removed together with the backup they were
+        taken against. Journals whose backup is already gone (or that never
+        had one) are kept for the N most recent such operations.
+
         Args:
             keep: Number of most recent backups to keep
             dry_run: If True, return plan without deleting anything
@@ -1607,6 +2256,7 @@ class DirectoryOrganizer:
         self.logger.info(f"Pruning backups: keeping {keep} most recent")
 
         backups = self.list_backups()
+        snapshots = self.list_snapshots()
 
         # Determine which backups to keep and which to prune
         to_keep = backups[:keep] if keep <= len(backups) else backups
@@ -1618,12 +2268,22 @@ class DirectoryOrganizer:
             "found": len(backups),
             "to_keep": to_keep,
             "to_prune": to_prune,
+            "snapshots_found": len(snapshots),
+            "snapshots_to_prune": snapshots[keep:],
+            "journals_to_prune": self._journals_to_prune(
+                to_prune + [self.store.manifest_path(n) for n in snapshots[keep:]], keep
+            ),
             "deleted": [],
+            "journals_deleted": [],
             "errors": [],
         }
 
         if dry_run:
-            self.logger.info(f"Dry run: would delete {len(to_prune)} backup(s)")
+            self.logger.info(
+                f"Dry run: would delete {len(to_prune)} backup(s), "
+                f"{len(plan['snapshots_to_prune'])} store snapshot(s) and "
+                f"{len(plan['journals_to_prune'])} journal(s)"
+            )
             return plan
 
         # Actual deletion logic
@@ -1650,6 +2310,41 @@ class DirectoryOrganizer:
                 self.logger.error(error_msg)
                 plan["errors"].append(error_msg)
 
+        # Store snapshots: drop manifests, then collect unreferenced blobs
+        for name in plan["snapshots_to_prune"]:
+            try:
+                snapshot_size = self.store.snapshot_size(name) / (1024 * 1024)
+                self.store.delete_snapshot(name)
+                self.logger.info(
+                    f"Deleting store snapshot: {name} ({snapshot_size:.2f} MB)"
+                )
+                plan["deleted"].append(
+                    {
+                        "path": str(self.store.manifest_path(name)),
+                        "name": name,
+                        "size_mb": snapshot_size,
+                    }
+                )
+                deleted_count += 1
+            except Exception as e:
+                error_msg = f"Failed to delete snapshot {name}: {e}"
+                self.logger.error(error_msg)
+                plan["errors"].append(error_msg)
+
+        if plan["snapshots_to_prune"]:
+            plan["gc"] = self.store.gc()
+
+        for operation_id in plan["journals_to_prune"]:
+            try:
+                MoveJournal.load(
+                    self.vault_root, self.journal_root, operation_id
+                ).remove()
+                plan["journals_deleted"].append(operation_id)
+            except JournalError as e:
+                error_msg = f"Failed to delete journal {operation_id}: {e}"
+                self.logger.error(error_msg)
+                plan["errors"].append(error_msg)
+
         plan["deleted_count"] = deleted_count
         plan["success"] = len(plan["errors"]) == 0
 
@@ -1662,6 +2357,27 @@ class DirectoryOrganizer:
 
         return plan
 
+    def _journals_to_prune(self, pruned_backups: List[Path], keep: int) -> List[str]:
+        """Journal ids to delete alongside pruned_backups (newest first)."""
+        pruned = set(pruned_backups)
+        to_prune = []
+        orphans = 0
+        for operation_id in MoveJournal.list_operations(self.journal_root):
+            try:
+                journal = MoveJournal.load(
+                    self.vault_root, self.journal_root, operation_id
+                )
+            except JournalError:
+                continue
+            backup_path = journal.data.get("backup_path")
+            if backup_path and Path(backup_path) in pruned:
+                to_prune.append(operation_id)
+            elif not backup_path or not Path(backup_path).exists():
+                orphans += 1
+                if orphans > keep:
+                    to_prune.append(operation_id)
+        return to_prune
+
     def _get_directory_size(self, directory: Path) -> float:
         """
         Calculate the total size of a directory in megabytes.
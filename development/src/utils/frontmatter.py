@@ -5,9 +5,168 @@ This module provides robust, consistent YAML frontmatter parsing and building
 with proper error handling and field ordering.
 """
 
+import re
 import yaml
-from typing import Dict, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional
 from io import StringIO
+from yaml.constructor import SafeConstructor
+from yaml.reader import Reader
+from yaml.resolver import Resolver
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+
+    HAS_CSAFE_LOADER = True
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+    HAS_CSAFE_LOADER = False
+
+# Set to False to always hand frontmatter to the YAML loader
+FAST_PATH_ENABLED = True
+
+# `key: value` / `key:` at column 0, or a `- item` block-sequence entry
+_FAST_KEY_LINE = re.compile(r"([A-Za-z_][\w-]*):(?:[ ]+(.*?))?[ ]*")
+_FAST_ITEM_LINE = re.compile(r"([ ]*)-(?:[ ]+(.*?))?[ ]*")
+
+# Characters that start something other than a plain scalar in YAML
+_PLAIN_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+
+_NON_PRINTABLE = Reader.NON_PRINTABLE
+_STR_TAG = "tag:yaml.org,2002:str"
+_resolver = Resolver()
+_constructor = SafeConstructor()
+
+
+def _resolve(text: str) -> str:
+    """Tag the YAML loader would give ``text`` as a plain scalar."""
+    return _resolver.resolve(yaml.ScalarNode, text, (True, False))
+
+
+class _NotSimple(Exception):
+    """Frontmatter uses YAML beyond what the fast path handles."""
+
+
+def _plain_scalar(text: str, flow: bool = False) -> Any:
+    """
+    Resolve an unquoted scalar the way the YAML loader would.
+
+    Uses PyYAML's own implicit resolvers and constructors, so ints, bools,
+    nulls, floats and dates come out exactly as ``yaml.safe_load`` makes them.
+    """
+    if text[0] in _PLAIN_INDICATORS:
+        raise _NotSimple
+    if ": " in text or " #" in text or text.endswith(":"):
+        raise _NotSimple
+    if flow and any(c in text for c in "[]{},:"):
+        raise _NotSimple
+    tag = _resolve(text)
+    if tag == _STR_TAG:
+        return text
+    # Call the constructor directly; construct_object() would cache every node
+    node = yaml.ScalarNode(tag, text)
+    return _constructor.yaml_constructors[tag](_constructor, node)
+
+
+def _scalar(text: str, flow: bool = False) -> Any:
+    if not text or text == "~":
+        return None
+    quote = text[0]
+    if quote == '"':
+        inner = text[1:-1]
+        if len(text) < 2 or text[-1] != '"' or '"' in inner or "\\" in inner:
+            raise _NotSimple
+        return inner
+    if quote == "'":
+        inner = text[1:-1]
+        if len(text) < 2 or text[-1] != "'" or "'" in inner.replace("''", ""):
+            raise _NotSimple
+        return inner.replace("''", "'")
+    return _plain_scalar(text, flow)
+
+
+def _value(text: Optional[str]) -> Any:
+    if text is None:
+        return None
+    if text.startswith("["):
+        if not text.endswith("]"):
+            raise _NotSimple
+        inner = text[1:-1].strip()
+        if not inner:
+            return []
+        items = [item.strip() for item in inner.split(",")]
+        if not all(items):
+            raise _NotSimple
+        return [_scalar(item, flow=True) for item in items]
+    return _scalar(text)
+
+
+def _parse_simple_frontmatter(yaml_content: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the flat subset of YAML our templates write, without a YAML loader.
+
+    Handles ``key: value`` lines, inline ``[a, b]`` lists, ``- item`` block
+    lists and whole-line comments. Returns None as soon as anything else
+    appears (nesting, multi-line scalars, anchors, trailing comments, ...)
+    so the caller can fall back to the full loader.
+    """
+    if "\t" in yaml_content or "\r" in yaml_content:
+        return None  # Tabs and CR line breaks mean different things to YAML
+    if _NON_PRINTABLE.search(yaml_content):
+        return None  # Let the loader raise its usual error
+
+    metadata: Dict[str, Any] = {}
+    key: Optional[str] = None
+    block: Optional[List[Any]] = None
+    block_indent: Optional[str] = None
+    try:
+        for line in yaml_content.split("\n"):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+
+            item = _FAST_ITEM_LINE.fullmatch(line) if block is not None else None
+            if item:
+                if block_indent is None:
+                    block_indent = item.group(1)
+                elif item.group(1) != block_indent:
+                    return None
+                block.append(_scalar(item.group(2) or ""))
+                metadata[key] = block
+                continue
+
+            match = _FAST_KEY_LINE.fullmatch(line)
+            if not match:
+                return None
+            key = match.group(1)
+            if _resolve(key) != _STR_TAG:
+                return None
+            if match.group(2) is None:
+                # Null, unless `- item` lines follow
+                metadata[key] = None
+                block, block_indent = [], None
+            else:
+                metadata[key] = _value(match.group(2))
+                block = None
+    except (_NotSimple, KeyError, ValueError, yaml.YAMLError):
+        return None
+    return metadata
+
+
+def load_frontmatter_yaml(yaml_content: str) -> Any:
+    """
+    Load a frontmatter block: fast path first, then the YAML loader.
+
+    The loader is ``yaml.CSafeLoader`` when PyYAML was built with libyaml,
+    otherwise the pure-Python ``yaml.SafeLoader``.
+
+    Raises:
+        yaml.YAMLError: If the block is not valid YAML
+    """
+    if FAST_PATH_ENABLED:
+        metadata = _parse_simple_frontmatter(yaml_content)
+        if metadata is not None:
+            return metadata
+    return yaml.load(yaml_content, Loader=_YamlLoader)
 
 
 def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
@@ -29,36 +188,34 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     if not content.strip().startswith("---"):
         return {}, content
 
-    # Find closing delimiter
-    lines = content.split("\n")
-    if len(lines) < 2:
+    # Walk lines after the opening delimiter until the closing '---',
+    # without splitting the (usually much longer) body
+    yaml_start = content.find("\n") + 1
+    if not yaml_start:
         return {}, content
 
-    # Look for closing '---' delimiter
-    closing_delimiter_idx = None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            closing_delimiter_idx = i
+    line_start = yaml_start
+    while True:
+        line_end = content.find("\n", line_start)
+        if line_end == -1:
+            line_end = len(content)
+        if content[line_start:line_end].strip() == "---":
             break
+        if line_end == len(content):
+            # No closing delimiter found - treat as no frontmatter
+            return {}, content
+        line_start = line_end + 1
 
-    if closing_delimiter_idx is None:
-        # No closing delimiter found - treat as no frontmatter
-        return {}, content
-
-    # Extract YAML content between delimiters
-    yaml_lines = lines[1:closing_delimiter_idx]
-    yaml_content = "\n".join(yaml_lines)
-
-    # Extract body content after frontmatter
-    body_lines = lines[closing_delimiter_idx + 1 :]
-    body_content = "\n".join(body_lines)
+    # Extract YAML content between delimiters and the body after them
+    yaml_content = content[yaml_start : max(yaml_start, line_start - 1)]
+    body_content = content[line_end + 1 :]
 
     # Parse YAML with error handling
     try:
         if not yaml_content.strip():
             metadata = {}
         else:
-            metadata = yaml.safe_load(yaml_content) or {}
+            metadata = load_frontmatter_yaml(yaml_content) or {}
     except yaml.YAMLError:
         # Return empty metadata for malformed YAML, but preserve original content
         return {}, content
@@ -10,6 +10,7 @@ from typing import List, Dict, Optional
 import logging
 
 from .image_link_parser import ImageLinkParser
+from .media_index import MediaIndex
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +26,28 @@ class ImageLinkManager:
     - Calculate relative paths automatically
     """
 
-    def __init__(self, base_path: Optional[Path] = None):
+    def __init__(
+        self,
+        base_path: Optional[Path] = None,
+        media_index: Optional[MediaIndex] = None,
+    ):
         """
         Initialize manager.
 
         Args:
             base_path: Optional knowledge base path for absolute path resolution
+            media_index: Filename index used to resolve wiki embeds; built
+                from base_path on first use when not given
         """
         self.base_path = Path(base_path) if base_path else None
         self.parser = ImageLinkParser()
+        self.media_index = media_index
+
+    def refresh_media_index(self) -> Optional[MediaIndex]:
+        """Rebuild the wiki-embed filename index (None without a base_path)."""
+        if self.base_path:
+            self.media_index = MediaIndex(self.base_path).build()
+        return self.media_index
 
     def parse_image_links(self, content: str) -> List[Dict]:
         """
@@ -151,13 +165,13 @@ class ImageLinkManager:
 
             elif link["type"] == "wiki":
                 # Wiki links are resolved vault-wide by filename (Obsidian semantics).
-                # Search order mirrors how Obsidian resolves: Media/ first, then
-                # attachments/ month-folders, then anywhere in the vault.
+                # The index orders matches the way Obsidian resolves: Media/ first,
+                # then attachments/ month-folders, then anywhere in the vault.
                 if self.base_path:
                     filename = link["filename"]
-                    found = (self.base_path / "Media" / filename).exists() or any(
-                        self.base_path.rglob(filename)
-                    )
+                    if self.media_index is None:
+                        self.refresh_media_index()
+                    found = self.media_index.contains(filename)
 
                     if not found:
                         broken_links.append(
@@ -4,20 +4,47 @@ Vault-wide media audit: detect broken image embeds and orphaned media files.
 Usage:
     python -m src.utils.media_audit <vault_path>
     python development/src/utils/media_audit.py knowledge/
+
+Streaming mode scans notes on a process pool and writes findings as JSON
+Lines while the scan runs, checkpointing so an interrupted audit resumes:
+
+    python -m src.utils.media_audit knowledge/ --jsonl audit.jsonl
+    python -m src.utils.media_audit knowledge/ --jsonl -        # stdout
 """
 
 from __future__ import annotations
 
+import argparse
+import json
+import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 from .image_link_manager import ImageLinkManager
+from .io import safe_write
+from .media_index import MediaIndex
+
+logger = logging.getLogger(__name__)
 
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".m4a", ".mp4"}
 MEDIA_DIRS = {"Media", "attachments"}
 
+# Directories that contain configuration/documentation, not vault notes.
+# Scanning these produces false positives from code examples.
+_SKIP_DIRS = {".obsidian", "Templates", "scripts"}
+
+# Streaming audit: smallest vault worth a process pool, and how many notes
+# pass between checkpoint saves / progress records
+PARALLEL_AUDIT_MIN_NOTES = 200
+CHECKPOINT_INTERVAL = 500
+
+# (vault-relative note path, broken embeds, referenced filenames)
+NoteFindings = Tuple[str, List[Dict], List[str]]
+
 
 @dataclass
 class AuditResult:
@@ -33,54 +60,269 @@ class AuditResult:
         return len(self.orphaned_media)
 
 
-def audit_vault(vault_path: Path) -> AuditResult:
-    result = AuditResult()
-    manager = ImageLinkManager(base_path=vault_path)
+@dataclass
+class AuditCheckpoint:
+    """Progress of a streaming audit, saved so it can resume after a stop."""
 
-    # Collect all media files
-    all_media: List[Path] = []
-    for media_dir_name in MEDIA_DIRS:
-        media_dir = vault_path / media_dir_name
-        if media_dir.exists():
-            for f in media_dir.rglob("*"):
-                if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS:
-                    all_media.append(f)
+    vault_path: str
+    notes_done: set = field(default_factory=set)
+    referenced: set = field(default_factory=set)
+    broken_count: int = 0
+    # Output position after the last fully written note
+    output_offset: int = 0
 
-    referenced_filenames: set[str] = set()
+    @classmethod
+    def load(cls, path: Path, vault_path: Path) -> Optional["AuditCheckpoint"]:
+        """Checkpoint at path for this vault, or None if absent/unusable."""
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("vault_path") != str(vault_path):
+            return None
+        return cls(
+            vault_path=data["vault_path"],
+            notes_done=set(data["notes_done"]),
+            referenced=set(data["referenced"]),
+            broken_count=data["broken_count"],
+            output_offset=data["output_offset"],
+        )
 
-    # Directories that contain configuration/documentation, not vault notes.
-    # Scanning these produces false positives from code examples.
-    _SKIP_DIRS = {".obsidian", "Templates", "scripts"}
+    def save(self, path: Path) -> None:
+        safe_write(
+            path,
+            json.dumps(
+                {
+                    "vault_path": self.vault_path,
+                    "notes_done": sorted(self.notes_done),
+                    "referenced": sorted(self.referenced),
+                    "broken_count": self.broken_count,
+                    "output_offset": self.output_offset,
+                }
+            ),
+        )
 
-    # Walk all notes, collect broken embeds and referenced filenames
-    for note in vault_path.rglob("*.md"):
+
+def _audit_notes(media_index: MediaIndex) -> List[Path]:
+    """Notes to audit, skipping documentation and non-content folders."""
+    notes = []
+    for note in media_index.iter_files():
+        if note.suffix != ".md":
+            continue
         # Skip CLAUDE.md files (documentation with embed syntax examples)
         if note.name == "CLAUDE.md":
             continue
         # Skip known non-content directories
         if any(part in _SKIP_DIRS for part in note.parts):
             continue
-        try:
-            content = note.read_text(encoding="utf-8", errors="ignore")
-        except OSError:
-            continue
-        broken = manager.validate_image_links(note, content)
-        result.broken_embeds.extend(broken)
+        notes.append(note)
+    return notes
+
+
+def _media_files(media_index: MediaIndex) -> List[Path]:
+    return [
+        f
+        for f in media_index.iter_files(MEDIA_DIRS)
+        if f.suffix.lower() in IMAGE_EXTENSIONS
+    ]
+
+
+def _audit_note(
+    note: Path, manager: Optional[ImageLinkManager] = None
+) -> Optional[NoteFindings]:
+    """Broken embeds and referenced filenames of one note (None if unreadable)."""
+    manager = manager or _worker_manager
+    try:
+        content = note.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    broken = manager.validate_image_links(note, content)
+    # Track which filenames are referenced (for orphan detection)
+    referenced = [
+        link.get("filename") or Path(link.get("path", "")).name
+        for link in manager.parse_image_links(content)
+    ]
+    rel_path = note.relative_to(manager.base_path).as_posix()
+    return rel_path, broken, referenced
+
+
+_worker_manager: Optional[ImageLinkManager] = None
+
 
-        # Track which filenames are referenced (for orphan detection)
-        for link in manager.parse_image_links(content):
-            referenced_filenames.add(
-                link.get("filename") or Path(link.get("path", "")).name
+def _init_audit_worker(vault_path: str, rel_paths: List[str]) -> None:
+    """Give each pool process the parent's media index instead of re-walking."""
+    global _worker_manager
+    _worker_manager = ImageLinkManager(
+        base_path=Path(vault_path),
+        media_index=MediaIndex.from_paths(vault_path, rel_paths),
+    )
+
+
+def _iter_note_findings(
+    vault_path: Path,
+    media_index: MediaIndex,
+    notes: List[Path],
+    workers: Optional[int] = None,
+) -> Iterator[NoteFindings]:
+    """Audit notes in input order, on a process pool for large vaults."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    done = 0
+    if workers > 1 and len(notes) >= PARALLEL_AUDIT_MIN_NOTES:
+        chunksize = max(1, min(64, len(notes) // (workers * 4)))
+        try:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_audit_worker,
+                initargs=(str(vault_path), media_index.rel_paths()),
             )
+            try:
+                for findings in pool.map(_audit_note, notes, chunksize=chunksize):
+                    done += 1
+                    if findings is not None:
+                        yield findings
+            finally:
+                # Don't wait for queued notes if the consumer stopped early
+                pool.shutdown(wait=False, cancel_futures=True)
+            return
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Parallel audit unavailable ({e}); continuing in-process")
+
+    manager = ImageLinkManager(base_path=vault_path, media_index=media_index)
+    for note in notes[done:]:
+        findings = _audit_note(note, manager)
+        if findings is not None:
+            yield findings
+
+
+def audit_vault(vault_path: Path) -> AuditResult:
+    result = AuditResult()
+    # One walk of the vault; embeds are then resolved by dictionary lookup
+    media_index = MediaIndex(vault_path).build()
+
+    referenced_filenames: set[str] = set()
+
+    # Walk all notes, collect broken embeds and referenced filenames
+    for _, broken, referenced in _iter_note_findings(
+        vault_path, media_index, _audit_notes(media_index), workers=1
+    ):
+        result.broken_embeds.extend(broken)
+        referenced_filenames.update(referenced)
 
     # Orphaned = media file with no note referencing its filename
-    for media_file in all_media:
+    for media_file in _media_files(media_index):
         if media_file.name not in referenced_filenames:
             result.orphaned_media.append(media_file)
 
     return result
 
 
+def stream_audit(
+    vault_path: Path,
+    out: TextIO,
+    checkpoint_path: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Audit the vault, writing each finding to ``out`` as a JSON line.
+
+    Records, in order: ``broken_embed`` per broken embed as its note is
+    scanned, ``progress`` every CHECKPOINT_INTERVAL notes, ``orphaned_media``
+    once all notes are scanned, and a final ``summary``.
+
+    With ``checkpoint_path``, progress is saved every CHECKPOINT_INTERVAL
+    notes and when the audit is interrupted; the next call picks up from it.
+    When ``out`` is seekable, output written after the last complete note
+    is truncated first, so no finding is written twice. The checkpoint is
+    removed once the audit completes.
+
+    Returns:
+        The summary record
+    """
+    vault_path = Path(vault_path)
+    media_index = MediaIndex(vault_path).build()
+    notes = _audit_notes(media_index)
+
+    checkpoint = None
+    if checkpoint_path:
+        checkpoint = AuditCheckpoint.load(checkpoint_path, vault_path)
+    resumed = checkpoint is not None
+    if checkpoint is None:
+        checkpoint = AuditCheckpoint(vault_path=str(vault_path))
+    elif out.seekable():
+        out.seek(checkpoint.output_offset)
+        out.truncate()
+
+    def emit(record: Dict[str, Any]) -> None:
+        out.write(json.dumps(record, default=str) + "\n")
+
+    def save() -> None:
+        if checkpoint_path:
+            checkpoint.save(checkpoint_path)
+
+    pending = [
+        n
+        for n in notes
+        if n.relative_to(vault_path).as_posix() not in checkpoint.notes_done
+    ]
+    since_save = 0
+    try:
+        for rel_path, broken, referenced in _iter_note_findings(
+            vault_path, media_index, pending, workers
+        ):
+            for entry in broken:
+                emit({"type": "broken_embed", **entry})
+            out.flush()
+            checkpoint.notes_done.add(rel_path)
+            checkpoint.referenced.update(referenced)
+            checkpoint.broken_count += len(broken)
+            checkpoint.output_offset = out.tell() if out.seekable() else 0
+
+            since_save += 1
+            if since_save >= CHECKPOINT_INTERVAL:
+                since_save = 0
+                emit(
+                    {
+                        "type": "progress",
+                        "notes_done": len(checkpoint.notes_done),
+                        "notes_total": len(notes),
+                    }
+                )
+                out.flush()
+                checkpoint.output_offset = out.tell() if out.seekable() else 0
+                save()
+    except BaseException:
+        # Interrupted (Ctrl-C, broken pipe, ...): keep what is complete
+        save()
+        raise
+
+    orphaned = 0
+    for media_file in _media_files(media_index):
+        if media_file.name not in checkpoint.referenced:
+            orphaned += 1
+            emit(
+                {
+                    "type": "orphaned_media",
+                    "path": media_file.relative_to(vault_path).as_posix(),
+                }
+            )
+
+    summary = {
+        "type": "summary",
+        "vault_path": str(vault_path),
+        "notes_scanned": len(checkpoint.notes_done),
+        "broken_embeds": checkpoint.broken_count,
+        "orphaned_media": orphaned,
+        "resumed": resumed,
+    }
+    emit(summary)
+    out.flush()
+    if checkpoint_path and Path(checkpoint_path).exists():
+        Path(checkpoint_path).unlink()
+    return summary
+
+
 def _print_report(vault_path: Path, result: AuditResult) -> None:
     print(f"\nMedia audit: {vault_path}\n{'─' * 50}")
     print(f"Broken embeds:   {result.total_broken}")
@@ -117,12 +359,56 @@ def _print_report(vault_path: Path, result: AuditResult) -> None:
     print()
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: cd development && python -m src.utils.media_audit <vault_path>")
-        sys.exit(1)
-    vault = Path(sys.argv[1]).resolve()
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.utils.media_audit",
+        description="Detect broken image embeds and orphaned media files.",
+    )
+    parser.add_argument("vault_path", help="Vault root")
+    parser.add_argument(
+        "--jsonl",
+        metavar="PATH",
+        help="Stream findings as JSON Lines to PATH ('-' for stdout)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        help="Resumable checkpoint file (default: PATH.checkpoint for --jsonl files)",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Scanner processes (default: CPU count)"
+    )
+    args = parser.parse_args(argv)
+
+    vault = Path(args.vault_path).resolve()
     if not vault.is_dir():
         print(f"Error: {vault} is not a directory")
-        sys.exit(1)
-    _print_report(vault, audit_vault(vault))
+        return 1
+
+    if not args.jsonl:
+        _print_report(vault, audit_vault(vault))
+        return 0
+
+    checkpoint = args.checkpoint
+    if checkpoint is None and args.jsonl != "-":
+        checkpoint = f"{args.jsonl}.checkpoint"
+    checkpoint = Path(checkpoint) if checkpoint else None
+
+    if args.jsonl == "-":
+        stream_audit(vault, sys.stdout, checkpoint, args.workers)
+        return 0
+
+    # Append when resuming; stream_audit truncates to the checkpointed offset
+    resuming = checkpoint is not None and checkpoint.exists()
+    with open(args.jsonl, "a" if resuming else "w", encoding="utf-8") as out:
+        summary = stream_audit(vault, out, checkpoint, args.workers)
+    print(
+        f"{summary['broken_embeds']} broken embed(s), "
+        f"{summary['orphaned_media']} orphaned media file(s) → {args.jsonl}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
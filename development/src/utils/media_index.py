@@ -0,0 +1,213 @@
+"""
+Filename index of vault files for resolving wiki-style embeds.
+
+``![[image.png]]`` embeds name a file, not a path: Obsidian resolves them
+vault-wide by filename. Checking each embed with ``rglob(filename)`` walks
+the whole vault once per embed, so a media audit costs
+O(embeds x vault files). The index walks the vault once and maps every
+filename to the vault-relative paths carrying it, ``Media/`` first, then
+``attachments/`` month folders, then everything else:
+
+    index = MediaIndex(vault_root).build()
+    index.contains("diagram.png")           # dictionary lookup
+    index.lookup("diagram.png")             # [vault/Media/diagram.png, ...]
+
+``watch()`` keeps a long-lived index current from filesystem events when
+watchdog is installed; otherwise call ``build()`` again to refresh.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    HAS_WATCHDOG = True
+except ImportError:
+    FileSystemEventHandler = object
+    HAS_WATCHDOG = False
+
+logger = logging.getLogger(__name__)
+
+# Folders searched first, in order, mirroring Obsidian's attachment lookup
+PRIORITY_DIRS = ("Media", "attachments")
+
+
+def _rank(rel_path: str) -> tuple:
+    top = rel_path.split("/", 1)[0]
+    rank = PRIORITY_DIRS.index(top) if top in PRIORITY_DIRS else len(PRIORITY_DIRS)
+    return rank, rel_path
+
+
+class MediaIndex:
+    """
+    Filename -> vault-relative paths, built with a single walk.
+
+    Thread-safe: a watch thread may update the index while it is queried.
+    """
+
+    def __init__(self, vault_root: Union[str, Path]):
+        self.vault_root = Path(vault_root)
+        self._paths: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self._observer = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(paths) for paths in self._paths.values())
+
+    # ------------------------------------------------------------------
+    # Building and updating
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_paths(
+        cls, vault_root: Union[str, Path], rel_paths: Iterable[str]
+    ) -> "MediaIndex":
+        """Index from vault-relative paths (see rel_paths()) without a walk."""
+        return cls(vault_root)._load(rel_paths)
+
+    def build(self) -> "MediaIndex":
+        """(Re)index every file under the vault root; returns self."""
+        return self._load(self._walk(self.vault_root))
+
+    def _load(self, rel_paths: Iterable[str]) -> "MediaIndex":
+        paths: Dict[str, List[str]] = {}
+        for rel_path in rel_paths:
+            paths.setdefault(rel_path.rsplit("/", 1)[-1], []).append(rel_path)
+        for entries in paths.values():
+            entries.sort(key=_rank)
+        with self._lock:
+            self._paths = paths
+        logger.debug(f"Media index built: {sum(map(len, paths.values()))} files")
+        return self
+
+    def add(self, path: Union[str, Path]) -> None:
+        """Index a file (or every file under a directory)."""
+        path = Path(path)
+        rel_paths = list(self._walk(path)) if path.is_dir() else [self._rel(path)]
+        with self._lock:
+            for rel_path in rel_paths:
+                if rel_path is None:
+                    continue
+                entries = self._paths.setdefault(rel_path.rsplit("/", 1)[-1], [])
+                if rel_path not in entries:
+                    entries.append(rel_path)
+                    entries.sort(key=_rank)
+
+    def discard(self, path: Union[str, Path]) -> None:
+        """Forget a file, or every indexed file under a directory path."""
+        rel_path = self._rel(Path(path))
+        if rel_path is None:
+            return
+        prefix = rel_path + "/"
+        with self._lock:
+            for name in list(self._paths):
+                entries = [
+                    p
+                    for p in self._paths[name]
+                    if p != rel_path and not p.startswith(prefix)
+                ]
+                if entries:
+                    self._paths[name] = entries
+                else:
+                    del self._paths[name]
+
+    def _walk(self, top: Path) -> Iterator[str]:
+        for dir_path, _, file_names in os.walk(top):
+            rel_dir = Path(dir_path).relative_to(self.vault_root).as_posix()
+            for name in file_names:
+                yield name if rel_dir == "." else f"{rel_dir}/{name}"
+
+    def _rel(self, path: Path) -> Optional[str]:
+        try:
+            return path.relative_to(self.vault_root).as_posix()
+        except ValueError:
+            return None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def lookup(self, filename: str) -> List[Path]:
+        """
+        Files an embed of ``filename`` can resolve to, in resolution order.
+
+        ``filename`` may carry folders (``attachments/2025-10/shot.png``);
+        those must match the end of the indexed path.
+        """
+        filename = filename.strip().replace("\\", "/").lstrip("/")
+        name = filename.rsplit("/", 1)[-1]
+        with self._lock:
+            entries = list(self._paths.get(name, ()))
+        if "/" in filename:
+            entries = [
+                p for p in entries if p == filename or p.endswith("/" + filename)
+            ]
+        return [self.vault_root / p for p in entries]
+
+    def contains(self, filename: str) -> bool:
+        return bool(self.lookup(filename))
+
+    def rel_paths(self) -> List[str]:
+        """Every indexed vault-relative path, sorted."""
+        with self._lock:
+            return sorted(p for entries in self._paths.values() for p in entries)
+
+    def iter_files(self, top_dirs: Optional[Iterable[str]] = None) -> Iterator[Path]:
+        """Every indexed file, optionally only those under the given top folders."""
+        tops = set(top_dirs) if top_dirs is not None else None
+        for rel_path in self.rel_paths():
+            if tops is None or rel_path.split("/", 1)[0] in tops:
+                yield self.vault_root / rel_path
+
+    # ------------------------------------------------------------------
+    # Watching
+    # ------------------------------------------------------------------
+
+    def watch(self) -> bool:
+        """
+        Keep the index current from filesystem events until stop().
+
+        Returns:
+            True if watching, False if watchdog is not installed
+        """
+        if not HAS_WATCHDOG:
+            logger.info("watchdog not installed; media index will not auto-refresh")
+            return False
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.schedule(
+                _IndexUpdater(self), str(self.vault_root), recursive=True
+            )
+            self._observer.daemon = True
+            self._observer.start()
+        return True
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+
+class _IndexUpdater(FileSystemEventHandler):
+    """Applies watchdog events to a MediaIndex."""
+
+    def __init__(self, index: MediaIndex):
+        super().__init__()
+        self.index = index
+
+    def on_created(self, event):
+        self.index.add(event.src_path)
+
+    def on_deleted(self, event):
+        self.index.discard(event.src_path)
+
+    def on_moved(self, event):
+        self.index.discard(event.src_path)
+        self.index.add(event.dest_path)
@@ -0,0 +1,302 @@
+"""
+Per-operation journal of vault changes for targeted rollback.
+
+``DirectoryOrganizer.execute_moves`` touches a handful of files, yet a full
+``rollback`` removes the whole vault and copies the whole backup back,
+after making a full emergency copy first. The journal records each move,
+edit and directory creation *before* it happens (write-ahead), so an
+operation can be undone by reversing just those steps:
+
+    <backup_root>/journals/<operation_id>/journal.jsonl
+    <backup_root>/journals/<operation_id>/originals/<rel_path>   # pre-edit copies
+    <backup_root>/journals/<operation_id>/emergency/<rel_path>   # pre-rollback state
+
+``journal.jsonl`` is append-only: a header line, then one line per step or
+status change, each fsynced as it is written. Recording a step costs the
+same however long the journal already is. Paths are stored relative to
+the vault root.
+"""
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILE = "journal.jsonl"
+
+_HEADER_KEYS = ("operation_id", "created", "vault_root", "backup_path")
+
+
+class JournalError(Exception):
+    """Raised when a journal cannot be read, written or rolled back."""
+
+    pass
+
+
+class MoveJournal:
+    """
+    Write-ahead record of one organize operation.
+
+    Usage:
+        journal = MoveJournal.begin(vault_root, journal_root)
+        journal.record_move(source, target)
+        shutil.move(source, target)
+        journal.finish("success")
+        ...
+        MoveJournal.load(vault_root, journal_root, journal.operation_id).rollback()
+    """
+
+    def __init__(self, vault_root: Path, directory: Path, data: Dict[str, Any]) -> None:
+        self.vault_root = Path(vault_root)
+        self.directory = Path(directory)
+        self.data = data
+        self._edited = {e["path"] for e in data["entries"] if e["action"] == "edit"}
+
+    @classmethod
+    def begin(
+        cls,
+        vault_root: Union[str, Path],
+        journal_root: Union[str, Path],
+        backup_path: Optional[str] = None,
+    ) -> "MoveJournal":
+        """Start a new journal under journal_root with a unique operation id."""
+        journal_root = Path(journal_root)
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        operation_id = f"organize-{timestamp}"
+        collision_counter = 0
+        while (journal_root / operation_id).exists():
+            collision_counter += 1
+            operation_id = f"organize-{timestamp}-{collision_counter:02d}"
+
+        directory = journal_root / operation_id
+        directory.mkdir(parents=True)
+        journal = cls(
+            vault_root,
+            directory,
+            {
+                "operation_id": operation_id,
+                "created": datetime.now().isoformat(),
+                "vault_root": str(vault_root),
+                "backup_path": backup_path,
+                "status": "in_progress",
+                "entries": [],
+            },
+        )
+        journal._append({key: journal.data[key] for key in _HEADER_KEYS})
+        return journal
+
+    @classmethod
+    def load(
+        cls,
+        vault_root: Union[str, Path],
+        journal_root: Union[str, Path],
+        operation_id: str,
+    ) -> "MoveJournal":
+        directory = Path(journal_root) / operation_id
+        try:
+            data = cls._replay(directory / JOURNAL_FILE)
+        except FileNotFoundError:
+            raise JournalError(f"No journal for operation: {operation_id}")
+        except (OSError, ValueError) as e:
+            raise JournalError(f"Unreadable journal {operation_id}: {e}")
+        return cls(vault_root, directory, data)
+
+    @staticmethod
+    def _replay(path: Path) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"status": "in_progress", "entries": []}
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn write from a crash: the step after it never happened
+                logger.warning(f"Skipping incomplete journal line in {path}")
+                continue
+            if "action" in record:
+                data["entries"].append(record)
+            else:
+                data.update(record)
+        if "operation_id" not in data:
+            raise ValueError("missing header line")
+        return data
+
+    @staticmethod
+    def list_operations(journal_root: Union[str, Path]) -> List[str]:
+        """Journaled operation ids, newest first."""
+        journal_root = Path(journal_root)
+        if not journal_root.exists():
+            return []
+        return sorted(
+            (p.parent.name for p in journal_root.glob(f"*/{JOURNAL_FILE}")),
+            reverse=True,
+        )
+
+    @property
+    def operation_id(self) -> str:
+        return self.data["operation_id"]
+
+    @property
+    def entries(self) -> List[Dict[str, str]]:
+        return self.data["entries"]
+
+    def touched_paths(self) -> List[str]:
+        """Every vault-relative file path this operation moved or edited."""
+        paths: Dict[str, None] = {}
+        for entry in self.entries:
+            if entry["action"] != "mkdir":
+                for key in ("source", "target", "path"):
+                    if key in entry:
+                        paths.setdefault(entry[key])
+        return list(paths)
+
+    # ------------------------------------------------------------------
+    # Recording (call *before* performing the change)
+    # ------------------------------------------------------------------
+
+    def record_mkdir(self, directory: Path) -> None:
+        """Record a directory about to be created (and all missing parents)."""
+        missing = []
+        current = Path(directory)
+        while not current.exists() and current != self.vault_root:
+            missing.append(current)
+            current = current.parent
+        entries = [
+            {"action": "mkdir", "path": self._rel(path)} for path in reversed(missing)
+        ]
+        if entries:
+            self._append(*entries)
+            self.entries.extend(entries)
+
+    def record_move(self, source: Path, target: Path) -> None:
+        entry = {
+            "action": "move",
+            "source": self._rel(source),
+            "target": self._rel(target),
+        }
+        self._append(entry)
+        self.entries.append(entry)
+
+    def record_edit(self, path: Path) -> None:
+        """Keep a copy of path's current content, once per path."""
+        rel_path = self._rel(path)
+        if rel_path in self._edited:
+            return
+        original = self.directory / "originals" / rel_path
+        original.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, original)
+        entry = {"action": "edit", "path": rel_path}
+        self._append(entry)
+        self.entries.append(entry)
+        self._edited.add(rel_path)
+
+    def finish(self, status: str) -> None:
+        update = {"status": status, "finished": datetime.now().isoformat()}
+        self._append(update)
+        self.data.update(update)
+
+    def remove(self) -> None:
+        """Delete the journal, its originals and any emergency copy."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Rollback
+    # ------------------------------------------------------------------
+
+    def rollback(self) -> List[str]:
+        """
+        Undo the journaled steps in reverse order.
+
+        The current state of every touched path is first copied to
+        ``emergency/`` (only those paths, not the vault) and removed again
+        once the rollback succeeds.
+
+        Returns:
+            Vault-relative paths restored
+
+        Raises:
+            JournalError: If a step cannot be undone; the emergency copy is kept
+        """
+        if self.data["status"] == "rolled_back":
+            raise JournalError(f"Operation already rolled back: {self.operation_id}")
+
+        emergency = self._emergency_copy()
+        restored: List[str] = []
+        try:
+            for entry in reversed(self.entries):
+                action = entry["action"]
+                if action == "move":
+                    source = self.vault_root / entry["source"]
+                    target = self.vault_root / entry["target"]
+                    if not target.exists():
+                        continue  # Move never happened (failed mid-operation)
+                    if source.exists():
+                        raise JournalError(
+                            f"Cannot undo move, {entry['source']} exists again"
+                        )
+                    source.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.move(str(target), str(source))
+                    restored.append(entry["source"])
+                elif action == "edit":
+                    path = self.vault_root / entry["path"]
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(self.directory / "originals" / entry["path"], path)
+                    if entry["path"] not in restored:
+                        restored.append(entry["path"])
+                elif action == "mkdir":
+                    directory = self.vault_root / entry["path"]
+                    if directory.is_dir() and not any(directory.iterdir()):
+                        directory.rmdir()
+        except JournalError:
+            logger.error(f"Targeted rollback failed; emergency copy at {emergency}")
+            raise
+        except OSError as e:
+            logger.error(f"Targeted rollback failed; emergency copy at {emergency}")
+            raise JournalError(f"Failed to roll back {self.operation_id}: {e}")
+
+        self.finish("rolled_back")
+        shutil.rmtree(emergency, ignore_errors=True)
+        logger.info(
+            f"Rolled back {self.operation_id}: {len(restored)} path(s) restored"
+        )
+        return restored
+
+    def _emergency_copy(self) -> Path:
+        emergency = self.directory / "emergency"
+        if emergency.exists():
+            shutil.rmtree(emergency)
+        emergency.mkdir()
+        for rel_path in self.touched_paths():
+            current = self.vault_root / rel_path
+            if current.is_file():
+                destination = emergency / rel_path
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(current, destination)
+        return emergency
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _rel(self, path: Path) -> str:
+        return Path(path).relative_to(self.vault_root).as_posix()
+
+    def _append(self, *records: Dict[str, Any]) -> None:
+        """Durably append records (one fsync however many) to journal.jsonl."""
+        path = self.directory / JOURNAL_FILE
+        payload = "".join(json.dumps(r) + "\n" for r in records).encode("utf-8")
+        try:
+            with open(path, "ab+") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        payload = b"\n" + payload  # Terminate a torn line
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            raise JournalError(f"Failed to write journal {self.operation_id}: {e}")
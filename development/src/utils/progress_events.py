@@ -0,0 +1,283 @@
+"""
+Structured progress events for long-running batch jobs.
+
+Batch runners used to report progress only as ``\\r[idx/total]`` text on
+stderr, which nothing else can consume. They now publish ProgressEvents to
+a ProgressBus; subscribers (the web UI's SSE stream, tests, ...) receive
+them as they happen:
+
+    reporter = ProgressReporter("process_inbox", total=len(notes))
+    for note in notes:
+        ...
+        reporter.note(note.name, latency=elapsed, error=error)
+    reporter.finish()
+
+    with get_progress_bus().subscribe() as subscription:
+        event = subscription.get(timeout=15)
+
+Publishing never blocks a runner: slow subscribers drop events instead.
+The bus keeps a short history so a reconnecting client can resume after
+the last event it saw.
+
+Runs in another process (e.g. the CLI) reach the web UI through a spool
+file: when ``INNEROS_PROGRESS_SPOOL`` names a path, every process appends
+its events there as JSON lines and ``follow_spool()`` relays other
+processes' events into the local bus.
+"""
+
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SPOOL_ENV_VAR = "INNEROS_PROGRESS_SPOOL"
+# The spool starts over once it grows past this size
+SPOOL_MAX_BYTES = 1024 * 1024
+
+
+@dataclass
+class ProgressEvent:
+    """One step of a batch run: ``start``, ``note`` or ``finish``."""
+
+    run_id: str
+    kind: str
+    source: str
+    processed: int = 0  # notes handled so far, successful or not
+    failed: int = 0
+    total: int = 0
+    note: Optional[str] = None
+    latency: Optional[float] = None  # seconds (whole run for ``finish``)
+    error: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+    pid: int = field(default_factory=os.getpid)
+    seq: int = 0  # assigned by the bus that delivers the event
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProgressEvent":
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def to_sse(self) -> str:
+        """Server-sent events frame; the id lets clients resume."""
+        return (
+            f"id: {self.seq}\n"
+            f"event: {self.kind}\n"
+            f"data: {json.dumps(self.to_dict())}\n\n"
+        )
+
+
+class Subscription:
+    """Bounded queue of events for one subscriber."""
+
+    def __init__(self, bus: "ProgressBus", max_queue: int):
+        self._bus = bus
+        self._queue: "queue.Queue[ProgressEvent]" = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def _offer(self, event: ProgressEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ProgressEvent]:
+        """Next event, or None if none arrived within timeout."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ProgressBus:
+    """Thread-safe, in-process publish/subscribe for ProgressEvents."""
+
+    def __init__(self, history_size: int = 256, spool_path: Optional[str] = None):
+        self.spool_path = spool_path
+        self._history: "deque[ProgressEvent]" = deque(maxlen=history_size)
+        self._subscribers: List[Subscription] = []
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+        self._follower: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def publish(self, event: ProgressEvent, spool: bool = True) -> ProgressEvent:
+        """Deliver event to every subscriber (and the spool, if configured)."""
+        with self._lock:
+            event.seq = next(self._seq)
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+            if spool and self.spool_path:
+                self._append_to_spool(event)
+        for subscription in subscribers:
+            subscription._offer(event)
+        return event
+
+    def subscribe(
+        self, after_seq: Optional[int] = None, max_queue: int = 1000
+    ) -> Subscription:
+        """
+        Start receiving events.
+
+        Args:
+            after_seq: Replay retained events newer than this sequence number
+                (e.g. an SSE client's Last-Event-ID)
+            max_queue: Events buffered before new ones are dropped
+        """
+        subscription = Subscription(self, max_queue)
+        with self._lock:
+            if after_seq is not None:
+                for event in self._history:
+                    if event.seq > after_seq:
+                        subscription._offer(event)
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def history(self) -> List[ProgressEvent]:
+        with self._lock:
+            return list(self._history)
+
+    # ------------------------------------------------------------------
+    # Cross-process spool
+    # ------------------------------------------------------------------
+
+    def _append_to_spool(self, event: ProgressEvent) -> None:
+        try:
+            oversized = os.path.getsize(self.spool_path) > SPOOL_MAX_BYTES
+        except OSError:
+            oversized = False
+        try:
+            with open(self.spool_path, "w" if oversized else "a") as f:
+                f.write(json.dumps(event.to_dict()) + "\n")
+        except OSError as e:
+            logger.debug(f"Could not write progress spool {self.spool_path}: {e}")
+
+    def follow_spool(self, poll_interval: float = 0.5) -> bool:
+        """
+        Relay events other processes append to the spool into this bus.
+
+        Starts a daemon thread once; only events written after this call
+        are relayed. Returns False when no spool is configured.
+        """
+        if not self.spool_path:
+            return False
+        with self._lock:
+            if self._follower is None or not self._follower.is_alive():
+                try:
+                    position = os.path.getsize(self.spool_path)
+                except OSError:
+                    position = 0
+                self._stop.clear()
+                self._follower = threading.Thread(
+                    target=self._follow,
+                    args=(position, poll_interval),
+                    name="progress-spool",
+                    daemon=True,
+                )
+                self._follower.start()
+        return True
+
+    def stop_following(self) -> None:
+        self._stop.set()
+        if self._follower is not None:
+            self._follower.join()
+            self._follower = None
+
+    def _follow(self, position: int, poll_interval: float) -> None:
+        own_pid = os.getpid()
+        while not self._stop.is_set():
+            try:
+                if os.path.getsize(self.spool_path) < position:
+                    position = 0  # Spool started over
+                with open(self.spool_path, "r") as f:
+                    f.seek(position)
+                    for line in iter(f.readline, ""):
+                        if not line.endswith("\n"):
+                            break  # Partially written; read it next time
+                        position = f.tell()
+                        try:
+                            event = ProgressEvent.from_dict(json.loads(line))
+                        except (ValueError, TypeError):
+                            continue
+                        if event.pid != own_pid:
+                            self.publish(event, spool=False)
+            except OSError:
+                pass  # Spool not created yet
+            self._stop.wait(poll_interval)
+
+
+class ProgressReporter:
+    """Publishes the start/note/finish events of one batch run."""
+
+    def __init__(self, source: str, total: int, bus: Optional[ProgressBus] = None):
+        self.bus = bus if bus is not None else get_progress_bus()
+        self.source = source
+        self.total = total
+        self.run_id = uuid.uuid4().hex[:12]
+        self.processed = 0
+        self.failed = 0
+        self._started = time.perf_counter()
+        self._publish("start")
+
+    def note(
+        self, note: str, latency: Optional[float] = None, error: Optional[str] = None
+    ) -> ProgressEvent:
+        """Record one handled note; pass error when it failed."""
+        self.processed += 1
+        if error is not None:
+            self.failed += 1
+        return self._publish("note", note=note, latency=latency, error=error)
+
+    def finish(self) -> ProgressEvent:
+        return self._publish("finish", latency=time.perf_counter() - self._started)
+
+    def _publish(self, kind: str, **details: Any) -> ProgressEvent:
+        return self.bus.publish(
+            ProgressEvent(
+                run_id=self.run_id,
+                kind=kind,
+                source=self.source,
+                processed=self.processed,
+                failed=self.failed,
+                total=self.total,
+                **details,
+            )
+        )
+
+
+_default_bus: Optional[ProgressBus] = None
+_default_bus_lock = threading.Lock()
+
+
+def get_progress_bus() -> ProgressBus:
+    """Process-wide bus; spools to $INNEROS_PROGRESS_SPOOL when set."""
+    global _default_bus
+    with _default_bus_lock:
+        if _default_bus is None:
+            _default_bus = ProgressBus(spool_path=os.environ.get(SPOOL_ENV_VAR))
+        return _default_bus
@@ -0,0 +1,395 @@
+"""
+Shared single-pass index of vault notes.
+
+Analytics, reporting and review code all need the same per-note facts
+(frontmatter, wiki-links, tags, word count, timestamps). Instead of each
+consumer walking the vault with ``rglob("*.md")`` and re-reading every file,
+they share a VaultIndex: one directory walk plus one read/parse per note,
+reduced to a compact NoteRecord.
+
+Records are validated by ``(mtime_ns, size, inode)``, so a long-lived index
+(e.g. held by WorkflowManager) only re-reads notes that changed since the
+last sweep. With a ``cache_path`` the records also persist in SQLite, so a
+fresh CLI invocation costs a stat sweep plus parsing of changed files only.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.utils.frontmatter import parse_frontmatter
+
+logger = logging.getLogger(__name__)
+
+WIKI_LINK_PATTERN = re.compile(r"\[\[([^\]]+)\]\]")
+INLINE_TAG_PATTERN = re.compile(r"#([\w-]+)")
+TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+
+@dataclass
+class NoteRecord:
+    """Compact per-note facts extracted in a single read."""
+
+    path: Path
+    rel_path: str
+    mtime_ns: int
+    ctime: float
+    size: int
+    inode: int = 0
+    frontmatter: Dict[str, Any] = field(default_factory=dict)
+    has_frontmatter: bool = False
+    title: str = ""
+    links: List[str] = field(default_factory=list)
+    body_link_count: int = 0
+    inline_tags: Tuple[str, ...] = ()
+    word_count: int = 0
+    readable: bool = True
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem
+
+    @property
+    def directory(self) -> str:
+        return self.path.parent.name
+
+    @property
+    def mtime(self) -> float:
+        return self.mtime_ns / 1e9
+
+    @property
+    def tags(self) -> List[str]:
+        """Frontmatter tags (list form only)."""
+        tags = self.frontmatter.get("tags", [])
+        return tags if isinstance(tags, list) else []
+
+
+def parse_note_record(path: Path, root: Path, stat: os.stat_result) -> NoteRecord:
+    """Read and reduce one note to a NoteRecord."""
+    try:
+        rel_path = str(path.relative_to(root))
+    except ValueError:
+        rel_path = str(path)
+    record = NoteRecord(
+        path=path,
+        rel_path=rel_path,
+        mtime_ns=stat.st_mtime_ns,
+        ctime=stat.st_ctime,
+        size=stat.st_size,
+        inode=stat.st_ino,
+        title=path.stem,
+    )
+    try:
+        content = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        record.readable = False
+        return record
+
+    frontmatter, body = parse_frontmatter(content)
+    body = body if isinstance(body, str) else ""
+    title_match = TITLE_PATTERN.search(content)
+    record.frontmatter = frontmatter if isinstance(frontmatter, dict) else {}
+    record.has_frontmatter = content.startswith("---")
+    record.title = title_match.group(1).strip() if title_match else path.stem
+    record.links = WIKI_LINK_PATTERN.findall(content)
+    record.body_link_count = len(WIKI_LINK_PATTERN.findall(body))
+    record.inline_tags = tuple(INLINE_TAG_PATTERN.findall(body))
+    record.word_count = len(body.split())
+    return record
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON-encode frontmatter values, keeping YAML dates as dates."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, dict):
+        return {str(k): _encode_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1 and "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        if len(value) == 1 and "__date__" in value:
+            return date.fromisoformat(value["__date__"])
+        return {k: _decode_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_value(v) for v in value]
+    return value
+
+
+class VaultIndex:
+    """Stat-validated index of every ``*.md`` note under a root.
+
+    Hidden directories (``.git``, ``.obsidian``, caches) are skipped. Pass
+    ``cache_path`` (or use :meth:`for_vault`) to persist records between
+    processes; the SQLite file is only created on the first write.
+    """
+
+    DB_PATH = Path(".embedding_cache") / "vault_index.sqlite"
+    # Bump when NoteRecord fields or extraction rules change
+    SCHEMA_VERSION = 1
+
+    def __init__(
+        self, root: Union[str, Path], cache_path: Optional[Union[str, Path]] = None
+    ):
+        self.root = Path(root)
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._records: Dict[str, NoteRecord] = {}
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._loaded = self.cache_path is None
+        # rel_path -> record to upsert, or None to delete
+        self._dirty: Dict[str, Optional[NoteRecord]] = {}
+        self.reads = 0
+
+    @classmethod
+    def for_vault(cls, root: Union[str, Path]) -> "VaultIndex":
+        """Persistent index stored inside the vault's cache directory."""
+        return cls(root, cache_path=Path(root) / cls.DB_PATH)
+
+    def refresh(self) -> List[NoteRecord]:
+        """Walk the vault once; re-parse only new or changed notes.
+
+        Returns all current records in (sorted) walk order.
+        """
+        return self.notes(self.root, recursive=True)
+
+    def notes(
+        self, directory: Optional[Union[str, Path]] = None, recursive: bool = True
+    ) -> List[NoteRecord]:
+        """Current records under directory (default: the whole vault)."""
+        directory = Path(directory) if directory is not None else self.root
+        if not directory.is_dir():
+            return []
+        self._ensure_loaded()
+        records = []
+        seen = set()
+        if recursive:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+                for filename in sorted(filenames):
+                    if filename.endswith(".md"):
+                        record = self.get(Path(dirpath) / filename)
+                        if record is not None:
+                            records.append(record)
+                            seen.add(str(record.path))
+        else:
+            with os.scandir(directory) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.name.endswith(".md") and entry.is_file():
+                        record = self.get(Path(entry.path))
+                        if record is not None:
+                            records.append(record)
+                            seen.add(str(record.path))
+        self._forget_missing(directory, recursive, seen)
+        self.flush()
+        return records
+
+    def get(self, path: Union[str, Path]) -> Optional[NoteRecord]:
+        """Record for one note, re-parsed only if it changed on disk."""
+        self._ensure_loaded()
+        path = Path(path)
+        key = str(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                if self._records.pop(key, None) is not None:
+                    self._mark_dirty(path, None)
+            return None
+        with self._lock:
+            record = self._records.get(key)
+        if (
+            record is not None
+            and record.mtime_ns == stat.st_mtime_ns
+            and record.size == stat.st_size
+            and record.inode == stat.st_ino
+        ):
+            return record
+        record = parse_note_record(path, self.root, stat)
+        with self._lock:
+            self._records[key] = record
+            self._mark_dirty(path, record)
+            self.reads += 1
+        return record
+
+    def _forget_missing(self, directory: Path, recursive: bool, seen: set):
+        prefix = str(directory) + os.sep
+        with self._lock:
+            for key in list(self._records):
+                if key in seen or not key.startswith(prefix):
+                    continue
+                if recursive or os.path.dirname(key) == str(directory):
+                    self._mark_dirty(Path(key), None)
+                    del self._records[key]
+
+    def clear(self):
+        """Forget all records (in memory and on disk)."""
+        with self._lock:
+            self._records.clear()
+            self._dirty.clear()
+            self._loaded = True
+            if self.cache_path is not None and self.cache_path.exists():
+                try:
+                    db = self._connect()
+                    db.execute("DELETE FROM notes")
+                    db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not clear vault index cache: {e}")
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[NoteRecord]:
+        with self._lock:
+            return iter(list(self._records.values()))
+
+    # -- persistence -------------------------------------------------------
+
+    def _mark_dirty(self, path: Path, record: Optional[NoteRecord]):
+        if self.cache_path is None:
+            return
+        try:
+            rel_path = str(path.relative_to(self.root))
+        except ValueError:
+            return
+        self._dirty[rel_path] = record
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS notes")
+                self._db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS notes ("
+                "rel_path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+                "size INTEGER NOT NULL, inode INTEGER NOT NULL, "
+                "payload TEXT NOT NULL)"
+            )
+            self._db.commit()
+        return self._db
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not self.cache_path.exists():
+                return
+            try:
+                rows = self._connect().execute("SELECT * FROM notes").fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"Ignoring unreadable vault index cache: {e}")
+                return
+            for rel_path, mtime_ns, size, inode, payload in rows:
+                try:
+                    record = self._record_from_row(
+                        rel_path, mtime_ns, size, inode, payload
+                    )
+                except (ValueError, KeyError, TypeError):
+                    continue
+                self._records[str(record.path)] = record
+
+    def _record_from_row(
+        self, rel_path: str, mtime_ns: int, size: int, inode: int, payload: str
+    ) -> NoteRecord:
+        data = json.loads(payload)
+        return NoteRecord(
+            path=self.root / rel_path,
+            rel_path=rel_path,
+            mtime_ns=mtime_ns,
+            ctime=data["ctime"],
+            size=size,
+            inode=inode,
+            frontmatter=_decode_value(data["frontmatter"]),
+            has_frontmatter=data["has_frontmatter"],
+            title=data["title"],
+            links=data["links"],
+            body_link_count=data["body_link_count"],
+            inline_tags=tuple(data["inline_tags"]),
+            word_count=data["word_count"],
+            readable=data["readable"],
+        )
+
+    @staticmethod
+    def _row_from_record(rel_path: str, record: NoteRecord) -> Tuple:
+        payload = {
+            "ctime": record.ctime,
+            "frontmatter": _encode_value(record.frontmatter),
+            "has_frontmatter": record.has_frontmatter,
+            "title": record.title,
+            "links": record.links,
+            "body_link_count": record.body_link_count,
+            "inline_tags": list(record.inline_tags),
+            "word_count": record.word_count,
+            "readable": record.readable,
+        }
+        return (
+            rel_path,
+            record.mtime_ns,
+            record.size,
+            record.inode,
+            json.dumps(payload),
+        )
+
+    def flush(self):
+        """Write changed/removed records to the cache file (one transaction)."""
+        with self._lock:
+            if self.cache_path is None or not self._dirty:
+                return
+            if not self.root.is_dir():
+                self._dirty.clear()
+                return
+            dirty, self._dirty = self._dirty, {}
+            try:
+                db = self._connect()
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?)",
+                        [
+                            self._row_from_record(rel_path, record)
+                            for rel_path, record in dirty.items()
+                            if record is not None
+                        ],
+                    )
+                    db.executemany(
+                        "DELETE FROM notes WHERE rel_path = ?",
+                        [
+                            (rel_path,)
+                            for rel_path, record in dirty.items()
+                            if record is None
+                        ],
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not persist vault index: {e}")
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -16,6 +16,7 @@ TDD RED Phase: These tests define the expected behavior before implementation.
 
 import io
 import logging
+import re
 import sys
 from pathlib import Path
 import pytest
@@ -246,8 +247,8 @@ class TestPreCommitMarkerConfiguration:
             timeout=60,
         )
 
-        # Should collect at least some tests (not "0 selected")
-        assert "0 selected" not in result.stdout, (
+        # Should collect at least some tests (not "0 selected"; "1200 selected" is fine)
+        assert not re.search(r"\b0 selected", result.stdout), (
             f"Pre-commit marker should select tests.\n"
             f"stdout: {result.stdout}\n"
             f"stderr: {result.stderr}"
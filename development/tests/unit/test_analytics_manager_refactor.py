@@ -88,6 +88,23 @@ class TestAnalyticsQualityAssessment:
         assert result["link_count"] == 2
         assert result["has_frontmatter"] == True
 
+    def test_assess_quality_counts_block_list_tags_like_indexed_notes(
+        self, mock_base_dir, sample_config
+    ):
+        """Block-list frontmatter tags count the same as in batch scoring."""
+        note_path = mock_base_dir / "block-tags.md"
+        note_path.write_text(
+            "---\ntype: permanent\ntags:\n  - alpha\n  - beta\n---\n"
+            "# Note\nBody with #alpha and #gamma linking [[Other]].\n"
+        )
+        analytics = AnalyticsManager(mock_base_dir, sample_config)
+
+        result = analytics.assess_quality(str(note_path))
+        record = analytics.vault_index.get(note_path)
+
+        assert result["tag_count"] == 3
+        assert result == analytics._quality_from_record(record)
+
 
 class TestAnalyticsExceptionHandling:
     """Test Analytics raises appropriate exceptions."""
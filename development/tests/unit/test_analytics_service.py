@@ -0,0 +1,95 @@
+"""Tests for the long-lived, incrementally refreshed AnalyticsService."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.ai.analytics import AnalyticsService, NoteAnalytics
+from src.utils.vault_index import VaultIndex
+
+
+def _write(path: Path, body: str, mtime_ns: int) -> None:
+    path.write_text(f"---\ntype: permanent\nstatus: published\n---\n{body}")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    (tmp_path / "Permanent Notes").mkdir()
+    for i in range(3):
+        _write(tmp_path / "Permanent Notes" / f"n{i}.md", "word " * 10, 10**18 + i)
+    return tmp_path
+
+
+@pytest.fixture
+def service(vault: Path) -> AnalyticsService:
+    return AnalyticsService(vault, refresh_interval=60, vault_index=VaultIndex(vault))
+
+
+def test_report_matches_note_analytics(service, vault):
+    report, etag = service.report()
+
+    assert report == NoteAnalytics(str(vault)).generate_report()
+    assert etag and service.generated_at is not None
+
+
+def test_fresh_report_is_served_without_a_sweep(service):
+    first = service.report()
+    with patch.object(service.vault_index, "refresh") as sweep:
+        assert service.report() == first
+    sweep.assert_not_called()
+
+
+def test_unchanged_vault_keeps_etag_and_report(service):
+    report, etag = service.report()
+
+    assert service.refresh() is False
+    assert service.report() == (report, etag)
+
+
+def test_only_changed_notes_are_recomputed(service, vault):
+    _, etag = service.report()
+    reads = service.vault_index.reads
+    _write(vault / "Permanent Notes" / "n1.md", "word " * 110, 2 * 10**18)
+
+    with patch.object(
+        service.analytics,
+        "_stats_from_record",
+        wraps=service.analytics._stats_from_record,
+    ) as compute:
+        assert service.refresh() is True
+
+    assert service.vault_index.reads == reads + 1
+    assert [c.args[0].name for c in compute.call_args_list] == ["n1.md"]
+    report, new_etag = service.report()
+    assert new_etag != etag
+    assert report["overview"]["total_words"] == 10 + 110 + 10
+
+
+def test_stale_report_refreshes_in_background(service, vault):
+    report, etag = service.report()
+    (vault / "Permanent Notes" / "n2.md").unlink()
+    service.refresh_interval = 0
+
+    # The stale report is served immediately while the sweep runs
+    assert service.report() == (report, etag)
+    service._refresh_thread.join(timeout=5)
+
+    report, new_etag = service.report()
+    assert new_etag != etag
+    assert report["overview"]["total_notes"] == 2
+
+
+def test_close_waits_for_refresh_and_closes_index(service, vault):
+    service.report()
+    service.refresh_interval = 0
+    service.report()  # Schedules a background sweep
+    thread = service._refresh_thread
+
+    with patch.object(service.vault_index, "close") as close:
+        service.close()
+
+    assert thread is None or not thread.is_alive()
+    close.assert_called_once_with()
@@ -139,6 +139,22 @@ class TestBackupCLI:
         assert args.command == "prune-backups"
         assert args.keep == 5
 
+    def test_plan_moves_prints_dry_run_report(self, capsys):
+        """plan-moves prints each planned move and leaves the vault as it was."""
+        from src.cli.backup_cli import BackupCLI, create_parser
+
+        note = self.base_dir / "Inbox" / "idea.md"
+        note.write_text("---\ntype: permanent\n---\nBody")
+        assert create_parser().parse_args(["plan-moves"]).command == "plan-moves"
+
+        exit_code = BackupCLI(vault_path=str(self.base_dir)).plan_moves()
+
+        output = capsys.readouterr().out
+        assert exit_code == 0
+        assert "| Inbox/idea.md | Permanent Notes/idea.md |" in output
+        assert "- **Moves planned**: 1" in output
+        assert note.exists()
+
     def test_directory_organizer_integration(self):
         """TEST 6: Verify CLI uses DirectoryOrganizer for backup operations."""
         from src.cli.backup_cli import BackupCLI
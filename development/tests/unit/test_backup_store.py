@@ -0,0 +1,116 @@
+"""Tests for the content-addressed backup store."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.backup_store import BackupStore, BackupStoreError, hash_file
+from src.utils.directory_organizer import DirectoryOrganizer
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    root = tmp_path / "vault"
+    (root / "Inbox").mkdir(parents=True)
+    (root / "Media").mkdir()
+    (root / "Inbox" / "note.md").write_text("# Note")
+    (root / "Inbox" / "copy.md").write_text("# Note")
+    (root / "Media" / "photo.png").write_bytes(b"\x89PNG" * 256)
+    return root
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BackupStore:
+    return BackupStore(tmp_path / "backups" / "store")
+
+
+def test_snapshot_deduplicates_identical_content(vault, store):
+    manifest = store.snapshot(vault, "snap-1")
+
+    files = manifest["files"]
+    assert set(files) == {"Inbox/note.md", "Inbox/copy.md", "Media/photo.png"}
+    assert files["Inbox/note.md"]["hash"] == files["Inbox/copy.md"]["hash"]
+    assert files["Inbox/note.md"]["hash"] == hash_file(vault / "Inbox" / "note.md")
+    assert len(list(store.objects_dir.glob("*/*"))) == 2
+    assert manifest["total_size"] == 6 + 6 + 1024
+    assert manifest["stored_bytes"] == 6 + 1024
+    assert json.loads(store.manifest_path("snap-1").read_text())["name"] == "snap-1"
+
+
+def test_unchanged_files_are_not_rehashed(vault, store):
+    store.snapshot(vault, "snap-1")
+    (vault / "Inbox" / "new.md").write_text("fresh")
+
+    with patch("src.utils.backup_store.hash_file", wraps=hash_file) as hasher:
+        manifest = store.snapshot(vault, "snap-2")
+
+    hasher.assert_called_once_with(vault / "Inbox" / "new.md")
+    assert manifest["previous"] == "snap-1"
+    assert manifest["stored_bytes"] == 5
+    assert store.list_snapshots() == ["snap-2", "snap-1"]
+
+
+def test_selective_restore(vault, store, tmp_path):
+    store.snapshot(vault, "snap-1")
+    note = vault / "Inbox" / "note.md"
+    original_mtime = note.stat().st_mtime_ns
+    note.write_text("overwritten")
+    (vault / "Inbox" / "copy.md").write_text("also changed")
+
+    restored = store.restore("snap-1", vault, paths=["Inbox/note.md"])
+
+    assert restored == ["Inbox/note.md"]
+    assert note.read_text() == "# Note"
+    assert note.stat().st_mtime_ns == original_mtime
+    assert (vault / "Inbox" / "copy.md").read_text() == "also changed"
+
+    folder = store.restore("snap-1", tmp_path / "elsewhere", paths=["Media"])
+    assert folder == ["Media/photo.png"]
+
+    with pytest.raises(BackupStoreError):
+        store.restore("snap-1", vault, paths=["Inbox/missing.md"])
+
+
+def test_delete_and_gc_use_refcounts(vault, store):
+    store.snapshot(vault, "snap-1")
+    (vault / "Media" / "photo.png").write_bytes(b"edited")
+    os.utime(vault / "Media" / "photo.png", ns=(1, 1))
+    store.snapshot(vault, "snap-2")
+    assert len(list(store.objects_dir.glob("*/*"))) == 3
+
+    store.delete_snapshot("snap-1")
+    result = store.gc()
+
+    assert result == {"removed": 1, "freed_bytes": 1024}
+    assert store.refcounts()[hash_file(vault / "Inbox" / "note.md")] == 2
+    assert store.restore("snap-2", vault) == [
+        "Inbox/copy.md",
+        "Inbox/note.md",
+        "Media/photo.png",
+    ]
+
+
+def test_organizer_prunes_store_snapshots_without_disk_walk(vault, tmp_path):
+    organizer = DirectoryOrganizer(str(vault), backup_root=str(tmp_path / "backups"))
+    names = []
+    for i in range(3):
+        (vault / "Inbox" / f"extra-{i}.md").write_text(f"version {i}")
+        manifest_path = organizer.create_backup(store=True)
+        names.append(Path(manifest_path).stem)
+    assert organizer.list_snapshots() == sorted(names, reverse=True)
+
+    with patch.object(organizer, "_get_directory_size") as disk_walk:
+        plan = organizer.prune_backups(keep=1)
+
+    disk_walk.assert_not_called()
+    assert plan["snapshots_to_prune"] == sorted(names, reverse=True)[1:]
+    assert plan["deleted_count"] == 2
+    assert plan["gc"]["removed"] == 0  # every blob is still in the kept snapshot
+    assert organizer.list_snapshots() == [max(names)]
+
+    (vault / "Inbox" / "note.md").write_text("damaged")
+    organizer.restore_snapshot(max(names), ["Inbox/note.md"])
+    assert (vault / "Inbox" / "note.md").read_text() == "# Note"
@@ -330,3 +330,224 @@ class TestErrorHandling:
 
         assert result["processed"] == 1
         assert result["errors"] == 1
+
+
+class TestParallelInboxProcessing:
+    """Tests for the --workers fan-out mode."""
+
+    def _make_inbox(self, tmp_path: Path, count: int) -> Path:
+        inbox = tmp_path / "Inbox"
+        inbox.mkdir(parents=True)
+        for i in range(count):
+            (inbox / f"note{i:02d}.md").write_text(f"---\ntitle: Note {i}\n---\nBody")
+        return inbox
+
+    def test_parallel_matches_sequential_result(self, tmp_path: Path):
+        """workers > 1 should return the same result dict as a sequential run."""
+        inbox = self._make_inbox(tmp_path, 8)
+
+        from src.ai.batch_inbox_processor import batch_process_unprocessed_inbox
+
+        def fake_process(note_path, workflow_manager=None):
+            index = int(note_path.stem[-2:])
+            if index % 3 == 0:
+                raise Exception(f"boom {note_path.name}")
+            return {"success": True, "triage_recommendation": f"rec{index % 2}"}
+
+        results = []
+        for workers in (1, 4):
+            with patch("src.ai.batch.process_single_note", side_effect=fake_process):
+                results.append(
+                    batch_process_unprocessed_inbox(
+                        inbox, workflow_manager=object(), workers=workers
+                    )
+                )
+
+        sequential, parallel = results
+        assert parallel == sequential
+        assert parallel["processed"] == 5
+        assert sorted(d["note"] for d in parallel["error_details"]) == [
+            "note00.md",
+            "note03.md",
+            "note06.md",
+        ]
+
+    def test_parallel_runs_notes_concurrently(self, tmp_path: Path):
+        """Notes should be in flight on more than one worker at a time."""
+        import threading
+
+        inbox = self._make_inbox(tmp_path, 4)
+        barrier = threading.Barrier(2, timeout=5)
+
+        from src.ai.batch_inbox_processor import batch_process_unprocessed_inbox
+
+        def fake_process(note_path, workflow_manager=None):
+            barrier.wait()
+            return {"success": True}
+
+        with patch("src.ai.batch.process_single_note", side_effect=fake_process):
+            result = batch_process_unprocessed_inbox(
+                inbox, workflow_manager=object(), workers=2, show_progress=False
+            )
+
+        assert result["processed"] == 4
+        assert result["errors"] == 0
+
+    def test_locked_note_is_reported_as_error(self, tmp_path: Path):
+        """A note already held by note_lock should not be processed twice."""
+        inbox = self._make_inbox(tmp_path, 2)
+
+        from src.ai.batch import batch_process_unprocessed_inbox, note_lock
+
+        with patch("src.ai.batch.process_single_note") as mock_process:
+            mock_process.return_value = {"success": True}
+            with note_lock(inbox / "note00.md"):
+                result = batch_process_unprocessed_inbox(
+                    inbox, workflow_manager=object(), workers=2, show_progress=False
+                )
+
+        assert result["processed"] == 1
+        assert result["errors"] == 1
+        assert result["error_details"][0]["note"] == "note00.md"
+        assert "already being processed" in result["error_details"][0]["error"]
+        mock_process.assert_called_once()
+
+    def test_note_lock_released_after_use(self, tmp_path: Path):
+        """note_lock should be re-acquirable once the block exits."""
+        note = tmp_path / "note.md"
+        note.write_text("content")
+
+        from src.ai.batch import NoteLockedError, note_lock
+
+        with note_lock(note):
+            with pytest.raises(NoteLockedError):
+                with note_lock(note):
+                    pass
+        with note_lock(note):
+            pass
+
+    def test_note_lock_survives_note_being_replaced(self, tmp_path: Path):
+        """Another process can't take the lock after safe_write swaps the file."""
+        import multiprocessing
+
+        from src.ai import batch
+        from src.utils.io import safe_write
+
+        note = tmp_path / "note.md"
+        note.write_text("content")
+
+        def contend(queue):
+            batch._notes_in_progress.clear()  # Forked copy of this process's set
+            try:
+                with batch.note_lock(note):
+                    queue.put("acquired")
+            except batch.NoteLockedError as e:
+                queue.put(str(e))
+
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        with batch.note_lock(note):
+            safe_write(note, "rewritten")
+            child = ctx.Process(target=contend, args=(queue,))
+            child.start()
+            outcome = queue.get(timeout=10)
+            child.join(timeout=10)
+
+        assert "locked by another process" in outcome
+        assert not list(tmp_path.glob(".embedding_cache/note_locks/*"))
+
+    def test_sequential_run_takes_note_lock(self, tmp_path: Path):
+        """workers=1 must not process a note another run is holding."""
+        inbox = self._make_inbox(tmp_path, 2)
+
+        from src.ai.batch import batch_process_unprocessed_inbox, note_lock
+
+        with patch("src.ai.batch.process_single_note") as mock_process:
+            mock_process.return_value = {"success": True}
+            with note_lock(inbox / "note01.md"):
+                result = batch_process_unprocessed_inbox(
+                    inbox, workflow_manager=object(), workers=1, show_progress=False
+                )
+
+        assert result["processed"] == 1
+        assert result["error_details"][0]["note"] == "note01.md"
+        mock_process.assert_called_once()
+
+    def test_lock_files_stay_out_of_the_inbox(self, tmp_path: Path):
+        """Locks live under the vault's cache dir and are removed on release."""
+        inbox = self._make_inbox(tmp_path, 4)
+
+        from src.ai.batch import batch_process_unprocessed_inbox
+
+        seen = []
+
+        def fake_process(note_path, workflow_manager=None):
+            seen.extend(tmp_path.glob(".embedding_cache/note_locks/*.lock"))
+            return {"success": True}
+
+        for workers in (1, 2):
+            with patch("src.ai.batch.process_single_note", side_effect=fake_process):
+                batch_process_unprocessed_inbox(
+                    inbox, workflow_manager=object(), workers=workers
+                )
+
+        assert seen
+        assert sorted(p.name for p in inbox.iterdir()) == [
+            f"note{i:02d}.md" for i in range(4)
+        ]
+        assert not list(tmp_path.glob(".embedding_cache/note_locks/*"))
+
+    def test_parallel_workers_share_connection_discovery(self, tmp_path: Path):
+        """Workers syncing and querying one connection index don't trip up."""
+        import hashlib
+
+        from src.ai.batch import batch_process_unprocessed_inbox
+        from src.ai.connections_discovery import ConnectionCoordinator
+
+        inbox = self._make_inbox(tmp_path, 16)
+        corpus = tmp_path / "Permanent Notes"
+        corpus.mkdir()
+
+        def embed(text):
+            digest = hashlib.sha256(text.encode()).digest()
+            return [b / 255.0 + 0.01 for b in digest[:8]]
+
+        class FakeOllama:
+            embed_batch_size = 4
+
+            def health_check(self, use_cache=True):
+                return True
+
+            def generate_embedding(self, text):
+                return embed(text)
+
+            def generate_embeddings(self, texts, batch_size=None):
+                return [embed(t) for t in texts]
+
+        coordinator = ConnectionCoordinator(str(tmp_path), min_similarity=0.0)
+        coordinator.connections.embedding_cache = None
+        coordinator.connections.ollama_client = FakeOllama()
+
+        class ConnectionsOnlyManager:
+            def process_inbox_note(self, path, dry_run=False):
+                note = Path(path)
+                # Each note grows the corpus while other workers sync it
+                (corpus / f"from-{note.name}").write_text(f"Promoted {note.stem}")
+                connections = coordinator.discover_connections(
+                    note.read_text(), corpus_dir=corpus
+                )
+                return {"recommendations": [{"action": "add_links"}], "n": connections}
+
+        result = batch_process_unprocessed_inbox(
+            inbox,
+            workflow_manager=ConnectionsOnlyManager(),
+            workers=8,
+            show_progress=False,
+        )
+
+        assert result["errors"] == 0, result["error_details"]
+        assert result["processed"] == 16
+        index = coordinator.sync_index(corpus)
+        assert sorted(index.keys()) == sorted(p.name for p in corpus.glob("*.md"))
+        # Every note found at least its own promoted copy through the index
+        assert coordinator.get_connection_statistics()["total_discoveries"] >= 16
@@ -17,8 +17,12 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 src_dir = os.path.join(os.path.dirname(os.path.dirname(current_dir)), "src")
 sys.path.insert(0, src_dir)
 
-from ai.connections_discovery import AIConnections, ConnectionCoordinator
-
+from ai.connections_discovery import (
+    AIConnections,
+    ConnectionCoordinator,
+    EmbeddingMatrix,
+    NoteEmbeddingIndex,
+)
 
 # ---------------------------------------------------------------------------
 # AIConnections — interface
@@ -104,6 +108,253 @@ class TestAIConnectionsBehaviour:
         assert result == {}
 
 
+# ---------------------------------------------------------------------------
+# EmbeddingMatrix — vectorized scoring
+# ---------------------------------------------------------------------------
+
+
+EMBEDDINGS = {
+    "ml": [1.0, 0.0, 0.0],
+    "deep learning": [0.9, 0.1, 0.0],
+    "pasta": [0.0, 0.0, 1.0],
+    "neural nets": [0.8, 0.2, 0.1],
+}
+
+
+class FakeOllama:
+    """Stands in for OllamaClient; records single and batch embedding calls."""
+
+    embed_batch_size = 32
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.single_calls = 0
+        self.batches = []
+
+    def health_check(self, use_cache=True):
+        return not self.fail
+
+    def generate_embedding(self, text):
+        self.single_calls += 1
+        return EMBEDDINGS[text]
+
+    def generate_embeddings(self, texts, batch_size=None):
+        self.batches.append(list(texts))
+        return [EMBEDDINGS[t] for t in texts]
+
+
+def _with_fake_ollama(connections, fail=False):
+    connections.embedding_cache = None
+    connections.ollama_client = FakeOllama(fail=fail)
+    return connections.ollama_client
+
+
+class TestEmbeddingMatrix:
+    def _matrix(self):
+        names = ["a.md", "b.md", "c.md"]
+        vectors = [[1.0, 0.0], [0.0, 2.0], [3.0, 3.0]]
+        return EmbeddingMatrix(names, vectors, {n: (0, 0) for n in names})
+
+    def test_top_k_orders_by_cosine(self):
+        result = self._matrix().top_k([1.0, 0.0], k=3)
+        assert [name for name, _ in result] == ["a.md", "c.md", "b.md"]
+        assert result[0][1] == pytest.approx(1.0)
+        assert result[1][1] == pytest.approx(0.7071, abs=1e-4)
+
+    def test_top_k_respects_threshold_and_k(self):
+        result = self._matrix().top_k([1.0, 0.0], k=1, threshold=0.5)
+        assert result == [("a.md", pytest.approx(1.0))]
+
+    def test_top_k_allowed_subset(self):
+        result = self._matrix().top_k([1.0, 0.0], k=3, allowed={"b.md", "c.md"})
+        assert [name for name, _ in result] == ["c.md", "b.md"]
+
+    def test_top_k_dimension_mismatch(self):
+        assert self._matrix().top_k([1.0, 0.0, 0.0], k=3) == []
+
+    def test_find_similar_notes_uses_matrix(self):
+        c = AIConnections(similarity_threshold=0.7, use_cache=False)
+        _with_fake_ollama(c)
+        corpus = {"dl.md": "deep learning", "p.md": "pasta", "nn.md": "neural nets"}
+        with patch.object(c, "_calculate_semantic_similarity") as per_note:
+            result = c.find_similar_notes("ml", corpus)
+        per_note.assert_not_called()
+        assert [name for name, _ in result] == ["dl.md", "nn.md"]
+
+    def test_matrix_reused_across_calls(self):
+        c = AIConnections(use_cache=False)
+        fake = _with_fake_ollama(c)
+        corpus = {"dl.md": "deep learning", "p.md": "pasta"}
+        c.find_similar_notes("ml", corpus)
+        c.find_similar_notes("neural nets", corpus)
+        # corpus embedded once in a single batch + 1 query embedding per call
+        assert fake.batches == [["deep learning", "pasta"]]
+        assert fake.single_calls == 2
+
+    def test_build_connection_map_excludes_self(self):
+        c = AIConnections(similarity_threshold=0.7, use_cache=False)
+        _with_fake_ollama(c)
+        corpus = {"dl.md": "deep learning", "p.md": "pasta", "nn.md": "neural nets"}
+        result = c.build_connection_map(corpus)
+        assert [name for name, _ in result["dl.md"]] == ["nn.md"]
+        assert result["p.md"] == []
+
+    def test_falls_back_when_embeddings_unavailable(self):
+        c = AIConnections(use_cache=False)
+        _with_fake_ollama(c, fail=True)
+        corpus = {"a.md": "alpha", "b.md": "beta"}
+        with patch.object(
+            c, "_calculate_semantic_similarity", return_value=0.9
+        ) as per_note:
+            result = c.find_similar_notes("alpha", corpus)
+        assert per_note.call_count == 2
+        assert len(result) == 2
+
+
+# ---------------------------------------------------------------------------
+# NoteEmbeddingIndex — persistent ANN index
+# ---------------------------------------------------------------------------
+
+
+def _unit(i, dim=16):
+    v = [0.01] * dim
+    v[i % dim] = 1.0
+    return v
+
+
+class TestNoteEmbeddingIndex:
+    def test_query_returns_nearest(self):
+        index = NoteEmbeddingIndex(exhaustive_below=0)
+        for i in range(40):
+            index.upsert(f"n{i}.md", _unit(i), content_hash=str(i))
+        result = index.query(_unit(3), k=2, threshold=0.5)
+        assert result[0][0] in {"n3.md", "n19.md", "n35.md"}
+        assert result[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    def test_remove_and_replace(self):
+        index = NoteEmbeddingIndex()
+        index.upsert("a.md", _unit(0), content_hash="h1")
+        index.upsert("b.md", _unit(1), content_hash="h2")
+        index.remove("a.md")
+        assert "a.md" not in index
+        assert [k for k, _ in index.query(_unit(0), k=5, threshold=0.9)] == []
+        index.upsert("b.md", _unit(0), content_hash="h3")
+        assert index.query(_unit(0), k=1)[0][0] == "b.md"
+        assert len(index) == 1
+
+    def test_persistence_roundtrip(self, tmp_path):
+        index = NoteEmbeddingIndex(tmp_path / "idx")
+        index.upsert("a.md", _unit(0), "h1", mtime_ns=5, size=10)
+        index.upsert("empty.md", None, "h2", mtime_ns=6, size=0)
+        index.save()
+        loaded = NoteEmbeddingIndex.load(tmp_path / "idx")
+        assert loaded.is_current("a.md", 5, 10)
+        assert loaded.content_hash("empty.md") == "h2"
+        assert loaded.query(_unit(0), k=1)[0][0] == "a.md"
+
+    def test_concurrent_upsert_query_and_save(self, tmp_path):
+        import threading
+
+        index = NoteEmbeddingIndex(tmp_path / "idx", exhaustive_below=0)
+        errors = []
+
+        def writer(offset):
+            try:
+                for i in range(offset, offset + 300):
+                    index.upsert(f"n{i}.md", _unit(i), content_hash=str(i))
+                    if i % 3 == 0:
+                        index.remove(f"n{i - 1}.md")
+            except Exception as e:
+                errors.append(e)
+
+        def reader():
+            try:
+                for i in range(300):
+                    index.query(_unit(i), k=3)
+                    if i % 20 == 0:
+                        index.save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n * 1000,)) for n in range(3)]
+        threads += [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        index.save()
+        assert sorted(NoteEmbeddingIndex.load(tmp_path / "idx").keys()) == sorted(
+            index.keys()
+        )
+
+    def test_load_corrupt_index_starts_empty(self, tmp_path):
+        (tmp_path / NoteEmbeddingIndex.META_FILE).write_text("{not json")
+        assert len(NoteEmbeddingIndex.load(tmp_path).keys()) == 0
+
+
+class TestConnectionCoordinatorIndex:
+    def _vault(self, tmp_path):
+        corpus = tmp_path / "Permanent Notes"
+        corpus.mkdir()
+        (corpus / "dl.md").write_text("deep learning")
+        (corpus / "p.md").write_text("pasta")
+        return corpus
+
+    def test_discover_uses_index_and_embeds_incrementally(self, tmp_path):
+        corpus = self._vault(tmp_path)
+        coord = ConnectionCoordinator(str(tmp_path))
+        fake = _with_fake_ollama(coord.connections)
+        first = coord.discover_connections("ml", corpus_dir=corpus)
+        second = coord.discover_connections("ml", corpus_dir=corpus)
+        assert [c["filename"] for c in first] == ["dl.md"]
+        assert second == first
+        # corpus embedded once in one batch + 1 query per call
+        assert sorted(fake.batches[0]) == ["deep learning", "pasta"]
+        assert len(fake.batches) == 1
+        assert fake.single_calls == 2
+        assert (coord.index_dir / "Permanent_Notes" / "index.json").exists()
+
+    def test_index_tracks_deletes_and_edits(self, tmp_path):
+        corpus = self._vault(tmp_path)
+        coord = ConnectionCoordinator(str(tmp_path))
+        _with_fake_ollama(coord.connections)
+        coord.discover_connections("ml", corpus_dir=corpus)
+        (corpus / "dl.md").unlink()
+        (corpus / "p.md").write_text("neural nets")
+        result = coord.discover_connections("ml", corpus_dir=corpus)
+        assert [c["filename"] for c in result] == ["p.md"]
+
+    def test_new_embedding_dimension_rebuilds_whole_index(self, tmp_path):
+        corpus = self._vault(tmp_path)
+        coord = ConnectionCoordinator(str(tmp_path))
+        fake = _with_fake_ollama(coord.connections)
+        coord.sync_index(corpus)
+        (corpus / "p.md").write_text("neural nets")
+        # Swap to a model with a wider embedding: only p.md changed on disk
+        wider = {text: vector + [0.0] for text, vector in EMBEDDINGS.items()}
+        fake.generate_embeddings = lambda texts, batch_size=None: [
+            wider[t] for t in texts
+        ]
+        index = coord.sync_index(corpus)
+        assert sorted(index.keys()) == ["dl.md", "p.md"]
+        assert index.dimension == 4
+        with pytest.raises(ValueError):
+            index.upsert("x.md", [1.0, 0.0, 0.0], content_hash="h")
+
+    def test_falls_back_when_embeddings_unavailable(self, tmp_path):
+        corpus = self._vault(tmp_path)
+        coord = ConnectionCoordinator(str(tmp_path))
+        _with_fake_ollama(coord.connections, fail=True)
+        with patch.object(
+            coord.connections, "find_similar_notes", return_value=[("p.md", 0.8)]
+        ) as legacy:
+            result = coord.discover_connections("ml", corpus_dir=corpus)
+        legacy.assert_called_once()
+        assert result == [{"filename": "p.md", "similarity": 0.8}]
+
+
 # ---------------------------------------------------------------------------
 # ConnectionCoordinator — interface
 # ---------------------------------------------------------------------------
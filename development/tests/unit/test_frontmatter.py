@@ -4,6 +4,13 @@ import os
 # Add src to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
 
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.utils import frontmatter
 from src.utils.frontmatter import parse_frontmatter, build_frontmatter
 
 
@@ -279,3 +286,66 @@ This is test content for roundtrip testing."""
         fields1 = extract_field_order(content1)
         fields2 = extract_field_order(content2)
         assert fields1 == fields2
+
+
+class TestFastFrontmatterPath:
+    """The fast path must agree with yaml.safe_load or defer to it."""
+
+    @pytest.mark.parametrize(
+        "yaml_content",
+        [
+            "type: permanent\ncreated: 2025-08-18 20:30\ntags: [a, b c, 12]",
+            "published: 2025-08-18\ndraft: yes\nscore: 0.85\ncount: 0123",
+            "empty:\nnull_value: ~\ntime: 10:30\nhex: 0x1f",
+            "title: \"Quoted: with colon\"\nalt: 'it''s'\nlist: []",
+            "# comment\nai_tags:\n  - one\n  - 2\nafter: x",
+            "ai_tags:\n- one\n-\nurl: https://example.com/a#b",
+        ],
+    )
+    def test_matches_yaml_safe_load(self, yaml_content):
+        expected = yaml.safe_load(yaml_content)
+        assert frontmatter._parse_simple_frontmatter(yaml_content) == expected
+        assert parse_frontmatter(f"---\n{yaml_content}\n---\nBody")[0] == expected
+
+    @pytest.mark.parametrize(
+        "yaml_content",
+        [
+            "review:\n  reviewer: me",
+            "summary: >\n  folded",
+            "linked: [[Some Note]]",
+            "a: &anchor x\nb: *anchor",
+            "status: draft # trailing comment",
+            "title: continues\n  on the next line",
+            "yes: boolean key",
+            "tags:\n  - a\n    - b",
+            "type: permanent\r\nstatus: draft",
+            "key: value\twith tab",
+        ],
+    )
+    def test_defers_to_yaml_loader(self, yaml_content):
+        assert frontmatter._parse_simple_frontmatter(yaml_content) is None
+
+    def test_fallback_results_are_unchanged(self):
+        content = "---\nreview:\n  passes: 2\nlinked: [[Note]]\n---\nBody"
+
+        metadata, body = parse_frontmatter(content)
+
+        assert metadata == {"review": {"passes": 2}, "linked": [["Note"]]}
+        assert body == "Body"
+
+    def test_fast_path_skips_yaml_loader(self):
+        content = "---\ntype: fleeting\ncreated: 2025-01-02\n---\n"
+
+        with patch.object(frontmatter.yaml, "load") as load:
+            metadata, body = parse_frontmatter(content)
+
+        load.assert_not_called()
+        assert metadata == {"type": "fleeting", "created": date(2025, 1, 2)}
+        assert body == ""
+
+    def test_invalid_yaml_still_returns_empty_metadata(self):
+        content = "---\nkey: [unclosed\n---\nBody"
+
+        with patch.object(frontmatter, "FAST_PATH_ENABLED", False):
+            assert parse_frontmatter(content) == ({}, content)
+        assert parse_frontmatter(content) == ({}, content)
@@ -3,12 +3,13 @@ Spec tests for the unified inneros CLI (#121).
 
 Verifies the public interface of src/cli/inneros.py:
 - Single entry point replaces backup_cli, fleeting_cli, weekly_review_cli
-- Top-level subcommands: backup, fleeting, review, inbox
+- Top-level subcommands: backup, fleeting, review, inbox, cache
 - All original subcommand flags preserved
 - Makefile targets continue to work via the new entry point
 """
 
 import sys
+import json
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -75,6 +76,21 @@ class TestBackupSubcommand:
     def test_backup_default_no_subcommand(self):
         args = self.parser.parse_args(["--vault", "/tmp", "backup"])
         assert args.command == "backup"
+        assert args.incremental is False
+
+    def test_backup_incremental_flag(self):
+        args = self.parser.parse_args(["--vault", "/tmp", "backup", "--incremental"])
+        assert args.incremental is True
+
+    def test_backup_store_and_restore(self):
+        args = self.parser.parse_args(["--vault", "/tmp", "backup", "--store"])
+        assert args.store is True
+        args = self.parser.parse_args(
+            ["--vault", "/tmp", "backup", "restore", "knowledge-1", "--path", "a.md"]
+        )
+        assert args.subcommand == "restore"
+        assert args.snapshot == "knowledge-1"
+        assert args.paths == ["a.md"]
 
     def test_backup_prune_subcommand(self):
         args = self.parser.parse_args(["--vault", "/tmp", "backup", "prune"])
@@ -190,6 +206,48 @@ class TestInboxSubcommand:
         args = self.parser.parse_args(["--vault", "/tmp", "inbox", "--format", "json"])
         assert args.format == "json"
 
+    def test_inbox_workers_defaults_to_one(self):
+        args = self.parser.parse_args(["--vault", "/tmp", "inbox"])
+        assert args.workers == 1
+
+    def test_inbox_has_workers_flag(self):
+        args = self.parser.parse_args(["--vault", "/tmp", "inbox", "--workers", "4"])
+        assert args.workers == 4
+
+    def test_inbox_rejects_non_positive_workers(self):
+        with pytest.raises(SystemExit):
+            self.parser.parse_args(["--vault", "/tmp", "inbox", "--workers", "0"])
+
+
+# ---------------------------------------------------------------------------
+# cache subcommand
+# ---------------------------------------------------------------------------
+
+
+class TestCacheSubcommand:
+    def test_cache_stats_json(self, tmp_path, capsys):
+        assert main(["--vault", str(tmp_path), "cache", "stats", "--format", "json"]) == 0
+        stats = json.loads(capsys.readouterr().out)
+        assert stats["entries"] == 0
+
+    def test_cache_clear_note(self, tmp_path, capsys):
+        from src.ai.batch import NoteResultCache
+
+        note = tmp_path / "note.md"
+        note.write_text("---\ntitle: Note\n---\nBody\n")
+        cache = NoteResultCache.for_vault(tmp_path)
+        cache.put("k1", NoteResultCache.body_hash("Body\n"), {"tags": ["a"]})
+        cache.put("k2", NoteResultCache.body_hash("Other"), {"tags": ["b"]})
+        cache.close()
+
+        assert main(["--vault", str(tmp_path), "cache", "clear", "--note", "note.md"]) == 0
+        assert "Removed 1" in capsys.readouterr().out
+        assert NoteResultCache.for_vault(tmp_path).stats()["entries"] == 1
+
+    def test_cache_requires_subcommand(self):
+        with pytest.raises(SystemExit):
+            create_parser().parse_args(["--vault", "/tmp", "cache"])
+
 
 # ---------------------------------------------------------------------------
 # main() dispatch — each command calls the right handler
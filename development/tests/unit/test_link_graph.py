@@ -0,0 +1,170 @@
+"""Tests for LinkGraph and LinkResolver in the analytics module."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.ai.analytics import (
+    AnalyticsCoordinator,
+    AnalyticsManager,
+    LinkGraph,
+    LinkResolver,
+    normalize_link_target,
+)
+from src.utils.vault_index import VaultIndex
+
+
+@pytest.mark.parametrize(
+    "target, expected",
+    [
+        ("Note", "note"),
+        ("Note|Alias", "note"),
+        ("Note#Heading", "note"),
+        ("Folder/Sub/Note.md#Heading|Alias", "note"),
+        ("Note\\|alias", "note"),
+        ("  spaced note  ", "spaced note"),
+    ],
+)
+def test_normalize_link_target(target, expected):
+    assert normalize_link_target(target) == expected
+
+
+class TestLinkGraph:
+    @pytest.fixture
+    def graph(self) -> LinkGraph:
+        graph = LinkGraph()
+        graph.add_note("Hub", ["Spoke1", "spoke2|Two", "Missing"])
+        graph.add_note("Spoke1", ["hub#Intro", "Spoke1"])
+        graph.add_note("Spoke2", [])
+        graph.add_note("Island", [])
+        graph.add_note("PairA", ["PairB"])
+        graph.add_note("PairB", [])
+        return graph
+
+    def test_degrees_use_reverse_index(self, graph):
+        assert graph.out_degree("hub") == 3
+        assert graph.in_degree("Hub") == 1
+        assert graph.incoming("spoke2") == {"hub"}
+        # Self links count as outgoing but never as incoming
+        assert graph.in_degree("Spoke1") == 1
+
+    def test_neighbours_only_include_existing_notes(self, graph):
+        assert graph.neighbours("Hub") == {"spoke1", "spoke2"}
+
+    def test_orphans(self, graph):
+        assert graph.is_orphan("Island")
+        assert not graph.is_orphan("Spoke2")
+        assert not graph.is_orphan("PairB")
+
+    def test_components(self, graph):
+        components = graph.components()
+        assert components[0] == {"hub", "spoke1", "spoke2"}
+        assert {"paira", "pairb"} in components
+        assert {"island"} in components
+        assert graph.summary() == {
+            "nodes": 6,
+            "links": 6,
+            "components": 3,
+            "largest_component": 3,
+        }
+
+
+class TestCoordinatorUsesLinkGraph:
+    @pytest.fixture
+    def vault(self, tmp_path: Path) -> Path:
+        permanent = tmp_path / "Permanent Notes"
+        permanent.mkdir()
+        (tmp_path / "Inbox").mkdir()
+        (permanent / "hub.md").write_text("# Hub\n[[Spoke|the spoke]]")
+        (permanent / "Spoke.md").write_text("# Spoke\nNo links out")
+        (permanent / "lonely.md").write_text("# Lonely")
+        (tmp_path / "Inbox" / "fresh.md").write_text("# Fresh")
+        return tmp_path
+
+    def test_aliased_links_count_as_incoming(self, vault):
+        orphans = AnalyticsCoordinator(vault).detect_orphaned_notes()
+        assert [Path(o["path"]).name for o in orphans] == ["lonely.md"]
+
+    def test_enhanced_metrics_builds_graph_once(self, vault):
+        coordinator = AnalyticsCoordinator(vault)
+        with patch.object(
+            LinkGraph, "from_records", wraps=LinkGraph.from_records
+        ) as from_records:
+            metrics = coordinator.generate_enhanced_metrics()
+
+        assert from_records.call_count == 1
+        assert metrics["summary"]["total_orphaned"] == 1
+        assert metrics["link_graph"]["components"] == 3
+        assert metrics["link_density"] == pytest.approx(1 / 4)
+
+
+class TestLinkResolver:
+    @pytest.fixture
+    def resolver(self, tmp_path: Path) -> LinkResolver:
+        (tmp_path / "Projects").mkdir()
+        (tmp_path / "Archive").mkdir()
+        (tmp_path / "Projects" / "Plan.md").write_text("# Plan")
+        (tmp_path / "Archive" / "Plan.md").write_text("# Old plan")
+        (tmp_path / "Projects" / "Roadmap.md").write_text(
+            "---\naliases: [Q3 Goals]\n---\n# Roadmap"
+        )
+        (tmp_path / "Planning.md").write_text("# Planning")
+        return LinkResolver(VaultIndex(tmp_path).refresh())
+
+    def test_stem_alias_and_heading_suffixes(self, resolver):
+        assert resolver.resolve("Planning") == "Planning.md"
+        assert resolver.resolve("planning#Goals|see here") == "Planning.md"
+        assert resolver.resolve("q3 goals") == os.path.join("Projects", "Roadmap.md")
+
+    def test_short_links_do_not_match_substrings(self, resolver):
+        assert resolver.resolve("Plan", "Planning.md") is not None
+        assert resolver.resolve("Pla") is None
+        assert resolver.resolve("lan") is None
+
+    def test_duplicate_stems_prefer_source_folder(self, resolver):
+        archived = os.path.join("Archive", "Plan.md")
+        assert resolver.resolve("Plan", os.path.join("Archive", "x.md")) == archived
+        assert resolver.resolve("Archive/Plan") == archived
+        assert resolver.resolve("Projects/Plan.md#Intro") == os.path.join(
+            "Projects", "Plan.md"
+        )
+
+    def test_scalar_aliases_do_not_break_the_resolver(self, tmp_path: Path):
+        (tmp_path / "Year.md").write_text("---\naliases: 2024\n---\n# Year")
+        (tmp_path / "Flag.md").write_text("---\nalias: true\n---\n# Flag")
+        (tmp_path / "Other.md").write_text("# Other")
+        resolver = LinkResolver(VaultIndex(tmp_path).refresh())
+
+        assert resolver.resolve("2024") == "Year.md"
+        assert resolver.resolve("Other") == "Other.md"
+
+    def test_partial_paths_resolve_by_folder_suffix(self, tmp_path: Path):
+        for folder in ("Work/Projects", "Home/Projects", "Work/Notes"):
+            (tmp_path / folder).mkdir(parents=True)
+            (tmp_path / folder / "Plan.md").write_text("# Plan")
+        resolver = LinkResolver(VaultIndex(tmp_path).refresh())
+
+        work_plan = os.path.join("Work", "Projects", "Plan.md")
+        assert resolver.resolve("Notes/Plan") == os.path.join(
+            "Work", "Notes", "Plan.md"
+        )
+        assert resolver.resolve("projects/plan", work_plan) == work_plan
+        assert resolver.resolve(
+            "Projects/Plan", os.path.join("Home", "Projects", "x.md")
+        ) == (os.path.join("Home", "Projects", "Plan.md"))
+        assert resolver.resolve("jects/Plan") is None
+        assert resolver.resolve("Other/Plan") is None
+
+
+def test_manager_link_graph_counts_exact_incoming(tmp_path: Path):
+    (tmp_path / "Plan.md").write_text("# Plan\n[[Planning]]")
+    (tmp_path / "Planning.md").write_text("# Planning\n[[plan|the plan]] [[Plan#Top]]")
+    (tmp_path / "Other.md").write_text("# Other\n[[Pla]]")
+
+    graph = AnalyticsManager(tmp_path, {})._build_link_graph()
+
+    assert graph["Plan.md"]["incoming"] == ["Planning.md"]
+    assert graph["Planning.md"]["incoming"] == ["Plan.md"]
+    assert graph["Other.md"]["incoming"] == []
@@ -10,7 +10,6 @@ from pathlib import Path
 import pytest
 import requests
 
-
 # ---------------------------------------------------------------------------
 # OllamaClient — imported from the new module location
 # ---------------------------------------------------------------------------
@@ -44,20 +43,20 @@ class TestOllamaClientFromLLMClient:
     def test_health_check_success(self):
         from src.ai.llm_client import OllamaClient
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value = Mock(status_code=200)
             assert OllamaClient().health_check() is True
 
     def test_health_check_connection_error(self):
         from src.ai.llm_client import OllamaClient
 
-        with patch("requests.get", side_effect=requests.ConnectionError()):
+        with patch("requests.Session.get", side_effect=requests.ConnectionError()):
             assert OllamaClient().health_check() is False
 
     def test_generate_completion_strips_whitespace(self):
         from src.ai.llm_client import OllamaClient
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value = Mock(
                 status_code=200, json=lambda: {"response": "  hi  "}
             )
@@ -66,7 +65,7 @@ class TestOllamaClientFromLLMClient:
     def test_generate_completion_omits_num_predict_by_default(self):
         from src.ai.llm_client import OllamaClient
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value = Mock(
                 status_code=200, json=lambda: {"response": "ok"}
             )
@@ -77,7 +76,7 @@ class TestOllamaClientFromLLMClient:
     def test_generate_completion_sends_num_predict_when_set(self):
         from src.ai.llm_client import OllamaClient
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value = Mock(
                 status_code=200, json=lambda: {"response": "ok"}
             )
@@ -85,12 +84,106 @@ class TestOllamaClientFromLLMClient:
             options = mock_post.call_args[1]["json"]["options"]
             assert options["num_predict"] == 512
 
+    def test_health_check_cached_within_ttl(self):
+        from src.ai.llm_client import OllamaClient
+
+        client = OllamaClient({"health_check_ttl": 60})
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = Mock(status_code=200)
+            assert client.health_check() is True
+            assert client.health_check() is True
+            assert mock_get.call_count == 1
+            client.health_check(use_cache=False)
+            assert mock_get.call_count == 2
+
+    def test_health_check_ttl_zero_disables_cache(self):
+        from src.ai.llm_client import OllamaClient
+
+        client = OllamaClient({"health_check_ttl": 0})
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = Mock(status_code=200)
+            client.health_check()
+            client.health_check()
+            assert mock_get.call_count == 2
+
+    def test_generate_embeddings_chunks_batch_requests(self):
+        from src.ai.llm_client import OllamaClient
+
+        def respond(url, json, timeout):
+            return Mock(
+                status_code=200,
+                json=lambda: {"embeddings": [[float(len(t))] for t in json["input"]]},
+            )
+
+        client = OllamaClient({"embed_batch_size": 2})
+        with patch("requests.Session.post", side_effect=respond) as mock_post:
+            result = client.generate_embeddings(["a", "bb", "ccc"])
+        assert result == [[1.0], [2.0], [3.0]]
+        assert mock_post.call_count == 2
+        assert mock_post.call_args_list[0][0][0].endswith("/api/embed")
+        assert mock_post.call_args_list[0][1]["json"]["input"] == ["a", "bb"]
+
+    def test_generate_embeddings_falls_back_without_batch_endpoint(self):
+        from src.ai.llm_client import OllamaClient
+
+        def respond(url, json, timeout):
+            if url.endswith("/api/embed"):
+                return Mock(status_code=404, text="not found")
+            return Mock(status_code=200, json=lambda: {"embedding": [0.5]})
+
+        with patch("requests.Session.post", side_effect=respond):
+            result = OllamaClient().generate_embeddings(["a", "b"])
+        assert result == [[0.5], [0.5]]
+
+    def test_clients_share_pooled_session_per_base_url(self):
+        from src.ai.llm_client import OllamaClient
+
+        a = OllamaClient({"model": "a"})
+        b = OllamaClient({"model": "b"})
+        other = OllamaClient({"base_url": "http://elsewhere:11434"})
+        assert a.session is b.session
+        assert other.session is not a.session
+
+    def test_pool_size_grows_on_request(self):
+        from src.ai.llm_client import get_http_session
+
+        session = get_http_session("http://pool-test:1", pool_maxsize=4)
+        assert get_http_session("http://pool-test:1", pool_maxsize=16) is session
+        adapter = session.get_adapter("http://pool-test:1/api/tags")
+        assert adapter._pool_maxsize == 16
+
+    def test_get_ollama_client_registry(self):
+        from src.ai.llm_client import get_ollama_client
+
+        assert get_ollama_client({"model": "x"}) is get_ollama_client({"model": "x"})
+        assert get_ollama_client({"model": "x"}) is not get_ollama_client(
+            {"model": "y"}
+        )
+
 
 # ---------------------------------------------------------------------------
 # EmbeddingCache — imported from the new module location
 # ---------------------------------------------------------------------------
 
 
+def _shared_cache_worker(cache_dir, tag, count, other_tag):
+    """Store and read back vectors while another process does the same."""
+    import sys
+
+    from src.ai.llm_client import EmbeddingCache
+
+    cache = EmbeddingCache(cache_dir=cache_dir, max_cache_size=20)
+    bad = 0
+    for i in range(count):
+        cache.store_embedding(f"{tag}-{i}", [float(i)] * 2000)
+        for key, j in ((tag, i // 2), (other_tag, i)):
+            vector = cache.get_embedding(f"{key}-{j}")
+            if vector is not None and vector != [float(j)] * 2000:
+                bad += 1
+    cache.close()
+    sys.exit(1 if bad else 0)
+
+
 class TestEmbeddingCacheFromLLMClient:
 
     def test_imports_from_llm_client(self):
@@ -134,6 +227,132 @@ class TestEmbeddingCacheFromLLMClient:
         cache.clear_cache()
         assert cache.get_embedding("text") is None
 
+    def test_get_or_generate_embeddings_batches_misses(self, tmp_path):
+        from src.ai.llm_client import EmbeddingCache
+
+        cache = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        cache.store_embedding("hit", [9.0])
+        cache.client = MagicMock()
+        cache.client.health_check.return_value = True
+        cache.client.generate_embeddings.return_value = [[1.0], [2.0]]
+
+        result = cache.get_or_generate_embeddings(["a", "hit", "b", "a"])
+
+        assert result == [[1.0], [9.0], [2.0], [1.0]]
+        cache.client.generate_embeddings.assert_called_once_with(["a", "b"])
+        assert cache.get_embedding("b") == [2.0]
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        from src.ai.llm_client import EmbeddingCache
+
+        cache = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        cache.store_embedding("persisted", [1.5, -2.25])
+        cache.close()
+        reopened = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        assert reopened.get_embedding("persisted") == [1.5, -2.25]
+        assert (tmp_path / "cache" / "vectors.bin").exists()
+
+    def test_lru_evicts_least_recently_used(self, tmp_path):
+        from src.ai.llm_client import EmbeddingCache
+
+        cache = EmbeddingCache(cache_dir=str(tmp_path / "cache"), max_cache_size=2)
+        cache.store_embedding("a", [1.0])
+        cache.store_embedding("b", [2.0])
+        cache.get_embedding("a")
+        cache.store_embedding("c", [3.0])
+        assert cache.get_embedding("b") is None
+        assert cache.get_embedding("a") == [1.0]
+        assert cache.get_embedding("c") == [3.0]
+
+    def test_lru_order_survives_reopen(self, tmp_path):
+        from src.ai.llm_client import EmbeddingCache
+
+        cache = EmbeddingCache(cache_dir=str(tmp_path / "cache"), max_cache_size=2)
+        cache.store_embedding("a", [1.0])
+        cache.store_embedding("b", [2.0])
+        cache.get_embedding("a")
+        cache.close()
+        reopened = EmbeddingCache(cache_dir=str(tmp_path / "cache"), max_cache_size=2)
+        reopened.store_embedding("c", [3.0])
+        assert reopened.get_embedding("a") == [1.0]
+        assert reopened.get_embedding("b") is None
+
+    def test_compaction_reclaims_evicted_space(self, tmp_path):
+        from src.ai.llm_client import EmbeddingCache
+
+        cache = EmbeddingCache(cache_dir=str(tmp_path / "cache"), max_cache_size=2)
+        vec = [0.5] * 20000  # ~160 KB per record
+        for i in range(10):
+            cache.store_embedding(f"text-{i}", vec)
+        size = (tmp_path / "cache" / "vectors.bin").stat().st_size
+        assert size < 6 * 160 * 1024
+        assert cache.get_embedding("text-9") == vec
+
+    def test_migrates_legacy_json_cache(self, tmp_path):
+        import hashlib
+        import json
+
+        from src.ai.llm_client import EmbeddingCache
+
+        legacy = tmp_path / "cache"
+        legacy.mkdir()
+        h = hashlib.sha256(b"old text").hexdigest()[:16]
+        (legacy / f"{h}.json").write_text(
+            json.dumps({"text_hash": h, "text_length": 8, "embedding": [0.25, 0.5]})
+        )
+        (legacy / "index.json").write_text(
+            json.dumps({"entries": {h: {"file": f"{h}.json"}}, "access_order": [h]})
+        )
+
+        cache = EmbeddingCache(cache_dir=str(legacy))
+
+        assert cache.get_embedding("old text") == [0.25, 0.5]
+        assert not list(legacy.glob("*.json"))
+
+    def test_corrupt_record_is_a_miss(self, tmp_path):
+        from src.ai.llm_client import EmbeddingCache
+
+        cache = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        cache.store_embedding("a", [1.0, 2.0])
+        cache.close()
+        vectors = tmp_path / "cache" / "vectors.bin"
+        data = bytearray(vectors.read_bytes())
+        data[-1] ^= 0xFF
+        vectors.write_bytes(bytes(data))
+
+        reopened = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        assert reopened.get_embedding("a") is None
+
+    def test_stale_offset_is_reresolved_from_index(self, tmp_path):
+        from src.ai.llm_client import EmbeddingCache
+
+        reader = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        writer = EmbeddingCache(cache_dir=str(tmp_path / "cache"))
+        writer.store_embedding("a", [1.0])
+        assert reader.get_embedding("a") == [1.0]
+        writer.clear_cache()
+        writer.store_embedding("b", [2.0])
+        writer.store_embedding("a", [3.0])
+
+        # The reader's offset for "a" now holds "b"'s record
+        assert reader.get_embedding("a") == [3.0]
+
+    def test_processes_sharing_a_cache_never_read_wrong_vectors(self, tmp_path):
+        import multiprocessing
+
+        cache_dir = str(tmp_path / "cache")
+        ctx = multiprocessing.get_context("fork")
+        workers = [
+            ctx.Process(target=_shared_cache_worker, args=(cache_dir, a, 150, b))
+            for a, b in (("p1", "p2"), ("p2", "p1"))
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=120)
+
+        assert [worker.exitcode for worker in workers] == [0, 0]
+
 
 # ---------------------------------------------------------------------------
 # Type aliases — all re-exported from llm_client
@@ -164,3 +383,137 @@ class TestTypeAliasesFromLLMClient:
         assert AnalyticsResult is not None
         assert WorkflowResult is not None
         assert ConfigDict is not None
+
+
+# ---------------------------------------------------------------------------
+# AsyncOllamaClient — against a local stub Ollama server
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def stub_ollama():
+    """Threaded stub of /api/generate and /api/embeddings with a tunable delay."""
+    import json
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    state = {"delay": 0.0, "current": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(state["delay"])
+            with lock:
+                state["current"] -= 1
+            if self.path == "/api/generate":
+                payload = {"response": f"echo {body['prompt']}"}
+            else:
+                payload = {"embedding": [float(len(body["prompt"]))]}
+            data = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["base_url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.network
+class TestAsyncOllamaClient:
+
+    def _client(self, stub, **kwargs):
+        from src.ai.llm_client import AsyncOllamaClient
+
+        return AsyncOllamaClient({"base_url": stub["base_url"]}, **kwargs)
+
+    def test_agenerate_completion_and_embedding(self, stub_ollama):
+        import asyncio
+
+        client = self._client(stub_ollama)
+
+        async def run():
+            return await asyncio.gather(
+                client.agenerate_completion("hi"), client.agenerate_embedding("abc")
+            )
+
+        assert asyncio.run(run()) == ["echo hi", [3.0]]
+        client.close()
+
+    def test_in_flight_requests_bounded_by_semaphore(self, stub_ollama):
+        import asyncio
+
+        stub_ollama["delay"] = 0.05
+        client = self._client(stub_ollama, max_concurrency=3)
+
+        async def run():
+            return await asyncio.gather(
+                *(client.agenerate_completion(str(i)) for i in range(9))
+            )
+
+        results = asyncio.run(run())
+        client.close()
+        assert results == [f"echo {i}" for i in range(9)]
+        assert stub_ollama["peak"] == 3
+
+    def test_per_request_timeout(self, stub_ollama):
+        import asyncio
+
+        stub_ollama["delay"] = 0.5
+        client = self._client(stub_ollama)
+
+        with pytest.raises(Exception, match="timed out"):
+            asyncio.run(client.agenerate_completion("slow", timeout=0.05))
+        client.close()
+
+    def test_request_timeout_context_bounds_sync_requests(self, stub_ollama):
+        from src.ai.llm_client import OllamaClient, request_timeout
+
+        stub_ollama["delay"] = 0.5
+        client = OllamaClient({"base_url": stub_ollama["base_url"]})
+
+        with request_timeout(0.05), pytest.raises(Exception, match="timed out"):
+            client.generate_completion("slow")
+
+
+class TestAsyncSubmit:
+
+    def test_slot_held_until_abandoned_call_finishes(self):
+        import asyncio
+        import time
+
+        from src.ai.llm_client import AsyncOllamaClient, OllamaClient
+
+        client = AsyncOllamaClient(
+            max_concurrency=1, client=OllamaClient({"base_url": "http://127.0.0.1:9"})
+        )
+        spans = {}
+
+        def work(name, seconds):
+            start = time.monotonic()
+            time.sleep(seconds)
+            spans[name] = (start, time.monotonic())
+            return name
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.submit(work, "slow", 0.2), 0.02)
+            return await client.submit(work, "next", 0)
+
+        assert asyncio.run(run()) == "next"
+        client.close()
+        assert spans["next"][0] >= spans["slow"][1]
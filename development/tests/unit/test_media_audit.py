@@ -3,13 +3,17 @@ Tests for media_audit.py — vault-wide broken embed and orphaned media detectio
 Issue #130.
 """
 
+import io
+import json
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.utils.media_audit import audit_vault, AuditResult
+from src.utils import media_audit
+from src.utils.media_audit import audit_vault, stream_audit, AuditResult
 
 
 def _make_vault(base: Path) -> Path:
@@ -95,3 +99,115 @@ class TestMediaAudit:
 
         assert result.total_broken == 1
         assert result.total_orphaned == 1
+
+    def test_attachment_month_folder_embeds_resolve(self):
+        """Embeds resolve against attachments/ month folders and nested paths."""
+        month = self.vault / "attachments" / "2025-10"
+        month.mkdir(parents=True)
+        (month / "shot.png").write_bytes(b"fake")
+        (self.vault / "Fleeting Notes" / "n.md").write_text(
+            "![[shot.png]]\n![[attachments/2025-10/shot.png]]\n![[2025-09/shot.png]]\n"
+        )
+
+        result = audit_vault(self.vault)
+
+        assert [e["image_path"] for e in result.broken_embeds] == ["2025-09/shot.png"]
+        assert result.orphaned_media == []
+
+
+class _InterruptingFile(io.StringIO):
+    """StringIO that raises KeyboardInterrupt on the Nth write."""
+
+    def __init__(self, fail_on_write: int):
+        super().__init__()
+        self.writes_left = fail_on_write
+
+    def write(self, text):
+        if hasattr(self, "writes_left"):
+            self.writes_left -= 1
+            if self.writes_left == 0:
+                super().write(text[:5])  # partial line, as on a real interrupt
+                raise KeyboardInterrupt
+        return super().write(text)
+
+
+class TestStreamingAudit:
+
+    @pytest.fixture
+    def vault(self, tmp_path):
+        vault = _make_vault(tmp_path)
+        (vault / "Media" / "used.png").write_bytes(b"fake")
+        (vault / "Media" / "orphan.png").write_bytes(b"fake")
+        for i in range(6):
+            (vault / "Permanent Notes" / f"note-{i}.md").write_text(
+                f"![[used.png]]\n![[missing-{i}.png]]\n![[gone-{i}.png]]\n"
+            )
+        return vault
+
+    @staticmethod
+    def _records(text):
+        return [json.loads(line) for line in text.splitlines()]
+
+    def test_jsonl_records_match_audit_vault(self, vault):
+        out = io.StringIO()
+        summary = stream_audit(vault, out, workers=1)
+
+        records = self._records(out.getvalue())
+        broken = [r for r in records if r["type"] == "broken_embed"]
+        expected = audit_vault(vault)
+        assert [(r["note_path"], r["image_path"]) for r in broken] == [
+            (e["note_path"], e["image_path"]) for e in expected.broken_embeds
+        ]
+        assert [r["path"] for r in records if r["type"] == "orphaned_media"] == [
+            "Media/orphan.png"
+        ]
+        assert records[-1] == summary
+        assert summary["broken_embeds"] == 12
+        assert summary["notes_scanned"] == 6
+
+    def test_process_pool_streams_same_findings(self, vault):
+        serial, parallel = io.StringIO(), io.StringIO()
+        stream_audit(vault, serial, workers=1)
+        with patch.object(media_audit, "PARALLEL_AUDIT_MIN_NOTES", 1):
+            stream_audit(vault, parallel, workers=2)
+
+        assert parallel.getvalue() == serial.getvalue()
+
+    def test_interrupted_audit_resumes_without_duplicates(self, vault, tmp_path):
+        checkpoint = tmp_path / "audit.checkpoint"
+        expected = io.StringIO()
+        stream_audit(vault, expected, workers=1)
+
+        with patch.object(media_audit, "CHECKPOINT_INTERVAL", 2):
+            # Interrupt while writing the second finding of the fourth note
+            out = _InterruptingFile(fail_on_write=9)
+            with pytest.raises(KeyboardInterrupt):
+                stream_audit(vault, out, checkpoint, workers=1)
+            assert checkpoint.exists()
+
+            del out.writes_left
+            summary = stream_audit(vault, out, checkpoint, workers=1)
+
+        assert summary["resumed"] is True
+        assert not checkpoint.exists()
+        findings = [
+            r
+            for r in self._records(out.getvalue())
+            if r["type"] not in ("progress", "summary")
+        ]
+        assert findings == [
+            r
+            for r in self._records(expected.getvalue())
+            if r["type"] not in ("progress", "summary")
+        ]
+        assert summary["broken_embeds"] == 12
+
+    def test_cli_writes_jsonl_file(self, vault, tmp_path, capsys):
+        output = tmp_path / "audit.jsonl"
+
+        assert media_audit.main([str(vault), "--jsonl", str(output)]) == 0
+
+        records = self._records(output.read_text())
+        assert records[-1]["type"] == "summary"
+        assert not (tmp_path / "audit.jsonl.checkpoint").exists()
+        assert "12 broken embed(s)" in capsys.readouterr().err
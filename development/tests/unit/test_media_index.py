@@ -0,0 +1,93 @@
+"""Tests for the vault filename index used to resolve wiki embeds."""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import media_index as media_index_module
+from src.utils.image_link_manager import ImageLinkManager
+from src.utils.media_index import MediaIndex
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    (tmp_path / "Media").mkdir()
+    (tmp_path / "attachments" / "2025-10").mkdir(parents=True)
+    (tmp_path / "Inbox").mkdir()
+    (tmp_path / "Media" / "shared.png").write_bytes(b"a")
+    (tmp_path / "attachments" / "2025-10" / "shared.png").write_bytes(b"b")
+    (tmp_path / "attachments" / "2025-10" / "shot.png").write_bytes(b"c")
+    (tmp_path / "Inbox" / "inline.png").write_bytes(b"d")
+    (tmp_path / "Inbox" / "note.md").write_text("# Note")
+    return tmp_path
+
+
+def test_lookup_orders_media_then_attachments(vault):
+    index = MediaIndex(vault).build()
+
+    assert index.lookup("shared.png") == [
+        vault / "Media" / "shared.png",
+        vault / "attachments" / "2025-10" / "shared.png",
+    ]
+    assert index.contains("inline.png")
+    assert not index.contains("ghost.png")
+    assert len(index) == 5
+
+
+def test_lookup_with_folders_matches_path_suffix(vault):
+    index = MediaIndex(vault).build()
+
+    assert index.lookup("2025-10/shared.png") == [
+        vault / "attachments" / "2025-10" / "shared.png"
+    ]
+    assert index.contains("attachments/2025-10/shot.png")
+    assert not index.contains("Media/shot.png")
+    assert not index.contains("10/shot.png")
+
+
+def test_add_and_discard(vault):
+    index = MediaIndex(vault).build()
+    (vault / "Media" / "new.png").write_bytes(b"e")
+
+    index.add(vault / "Media" / "new.png")
+    index.discard(vault / "attachments")
+
+    assert index.lookup("new.png") == [vault / "Media" / "new.png"]
+    assert index.lookup("shared.png") == [vault / "Media" / "shared.png"]
+    assert not index.contains("shot.png")
+    assert list(index.iter_files(["Media"])) == [
+        vault / "Media" / "new.png",
+        vault / "Media" / "shared.png",
+    ]
+
+
+@pytest.mark.skipif(not media_index_module.HAS_WATCHDOG, reason="needs watchdog")
+def test_watch_refreshes_index(vault):
+    index = MediaIndex(vault).build()
+    assert index.watch()
+    try:
+        (vault / "Media" / "dropped.png").write_bytes(b"f")
+        (vault / "Inbox" / "inline.png").unlink()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if index.contains("dropped.png") and not index.contains("inline.png"):
+                break
+            time.sleep(0.05)
+    finally:
+        index.stop()
+
+    assert index.contains("dropped.png")
+    assert not index.contains("inline.png")
+
+
+def test_manager_resolves_wiki_embeds_without_rglob(vault):
+    manager = ImageLinkManager(base_path=vault, media_index=MediaIndex(vault).build())
+    content = "![[shared.png]]\n![[2025-10/shot.png|300]]\n![[ghost.png]]\n"
+
+    with patch.object(Path, "rglob", side_effect=AssertionError("vault walk")):
+        broken = manager.validate_image_links(vault / "Inbox" / "note.md", content)
+
+    assert [b["image_path"] for b in broken] == ["ghost.png"]
+    assert broken[0]["line_number"] == 3
@@ -0,0 +1,111 @@
+"""Tests for the per-operation move journal."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.utils.directory_organizer import DirectoryOrganizer
+from src.utils.move_journal import JournalError, MoveJournal
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    root = tmp_path / "vault"
+    (root / "Inbox").mkdir(parents=True)
+    (root / "Inbox" / "note.md").write_text("original ![[img.png]]")
+    return root
+
+
+def test_edit_then_move_is_reversed_in_order(vault, tmp_path):
+    journal_root = tmp_path / "journals"
+    journal = MoveJournal.begin(vault, journal_root)
+    source = vault / "Inbox" / "note.md"
+    target = vault / "Archive" / "2025" / "note.md"
+
+    journal.record_edit(source)
+    source.write_text("rewritten ![[../Media/img.png]]")
+    journal.record_mkdir(target.parent)
+    target.parent.mkdir(parents=True)
+    journal.record_move(source, target)
+    shutil.move(str(source), str(target))
+    journal.finish("success")
+
+    reloaded = MoveJournal.load(vault, journal_root, journal.operation_id)
+    assert reloaded.touched_paths() == ["Inbox/note.md", "Archive/2025/note.md"]
+    assert reloaded.rollback() == ["Inbox/note.md"]
+
+    assert source.read_text() == "original ![[img.png]]"
+    assert not (vault / "Archive").exists()
+    assert not (journal.directory / "emergency").exists()
+    assert MoveJournal.list_operations(journal_root) == [journal.operation_id]
+
+
+def test_rollback_refuses_to_overwrite_recreated_source(vault, tmp_path):
+    journal = MoveJournal.begin(vault, tmp_path / "journals")
+    source = vault / "Inbox" / "note.md"
+    target = vault / "Inbox" / "moved.md"
+    journal.record_move(source, target)
+    shutil.move(str(source), str(target))
+    source.write_text("new note with the old name")
+
+    with pytest.raises(JournalError):
+        journal.rollback()
+
+    assert source.read_text() == "new note with the old name"
+    assert (journal.directory / "emergency" / "Inbox" / "moved.md").exists()
+
+
+def test_steps_are_appended_not_rewritten(vault, tmp_path):
+    journal = MoveJournal.begin(vault, tmp_path / "journals")
+    source = vault / "Inbox" / "note.md"
+    for i in range(3):
+        journal.record_move(source, vault / "Inbox" / f"moved-{i}.md")
+    journal.record_edit(source)
+    journal.record_edit(source)  # Already journaled: no second copy
+    journal.finish("success")
+
+    lines = (journal.directory / "journal.jsonl").read_text().splitlines()
+    assert len(lines) == 1 + 3 + 1 + 1
+    reloaded = MoveJournal.load(vault, tmp_path / "journals", journal.operation_id)
+    assert reloaded.entries == journal.entries
+    assert reloaded.data["status"] == "success"
+
+
+def test_torn_final_line_is_ignored(vault, tmp_path):
+    journal_root = tmp_path / "journals"
+    journal = MoveJournal.begin(vault, journal_root)
+    source = vault / "Inbox" / "note.md"
+    journal.record_move(source, vault / "Inbox" / "moved.md")
+    with open(journal.directory / "journal.jsonl", "a") as f:
+        f.write('{"action": "move", "sour')  # Crash mid-write
+
+    reloaded = MoveJournal.load(vault, journal_root, journal.operation_id)
+    assert len(reloaded.entries) == 1
+    reloaded.finish("failed")
+    assert (
+        MoveJournal.load(vault, journal_root, journal.operation_id).data["status"]
+        == "failed"
+    )
+
+
+def test_prune_backups_removes_journals_with_their_backup(vault, tmp_path):
+    organizer = DirectoryOrganizer(str(vault), backup_root=str(tmp_path / "backups"))
+    old_backup = tmp_path / "backups" / "knowledge-20250101-000000"
+    new_backup = tmp_path / "backups" / "knowledge-20250102-000000"
+    old_backup.mkdir(parents=True)
+    new_backup.mkdir()
+    journals = [
+        MoveJournal.begin(vault, organizer.journal_root, backup_path=backup)
+        for backup in (str(old_backup), None, str(new_backup), None)
+    ]
+    ids = [journal.operation_id for journal in journals]
+
+    plan = organizer.prune_backups(keep=1, dry_run=True)
+    assert plan["journals_to_prune"] == [ids[1], ids[0]]
+    assert organizer.list_operations() == sorted(ids, reverse=True)
+
+    plan = organizer.prune_backups(keep=1)
+    assert plan["journals_deleted"] == [ids[1], ids[0]]
+    assert organizer.list_operations() == [ids[3], ids[2]]
+    assert not journals[0].directory.exists()
@@ -0,0 +1,126 @@
+"""Tests for the web UI's parsed-note and quality score caches."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "web_ui"))
+
+from note_cache import (  # noqa: E402
+    NoteCache,
+    QualityScoreCache,
+    parse_note_content,
+)
+
+
+def _write(path: Path, content: str, mtime_ns: int) -> Path:
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def _yaml_parse(content: str):
+    """parse_note_content as the web UI implemented it with yaml.safe_load."""
+    if not content.startswith("---"):
+        return None, content
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return None, content
+    frontmatter_text = parts[1].strip()
+    if not frontmatter_text:
+        return None, parts[2].strip()
+    try:
+        frontmatter = yaml.safe_load(frontmatter_text)
+    except yaml.YAMLError:
+        return None, parts[2].strip()
+    if not isinstance(frontmatter, dict):
+        return None, parts[2].strip()
+    return frontmatter, parts[2].strip()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "---\ntype: fleeting\nquality_score: 0.8\ntags: [a, b]\n---\n# Body\n",
+        "---\ntags:\n  - one\n  - two\ncreated: 2025-01-02 10:30\n---\nBody",
+        "---\ntitle: 'quoted: colon'\nlinks: {a: 1}\n---\nBody",
+        "---\n---\nEmpty frontmatter",
+        "---\njust a string\n---\nScalar frontmatter",
+        "---\nbad: [unclosed\n---\nInvalid YAML",
+        "No frontmatter at all",
+        "---\nunterminated: true\n",
+    ],
+)
+def test_parse_note_content_matches_yaml(content):
+    assert parse_note_content(content) == _yaml_parse(content)
+
+
+def test_unchanged_note_is_a_hit(tmp_path):
+    cache = NoteCache()
+    note = _write(tmp_path / "a.md", "---\nquality_score: 0.5\n---\nBody", 10**18)
+
+    first = cache.get(note)
+    assert cache.get(note) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.frontmatter == {"quality_score": 0.5}
+    assert first.body == "Body"
+
+
+def test_changed_note_is_reparsed(tmp_path):
+    cache = NoteCache()
+    note = _write(tmp_path / "a.md", "---\nquality_score: 0.5\n---\nBody", 10**18)
+    cache.get(note)
+    _write(note, "---\nquality_score: 0.9\n---\nBody", 10**18 + 1)
+
+    assert cache.get(note).frontmatter == {"quality_score": 0.9}
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = NoteCache(max_entries=2)
+    a, b, c = (_write(tmp_path / f"{n}.md", n, 10**18) for n in "abc")
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)  # b is now the least recently used
+    cache.get(c)
+
+    assert len(cache) == 2
+    cache.get(a)
+    assert cache.misses == 3
+    cache.get(b)
+    assert cache.misses == 4
+
+
+def test_quality_scores_hit_for_every_candidate(tmp_path):
+    scores = QualityScoreCache()
+    notes = [
+        _write(tmp_path / f"n{i}.md", f"---\nquality_score: 0.{i}\n---\n", 10**18)
+        for i in range(5)
+    ]
+    notes.append(_write(tmp_path / "bad.md", "---\nquality_score: high\n---\n", 1))
+    notes.append(_write(tmp_path / "none.md", "No frontmatter", 1))
+
+    first = [scores.get(n) for n in notes]
+    second = [scores.get(n) for n in notes]
+
+    assert first == second == [0.0, 0.1, 0.2, 0.3, 0.4, None, None]
+    assert (scores.hits, scores.misses) == (7, 7)
+
+
+def test_quality_scores_retain_forgets_removed_notes(tmp_path):
+    scores = QualityScoreCache()
+    a, b = (
+        _write(tmp_path / f"{n}.md", "---\nquality_score: 1\n---\n", 1) for n in "ab"
+    )
+    scores.get(a)
+    scores.get(b)
+
+    scores.retain([a])
+
+    assert len(scores) == 1
+    scores.get(a)
+    assert scores.hits == 1
@@ -1055,3 +1055,230 @@ Content.
         # File should not be modified
         updated_content = note_path.read_text()
         assert "## Suggested Connections" not in updated_content
+
+
+class TestConcurrentNoteProcessing:
+    """Test concurrent processing of several notes via aprocess_notes."""
+
+    def _coordinator(self, delay=0.0, in_flight=None):
+        import threading
+        import time
+
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def generate_tags(body):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(delay)
+            with lock:
+                state["current"] -= 1
+            return ["concurrent"]
+
+        tagger = Mock()
+        tagger.generate_tags = Mock(side_effect=generate_tags)
+        enhancer = Mock()
+        enhancer.enhance_note = Mock(return_value={"quality_score": 0.8})
+        coordinator = NoteProcessingCoordinator(
+            tagger=tagger,
+            summarizer=Mock(),
+            enhancer=enhancer,
+            connection_coordinator=Mock(),
+        )
+        return coordinator, state
+
+    def _notes(self, tmp_path, count):
+        paths = []
+        for i in range(count):
+            note = tmp_path / f"note-{i}.md"
+            note.write_text(f"---\ntype: fleeting\n---\n\nBody {i}\n")
+            paths.append(str(note))
+        return paths
+
+    def test_results_in_input_order(self, tmp_path):
+        coordinator, _ = self._coordinator()
+        paths = self._notes(tmp_path, 5)
+        results = coordinator.process_notes(paths, max_concurrency=3, dry_run=True)
+        assert [r["original_file"] for r in results] == paths
+        assert all(r["quality_score"] for r in results)
+
+    def test_concurrency_is_bounded(self, tmp_path):
+        coordinator, state = self._coordinator(delay=0.05)
+        paths = self._notes(tmp_path, 6)
+        coordinator.process_notes(paths, max_concurrency=2, fast=False, dry_run=True)
+        assert state["peak"] == 2
+
+    def test_timeout_bounds_each_request_not_the_note(self, tmp_path):
+        from src.ai.llm_client import current_request_timeout
+
+        coordinator, _ = self._coordinator()
+        seen = []
+        coordinator.tagger.generate_tags.side_effect = lambda body: (
+            seen.append(current_request_timeout()) or ["concurrent"]
+        )
+        paths = self._notes(tmp_path, 2)
+        results = coordinator.process_notes(
+            paths, timeout=5.0, fast=False, dry_run=True
+        )
+
+        assert seen == [5.0, 5.0]
+        assert all("error" not in r for r in results)
+        assert current_request_timeout() is None
+
+    def test_missing_note_reports_error_without_stopping_batch(self, tmp_path):
+        coordinator, _ = self._coordinator()
+        paths = self._notes(tmp_path, 2) + [str(tmp_path / "missing.md")]
+        results = coordinator.process_notes(paths, dry_run=True)
+        assert "error" in results[2]
+        assert "error" not in results[0]
+
+
+class TestNoteResultCache:
+    """Content-hash cache of tagger/enhancer/connection results."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        from src.ai.batch import NoteResultCache
+
+        cache = NoteResultCache(tmp_path / "cache" / "results.sqlite")
+        yield cache
+        cache.close()
+
+    def _coordinator(self, cache, tags=None):
+        tagger = Mock()
+        tagger.generate_tags = Mock(return_value=tags or ["cached-tag"])
+        tagger.ollama_client.model = "test-model"
+        tagger.ollama_client.health_check.return_value = True
+        enhancer = Mock()
+        enhancer.enhance_note = Mock(
+            return_value={"quality_score": 0.8, "suggestions": ["More links"]}
+        )
+        connection_coordinator = Mock()
+        connection_coordinator.discover_connections = Mock(
+            return_value=[{"filename": "related.md", "similarity": 0.9}]
+        )
+        return NoteProcessingCoordinator(
+            tagger=tagger,
+            summarizer=Mock(),
+            enhancer=enhancer,
+            connection_coordinator=connection_coordinator,
+            result_cache=cache,
+        )
+
+    def _note(self, tmp_path, body="Body text about caching."):
+        note = tmp_path / "note.md"
+        note.write_text(f"---\ntype: fleeting\n---\n{body}\n")
+        return note
+
+    def test_unchanged_body_skips_ai_calls(self, tmp_path, cache):
+        coordinator = self._coordinator(cache)
+        corpus = tmp_path / "Permanent Notes"
+        corpus.mkdir()
+        note = self._note(tmp_path)
+
+        first = coordinator.process_note(str(note), dry_run=True, fast=False, corpus_dir=corpus)
+        second = coordinator.process_note(str(note), dry_run=True, fast=False, corpus_dir=corpus)
+
+        assert first["result_cache"] == "miss"
+        assert second["result_cache"] == "hit"
+        assert coordinator.tagger.generate_tags.call_count == 1
+        assert coordinator.enhancer.enhance_note.call_count == 1
+        assert coordinator.connection_coordinator.discover_connections.call_count == 1
+        assert second["processing"] == first["processing"]
+        assert second["recommendations"] == first["recommendations"]
+
+    def test_changed_body_misses(self, tmp_path, cache):
+        coordinator = self._coordinator(cache)
+        coordinator.process_note(str(self._note(tmp_path, "one")), dry_run=True, fast=False)
+        result = coordinator.process_note(str(self._note(tmp_path, "two")), dry_run=True, fast=False)
+
+        assert result["result_cache"] == "miss"
+        assert coordinator.tagger.generate_tags.call_count == 2
+
+    def test_model_change_misses(self, tmp_path, cache):
+        coordinator = self._coordinator(cache)
+        note = self._note(tmp_path)
+        coordinator.process_note(str(note), dry_run=True, fast=False)
+        coordinator.tagger.ollama_client.model = "other-model"
+        result = coordinator.process_note(str(note), dry_run=True, fast=False)
+
+        assert result["result_cache"] == "miss"
+
+    def test_corpus_change_refreshes_only_connections(self, tmp_path, cache):
+        coordinator = self._coordinator(cache)
+        corpus = tmp_path / "Permanent Notes"
+        corpus.mkdir()
+        note = self._note(tmp_path)
+        coordinator.process_note(str(note), dry_run=True, fast=False, corpus_dir=corpus)
+        (corpus / "new.md").write_text("new permanent note")
+        result = coordinator.process_note(str(note), dry_run=True, fast=False, corpus_dir=corpus)
+
+        assert result["result_cache"] == "partial"
+        assert coordinator.tagger.generate_tags.call_count == 1
+        assert coordinator.connection_coordinator.discover_connections.call_count == 2
+
+    def test_results_not_cached_while_llm_unavailable(self, tmp_path, cache):
+        coordinator = self._coordinator(cache)
+        coordinator.tagger.ollama_client.health_check.return_value = False
+        corpus = tmp_path / "Permanent Notes"
+        corpus.mkdir()
+        note = self._note(tmp_path)
+        coordinator.process_note(str(note), dry_run=True, fast=False, corpus_dir=corpus)
+        coordinator.process_note(str(note), dry_run=True, fast=False, corpus_dir=corpus)
+
+        assert coordinator.tagger.generate_tags.call_count == 2
+        assert coordinator.enhancer.enhance_note.call_count == 2
+        assert coordinator.connection_coordinator.discover_connections.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_degraded_enhancer_is_not_cached(self, tmp_path, cache):
+        coordinator = self._coordinator(cache)
+        coordinator.enhancer.ollama_client.health_check.return_value = False
+        note = self._note(tmp_path)
+        coordinator.process_note(str(note), dry_run=True, fast=False)
+        result = coordinator.process_note(str(note), dry_run=True, fast=False)
+
+        assert result["result_cache"] == "miss"
+        assert coordinator.enhancer.enhance_note.call_count == 2
+
+    def test_written_suggested_connections_keep_the_cache_key(self, tmp_path, cache):
+        coordinator = self._coordinator(cache)
+        corpus = tmp_path / "Permanent Notes"
+        corpus.mkdir()
+        (corpus / "related.md").write_text("# Related\nBody text about caching.\n")
+        note = self._note(tmp_path)
+
+        coordinator.process_note(str(note), dry_run=False, fast=False, corpus_dir=corpus)
+        assert "## Suggested Connections" in note.read_text()
+        result = coordinator.process_note(
+            str(note), dry_run=False, fast=False, corpus_dir=corpus
+        )
+
+        assert result["result_cache"] == "hit"
+        assert coordinator.tagger.generate_tags.call_count == 1
+
+    def test_stats_and_invalidate(self, tmp_path, cache):
+        from src.ai.batch import NoteResultCache
+
+        coordinator = self._coordinator(cache)
+        note = self._note(tmp_path)
+        coordinator.process_note(str(note), dry_run=True, fast=False)
+        coordinator.process_note(str(note), dry_run=True, fast=False)
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["lifetime_hits"] == 1
+
+        assert cache.invalidate(NoteResultCache.body_hash("unrelated")) == 0
+        assert cache.invalidate() == 1
+        result = coordinator.process_note(str(note), dry_run=True, fast=False)
+        assert result["result_cache"] == "miss"
+
+    def test_no_cache_by_default(self, tmp_path):
+        coordinator = self._coordinator(None)
+        result = coordinator.process_note(str(self._note(tmp_path)), dry_run=True, fast=False)
+
+        assert "result_cache" not in result
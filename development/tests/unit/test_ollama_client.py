@@ -39,7 +39,7 @@ class TestOllamaClient:
         """Test successful health check against Ollama API."""
         from src.ai.ollama_client import OllamaClient
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "ok"}
@@ -57,7 +57,7 @@ class TestOllamaClient:
         """Test health check handles connection errors gracefully."""
         from src.ai.ollama_client import OllamaClient
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = requests.ConnectionError("Connection failed")
 
             client = OllamaClient()
@@ -69,7 +69,7 @@ class TestOllamaClient:
         """Test health check handles timeout errors gracefully."""
         from src.ai.ollama_client import OllamaClient
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = requests.Timeout("Request timed out")
 
             client = OllamaClient()
@@ -81,7 +81,7 @@ class TestOllamaClient:
         """Test checking if specific model is available."""
         from src.ai.ollama_client import OllamaClient
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -98,7 +98,7 @@ class TestOllamaClient:
         """Test checking for unavailable model."""
         from src.ai.ollama_client import OllamaClient
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"models": [{"name": "mistral:7b"}]}
@@ -113,7 +113,7 @@ class TestOllamaClient:
         """Test successful text generation returns response content."""
         from src.ai.ollama_client import OllamaClient
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"response": "  hello world  "}
@@ -133,7 +133,7 @@ class TestOllamaClient:
         """
         from src.ai.ollama_client import OllamaClient
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"response": "ok"}
@@ -150,7 +150,7 @@ class TestOllamaClient:
         """Test that num_predict is included when caller explicitly sets max_tokens."""
         from src.ai.ollama_client import OllamaClient
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"response": "ok"}
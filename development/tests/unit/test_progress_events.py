@@ -0,0 +1,142 @@
+"""Tests for the batch progress event bus and its cross-process spool."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from src.ai.batch import BatchProcessingCoordinator
+from src.utils.progress_events import ProgressBus, ProgressEvent, ProgressReporter
+
+
+def _event(kind: str = "note", **details) -> ProgressEvent:
+    return ProgressEvent(run_id="run", kind=kind, source="test", **details)
+
+
+def _drain(subscription) -> list:
+    events = []
+    while True:
+        event = subscription.get(timeout=0)
+        if event is None:
+            return events
+        events.append(event)
+
+
+def test_subscribers_receive_published_events_in_order():
+    bus = ProgressBus()
+    with bus.subscribe() as subscription:
+        bus.publish(_event(note="a.md"))
+        bus.publish(_event(note="b.md"))
+
+        events = _drain(subscription)
+
+    assert [e.note for e in events] == ["a.md", "b.md"]
+    assert [e.seq for e in events] == [1, 2]
+
+
+def test_subscribe_replays_history_after_seq():
+    bus = ProgressBus()
+    for name in ("a.md", "b.md", "c.md"):
+        bus.publish(_event(note=name))
+
+    with bus.subscribe(after_seq=1) as subscription:
+        assert [e.note for e in _drain(subscription)] == ["b.md", "c.md"]
+
+
+def test_full_subscriber_queue_drops_instead_of_blocking():
+    bus = ProgressBus()
+    with bus.subscribe(max_queue=2) as subscription:
+        for i in range(5):
+            bus.publish(_event(note=f"{i}.md"))
+
+        assert len(_drain(subscription)) == 2
+        assert subscription.dropped == 3
+
+
+def test_closed_subscription_stops_receiving():
+    bus = ProgressBus()
+    subscription = bus.subscribe()
+    subscription.close()
+    bus.publish(_event())
+
+    assert subscription.get(timeout=0) is None
+
+
+def test_reporter_publishes_start_note_and_finish():
+    bus = ProgressBus()
+    reporter = ProgressReporter("process_inbox", total=2, bus=bus)
+    reporter.note("a.md", latency=0.5)
+    reporter.note("b.md", latency=0.25, error="boom")
+    reporter.finish()
+
+    events = bus.history()
+    assert [e.kind for e in events] == ["start", "note", "note", "finish"]
+    assert {e.run_id for e in events} == {reporter.run_id}
+    assert (events[-1].processed, events[-1].failed, events[-1].total) == (2, 1, 2)
+    assert events[2].error == "boom"
+
+
+def test_sse_frame_carries_seq_kind_and_payload():
+    bus = ProgressBus()
+    event = bus.publish(_event(note="a.md"))
+
+    lines = event.to_sse().splitlines()
+    assert lines[:2] == ["id: 1", "event: note"]
+    assert json.loads(lines[2][len("data: ") :])["note"] == "a.md"
+
+
+def test_spool_relays_events_from_other_processes(tmp_path: Path):
+    spool = tmp_path / "progress.jsonl"
+    bus = ProgressBus(spool_path=str(spool))
+    bus.publish(_event(note="own.md"))  # Written before following: not relayed
+    assert bus.follow_spool(poll_interval=0.01)
+    try:
+        with bus.subscribe() as subscription:
+            bus.publish(_event(note="local.md"))
+            foreign = _event(note="other.md", pid=os.getpid() + 1)
+            with open(spool, "a") as f:
+                f.write(json.dumps(foreign.to_dict()) + "\n")
+
+            deadline = time.monotonic() + 5
+            notes = []
+            while "other.md" not in notes and time.monotonic() < deadline:
+                event = subscription.get(timeout=0.1)
+                if event is not None:
+                    notes.append(event.note)
+    finally:
+        bus.stop_following()
+
+    assert notes == ["local.md", "other.md"]
+
+
+def test_follow_spool_without_spool_path_is_a_no_op():
+    assert ProgressBus().follow_spool() is False
+
+
+def test_coordinator_publishes_progress_per_note(tmp_path: Path):
+    inbox = tmp_path / "Inbox"
+    inbox.mkdir()
+    for name in ("a.md", "b.md", "c.md"):
+        (inbox / name).write_text("# Note\n")
+
+    def process(path: str) -> dict:
+        if path.endswith("b.md"):
+            return {"original_file": path, "error": "AI unavailable"}
+        if path.endswith("c.md"):
+            raise RuntimeError("disk full")
+        return {"original_file": path, "quality_score": 0.8}
+
+    bus = ProgressBus()
+    coordinator = BatchProcessingCoordinator(inbox, process, progress_bus=bus)
+    coordinator.batch_process_inbox(show_progress=False)
+
+    events = bus.history()
+    notes = [e for e in events if e.kind == "note"]
+    assert [e.kind for e in events] == ["start", "note", "note", "note", "finish"]
+    assert sorted((e.note, e.error or "") for e in notes) == [
+        ("a.md", ""),
+        ("b.md", "AI unavailable"),
+        ("c.md", "disk full"),
+    ]
+    assert all(e.latency is not None and e.latency >= 0 for e in notes)
+    assert (events[-1].processed, events[-1].failed) == (3, 2)
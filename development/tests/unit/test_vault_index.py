@@ -0,0 +1,160 @@
+"""Tests for the shared single-pass VaultIndex."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.vault_index import VaultIndex
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    (tmp_path / "Permanent Notes").mkdir()
+    (tmp_path / "Inbox").mkdir()
+    (tmp_path / ".obsidian").mkdir()
+    (tmp_path / "Permanent Notes" / "alpha.md").write_text(
+        "---\ntype: permanent\ntags: [one, two]\n---\n"
+        "# Alpha Title\n\nLinks to [[beta]] and [[gamma|Gamma]] #inline\n"
+    )
+    (tmp_path / "Inbox" / "beta.md").write_text("No frontmatter, five words here.")
+    (tmp_path / ".obsidian" / "hidden.md").write_text("ignored")
+    return tmp_path
+
+
+def test_refresh_builds_compact_records(vault):
+    index = VaultIndex(vault)
+    records = {r.rel_path: r for r in index.refresh()}
+
+    assert set(records) == {
+        os.path.join("Inbox", "beta.md"),
+        os.path.join("Permanent Notes", "alpha.md"),
+    }
+    alpha = records[os.path.join("Permanent Notes", "alpha.md")]
+    assert alpha.frontmatter["type"] == "permanent"
+    assert alpha.has_frontmatter is True
+    assert alpha.title == "Alpha Title"
+    assert alpha.links == ["beta", "gamma|Gamma"]
+    assert alpha.tags == ["one", "two"]
+    assert alpha.inline_tags == ("inline",)
+    assert alpha.directory == "Permanent Notes"
+
+    beta = records[os.path.join("Inbox", "beta.md")]
+    assert beta.has_frontmatter is False
+    assert beta.title == "beta"
+    assert beta.word_count == 5
+
+
+def test_unchanged_notes_are_not_reread(vault):
+    index = VaultIndex(vault)
+    index.refresh()
+    assert index.reads == 2
+
+    with patch("pathlib.Path.read_text") as read_text:
+        index.refresh()
+        index.notes(vault / "Inbox", recursive=False)
+    read_text.assert_not_called()
+
+
+def test_changed_and_deleted_notes_are_picked_up(vault):
+    index = VaultIndex(vault)
+    index.refresh()
+
+    beta = vault / "Inbox" / "beta.md"
+    beta.write_text("---\nstatus: inbox\n---\nRewritten with more words than before")
+    (vault / "Permanent Notes" / "alpha.md").unlink()
+
+    records = index.refresh()
+    assert [r.name for r in records] == ["beta.md"]
+    assert records[0].frontmatter == {"status": "inbox"}
+    assert index.reads == 3
+    assert len(index) == 1
+
+
+def test_workflow_manager_shares_one_index(vault):
+    from src.ai.batch import WorkflowManager
+
+    wm = WorkflowManager(str(vault))
+    assert wm.analytics.vault_index is wm.vault_index
+    assert wm.analytics_coordinator.vault_index is wm.vault_index
+    assert wm.reporting_coordinator.vault_index is wm.vault_index
+
+
+def test_metrics_and_report_read_each_note_once(vault):
+    from src.ai.batch import WorkflowManager
+
+    wm = WorkflowManager(str(vault))
+    wm.generate_enhanced_metrics()
+    wm.generate_workflow_report()
+
+    assert wm.vault_index.reads == 2
+
+
+def test_persistent_index_reparses_only_changed_notes(vault):
+    first = VaultIndex.for_vault(vault)
+    first.refresh()
+    first.close()
+    assert (vault / VaultIndex.DB_PATH).exists()
+
+    second = VaultIndex.for_vault(vault)
+    with patch("pathlib.Path.read_text") as read_text:
+        records = second.refresh()
+    read_text.assert_not_called()
+    assert second.reads == 0
+    assert len(records) == 2
+    alpha = second.get(vault / "Permanent Notes" / "alpha.md")
+    assert alpha.title == "Alpha Title"
+    assert alpha.links == ["beta", "gamma|Gamma"]
+    second.close()
+
+    (vault / "Inbox" / "beta.md").write_text("A changed note with extra words")
+    third = VaultIndex.for_vault(vault)
+    third.refresh()
+    assert third.reads == 1
+    third.close()
+
+
+def test_persistent_index_round_trips_yaml_dates(vault):
+    from datetime import date, datetime
+
+    (vault / "Inbox" / "dated.md").write_text(
+        "---\ncreated: 2024-03-01 10:30:00\nday: 2024-03-02\n---\nBody"
+    )
+    first = VaultIndex.for_vault(vault)
+    first.refresh()
+    first.close()
+
+    second = VaultIndex.for_vault(vault)
+    record = second.get(vault / "Inbox" / "dated.md")
+    assert second.reads == 0
+    assert record.frontmatter["created"] == datetime(2024, 3, 1, 10, 30)
+    assert record.frontmatter["day"] == date(2024, 3, 2)
+    second.close()
+
+
+def test_persistent_index_drops_deleted_notes(vault):
+    first = VaultIndex.for_vault(vault)
+    first.refresh()
+    first.close()
+    (vault / "Inbox" / "beta.md").unlink()
+
+    second = VaultIndex.for_vault(vault)
+    second.refresh()
+    second.close()
+
+    third = VaultIndex.for_vault(vault)
+    assert [r.name for r in third.refresh()] == ["alpha.md"]
+    third.close()
+
+
+def test_schema_version_change_discards_cache(vault):
+    first = VaultIndex.for_vault(vault)
+    first.refresh()
+    first.close()
+
+    with patch.object(VaultIndex, "SCHEMA_VERSION", VaultIndex.SCHEMA_VERSION + 1):
+        second = VaultIndex.for_vault(vault)
+        second.refresh()
+        assert second.reads == 2
+        second.close()
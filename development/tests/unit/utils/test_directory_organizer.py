@@ -7,13 +7,25 @@ This module tests the Safety-First Directory Organization system with
 emphasis on backup creation and rollback capabilities.
 """
 
+import os
+import io
 import unittest
 import tempfile
 import shutil
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
 
-from src.utils.directory_organizer import DirectoryOrganizer, BackupError
+from src.utils import directory_organizer
+from src.utils.directory_organizer import (
+    DirectoryOrganizer,
+    BackupError,
+    FRONTMATTER_CHUNK_SIZE,
+    MoveOperation,
+    MovePlan,
+    extract_wiki_links,
+    read_frontmatter_block,
+)
 
 
 class TestDirectoryOrganizerBackup(unittest.TestCase):
@@ -653,6 +665,61 @@ This note is already in the correct directory."""
         with self.assertRaises(BackupError):
             self.organizer.execute_moves(rollback_on_error=True, create_backup=True)
 
+    def test_rollback_operation_reverses_only_journaled_changes(self):
+        """Targeted rollback undoes one operation without touching other files."""
+        shutil.rmtree(self.vault_root / "Literature Notes")
+        result = self.organizer.execute_moves(create_backup=False)
+        unrelated = self.vault_root / "Permanent Notes" / "written-later.md"
+        unrelated.write_text("Added after the organize run")
+
+        with patch.object(self.organizer, "rollback") as full_rollback:
+            restored = self.organizer.rollback_operation(result["operation_id"])
+
+        full_rollback.assert_not_called()
+        self.assertEqual(len(restored), 3)
+        for name in ("permanent", "literature", "fleeting"):
+            self.assertTrue(
+                (self.vault_root / "Inbox" / f"{name}-in-inbox.md").exists()
+            )
+        self.assertFalse((self.vault_root / "Literature Notes").exists())
+        self.assertEqual(unrelated.read_text(), "Added after the organize run")
+        self.assertEqual(self.organizer.list_operations(), [result["operation_id"]])
+        with self.assertRaises(BackupError):
+            self.organizer.rollback_operation(result["operation_id"])
+
+    def test_failed_execution_undoes_completed_moves_from_journal(self):
+        """A mid-run failure reverts the moves already made, without a backup."""
+        conflict_file = self.vault_root / "Permanent Notes" / "permanent-in-inbox.md"
+        move_plan = self.organizer.plan_moves()
+        conflict_file.write_text("Conflict content")
+
+        with patch.object(self.organizer, "plan_moves", return_value=move_plan):
+            with self.assertRaises(BackupError):
+                self.organizer.execute_moves(validate_first=False, create_backup=False)
+
+        for name in ("permanent", "literature", "fleeting"):
+            self.assertTrue(
+                (self.vault_root / "Inbox" / f"{name}-in-inbox.md").exists()
+            )
+        self.assertEqual(conflict_file.read_text(), "Conflict content")
+
+    def test_rollback_subset_from_backup(self):
+        """rollback(paths=...) restores only the named paths from a backup."""
+        backup_path = self.organizer.create_backup()
+        note = self.vault_root / "Inbox" / "fleeting-in-inbox.md"
+        original = note.read_text()
+        note.write_text("damaged")
+        other = self.vault_root / "Permanent Notes" / "already-correct.md"
+        other.write_text("edited on purpose")
+
+        self.organizer.rollback(backup_path, paths=["Inbox/fleeting-in-inbox.md"])
+
+        self.assertEqual(note.read_text(), original)
+        self.assertEqual(other.read_text(), "edited on purpose")
+        self.assertEqual(
+            [p.name for p in self.backup_root.iterdir() if "emergency" in p.name], []
+        )
+
 
 class TestDirectoryOrganizerRetention(unittest.TestCase):
     """Tests for P0: Backup retention and pruning."""
@@ -740,5 +807,343 @@ class TestDirectoryOrganizerRetention(unittest.TestCase):
         self.assertEqual(len(prune_plan["to_prune"]), 0)
 
 
+class TestDirectoryOrganizerLinkResolution(unittest.TestCase):
+    """Test link target resolution through the precomputed lookup table."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.vault_root = Path(self.test_dir) / "vault"
+        (self.vault_root / "Inbox").mkdir(parents=True)
+        (self.vault_root / "Permanent Notes").mkdir()
+
+        (self.vault_root / "Inbox" / "fleeting-20250816-note-name.md").write_text(
+            "---\ntype: permanent\n---\nSee [[hub]]"
+        )
+        (self.vault_root / "Permanent Notes" / "hub.md").write_text(
+            "Links: [[note-name|the note]] [[Hub#Top]] [[missing]]"
+        )
+        (self.vault_root / "Permanent Notes" / "name.md").write_text("Exact stem")
+
+        self.organizer = DirectoryOrganizer(
+            str(self.vault_root), backup_root=str(Path(self.test_dir) / "backups")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_scan_resolves_targets_without_rescanning_vault(self):
+        """Scanning globs the vault once, however many links there are."""
+        rglob_calls = []
+        original_rglob = Path.rglob
+
+        def counting_rglob(path, pattern):
+            rglob_calls.append(pattern)
+            return original_rglob(path, pattern)
+
+        with patch.object(Path, "rglob", counting_rglob):
+            link_index = self.organizer.scan_wiki_links()
+
+        self.assertEqual(rglob_calls, ["*.md"])
+        hub = self.vault_root / "Permanent Notes" / "hub.md"
+        self.assertEqual(link_index.broken_links, {(hub, "missing")})
+
+    def test_exact_stem_wins_over_prefixed_suffix(self):
+        self.organizer.scan_wiki_links()
+        self.assertEqual(self.organizer._find_target_file("name").name, "name.md")
+        self.assertEqual(
+            self.organizer._find_target_file("Note-Name").name,
+            "fleeting-20250816-note-name.md",
+        )
+        self.assertIsNone(self.organizer._find_target_file("20250816"))
+
+    def test_plan_link_updates_follows_suffix_links_to_moved_file(self):
+        source = self.vault_root / "Inbox" / "fleeting-20250816-note-name.md"
+        target = self.vault_root / "Permanent Notes" / "note-name.md"
+        link_index = self.organizer.scan_wiki_links()
+        move_plan = MovePlan(
+            moves=[MoveOperation(source=source, target=target, reason="test")],
+            conflicts=[],
+            unknown_types=[],
+            malformed_files=[],
+            summary={},
+        )
+
+        updates = self.organizer.plan_link_updates(move_plan, link_index)
+
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(updates[0].old_link.original_text, "[[note-name|the note]]")
+        self.assertEqual(updates[0].new_link_text, "[[note-name|the note]]")
+
+
+class TestWikiLinkScanner(unittest.TestCase):
+    """Test the whole-file wiki-link scanner and its parallel driver."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.vault_root = Path(self.test_dir) / "vault"
+        self.vault_root.mkdir()
+        for i in range(6):
+            (self.vault_root / f"note-{i}.md").write_text(
+                f"# Note {i}\n\nSee [[note-{(i + 1) % 6}]] and\n"
+                f"  ![[diagram#Part|Figure {i}]] [[gone]]\n"
+            )
+        self.organizer = DirectoryOrganizer(
+            str(self.vault_root), backup_root=str(Path(self.test_dir) / "backups")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_extract_tracks_lines_and_positions(self):
+        content = "first [[A]]\nsecond line ![[B#H|Bee]]\n[[not\nclosed]] [[C]]"
+
+        links = extract_wiki_links(content)
+
+        self.assertEqual([link.target_note for link in links], ["A", "B", "C"])
+        self.assertEqual([link.line_number for link in links], [1, 2, 4])
+        self.assertEqual((links[0].start_pos, links[0].end_pos), (6, 11))
+        self.assertEqual(links[1].start_pos, 12)
+        self.assertTrue(links[1].is_embed)
+        self.assertEqual(links[1].display_text, "Bee")
+        self.assertEqual(links[2].start_pos, 9)
+
+    def test_parallel_scan_matches_serial_scan(self):
+        serial = self.organizer.scan_wiki_links(workers=1)
+        with patch("src.utils.directory_organizer.PARALLEL_SCAN_MIN_FILES", 1):
+            parallel = self.organizer.scan_wiki_links(workers=2)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(len(serial.links_by_file), 6)
+        self.assertEqual(len(serial.links_to_file["gone"]), 6)
+        self.assertEqual(len(serial.broken_links), 12)
+
+
+class TestDirectoryOrganizerIncrementalBackup(unittest.TestCase):
+    """Test incremental hard-link snapshots."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.vault_root = Path(self.test_dir) / "vault"
+        self.backup_root = Path(self.test_dir) / "backups"
+        (self.vault_root / "Media").mkdir(parents=True)
+        (self.vault_root / ".git").mkdir()
+        (self.vault_root / "note.md").write_text("# Note")
+        (self.vault_root / "Media" / "big.png").write_bytes(b"\x89PNG" * 1000)
+        (self.vault_root / ".git" / "HEAD").write_text("ref: main")
+        (self.vault_root / "alias.md").symlink_to("note.md")
+        self.organizer = DirectoryOrganizer(
+            str(self.vault_root), backup_root=str(self.backup_root)
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_first_snapshot_is_full_copy(self):
+        backup = Path(self.organizer.create_backup(incremental=True))
+
+        self.assertEqual((backup / "note.md").read_text(), "# Note")
+        self.assertTrue((backup / "alias.md").is_symlink())
+        self.assertFalse((backup / ".git").exists())
+        self.assertEqual(
+            self.organizer.last_snapshot_stats,
+            {"files": 2, "linked": 0, "copied": 2, "bytes_copied": 4006},
+        )
+
+    def test_unchanged_files_are_hard_linked_to_previous_snapshot(self):
+        first = Path(self.organizer.create_backup(incremental=True))
+        note = self.vault_root / "note.md"
+        note.write_text("# Note, edited")
+        os.utime(note, ns=(note.stat().st_atime_ns, note.stat().st_mtime_ns + 10**9))
+
+        second = Path(self.organizer.create_backup(incremental=True))
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(
+            (first / "Media" / "big.png").stat().st_ino,
+            (second / "Media" / "big.png").stat().st_ino,
+        )
+        self.assertEqual((first / "note.md").read_text(), "# Note")
+        self.assertEqual((second / "note.md").read_text(), "# Note, edited")
+        self.assertEqual(self.organizer.last_snapshot_stats["linked"], 1)
+        self.assertEqual(self.organizer.last_snapshot_stats["copied"], 1)
+
+    def test_snapshot_restores_like_a_full_backup(self):
+        self.organizer.create_backup(incremental=True)
+        backup = Path(self.organizer.create_backup(incremental=True))
+        (self.vault_root / "note.md").write_text("changed after backup")
+
+        self.organizer.rollback(str(backup))
+
+        self.assertEqual((self.vault_root / "note.md").read_text(), "# Note")
+        self.assertEqual(
+            (self.vault_root / "Media" / "big.png").read_bytes(), b"\x89PNG" * 1000
+        )
+
+
+class TestStreamingMovePlanner(unittest.TestCase):
+    """Test frontmatter-only reads and the streaming move planner."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.vault_root = Path(self.test_dir) / "vault"
+        inbox = self.vault_root / "Inbox"
+        inbox.mkdir(parents=True)
+        for i in range(40):
+            note_type = ("permanent", "literature", "fleeting", "unknown")[i % 4]
+            (inbox / f"note-{i:02d}.md").write_text(
+                f"---\ntype: {note_type}\n---\n" + "body text\n" * 2000
+            )
+        (inbox / "plain.md").write_text("No frontmatter here")
+        (inbox / "bad-type.md").write_text("---\ntype: 3\n---\nbody")
+        self.organizer = DirectoryOrganizer(
+            str(self.vault_root), backup_root=str(Path(self.test_dir) / "backups")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_read_frontmatter_block_stops_at_closing_delimiter(self):
+        note = self.vault_root / "Inbox" / "note-00.md"
+        head = read_frontmatter_block(note)
+        self.assertTrue(head.startswith("---\ntype: permanent\n---"))
+        self.assertLessEqual(len(head), FRONTMATTER_CHUNK_SIZE + 3)
+        self.assertEqual(
+            self.organizer._parse_frontmatter(head, note), {"type": "permanent"}
+        )
+        self.assertEqual(
+            read_frontmatter_block(self.vault_root / "Inbox" / "plain.md"), "No "
+        )
+
+    def test_long_frontmatter_falls_back_to_full_read(self):
+        note = self.vault_root / "Inbox" / "long.md"
+        note.write_text("---\n" + "key: value\n" * 2000 + "type: fleeting\n---\nbody")
+        self.assertEqual(read_frontmatter_block(note), note.read_text())
+
+    def test_iter_moves_streams_before_scanning_everything(self):
+        classified = []
+        original = self.organizer._classify_note
+
+        def tracking(md_file):
+            classified.append(md_file)
+            return original(md_file)
+
+        with patch.object(self.organizer, "_classify_note", tracking):
+            moves = self.organizer.iter_moves(workers=1)
+            first = next(moves)
+
+        self.assertIsInstance(first, MoveOperation)
+        self.assertLess(len(classified), 5)
+
+    def test_threaded_plan_matches_serial_plan(self):
+        serial = MovePlan(
+            moves=[], conflicts=[], unknown_types=[], malformed_files=[], summary={}
+        )
+        serial_moves = list(self.organizer.iter_moves(workers=1, plan=serial))
+        plan = self.organizer.plan_moves()
+
+        self.assertEqual(plan.moves, serial_moves)
+        self.assertEqual(len(plan.moves), 30)
+        self.assertEqual(len(plan.unknown_types), 10)
+        self.assertEqual([p.name for p in plan.malformed_files], ["bad-type.md"])
+        self.assertEqual(plan.summary["total_files"], 42)
+        self.assertEqual(plan.summary["files_with_frontmatter"], 41)
+
+    def test_dry_run_report_streams_moves_as_classified(self):
+        classified = []
+        original = self.organizer._classify_note
+
+        def tracking(md_file):
+            classified.append(md_file)
+            return original(md_file)
+
+        class Recorder(io.StringIO):
+            first_row_after = None
+
+            def write(self, text):
+                if self.first_row_after is None and "| Inbox/" in text:
+                    self.first_row_after = len(classified)
+                return super().write(text)
+
+        out = Recorder()
+        with patch.object(self.organizer, "_classify_note", tracking):
+            summary = self.organizer.write_dry_run_report(out, workers=1)
+
+        self.assertLess(out.first_row_after, 5)
+        plan = self.organizer.plan_moves()
+        for key in ("total_files", "total_moves", "unknown_types", "malformed_files"):
+            self.assertEqual(summary[key], plan.summary[key])
+        report = self.organizer.generate_dry_run_report(plan)
+        rows = [line for line in report.splitlines() if line.startswith("| Inbox/")]
+        streamed = [
+            line for line in out.getvalue().splitlines() if line.startswith("| Inbox/")
+        ]
+        self.assertEqual(streamed, rows)
+        self.assertIn("## Summary", out.getvalue())
+
+
+class TestBatchedLinkRewrite(unittest.TestCase):
+    """Test applying link updates with one write per referencing file."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.vault_root = Path(self.test_dir) / "vault"
+        self.vault_root.mkdir()
+        (self.vault_root / "old-name.md").write_text("# Old")
+        self.hub = self.vault_root / "hub.md"
+        self.hub.write_bytes(
+            b"See [[old-name]] and [[old-name|alias]].\r\n"
+            b"Again: ![[old-name]] then [[other]]\r\n"
+        )
+        self.organizer = DirectoryOrganizer(
+            str(self.vault_root), backup_root=str(Path(self.test_dir) / "backups")
+        )
+        move_plan = MovePlan(
+            moves=[
+                MoveOperation(
+                    source=self.vault_root / "old-name.md",
+                    target=self.vault_root / "new-name.md",
+                    reason="rename",
+                )
+            ],
+            conflicts=[],
+            unknown_types=[],
+            malformed_files=[],
+            summary={},
+        )
+        self.updates = self.organizer.plan_link_updates(
+            move_plan, self.organizer.scan_wiki_links()
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_each_file_is_written_once(self):
+        self.assertEqual(len(self.updates), 3)
+
+        with patch(
+            "src.utils.directory_organizer.safe_write",
+            wraps=directory_organizer.safe_write,
+        ) as writer:
+            result = self.organizer.apply_link_updates(self.updates)
+
+        writer.assert_called_once()
+        self.assertEqual(result["files_rewritten"], 1)
+        self.assertEqual(result["links_rewritten"], 3)
+        self.assertEqual(
+            self.hub.read_bytes(),
+            b"See [[new-name]] and [[new-name|alias]].\r\n"
+            b"Again: ![[new-name]] then [[other]]\r\n",
+        )
+
+    def test_stale_updates_are_skipped(self):
+        self.hub.write_text("Edited since the scan: [[old-name]]\n")
+
+        result = self.organizer.apply_link_updates(self.updates)
+
+        self.assertEqual(result["links_rewritten"], 0)
+        self.assertEqual(len(result["skipped"]), 3)
+        self.assertEqual(self.hub.read_text(), "Edited since the scan: [[old-name]]\n")
+
+
 if __name__ == "__main__":
     unittest.main()
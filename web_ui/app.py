@@ -6,9 +6,19 @@ AI-enhanced knowledge management dashboard
 import sys
 import os
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import (
+    Flask,
+    Response,
+    render_template,
+    request,
+    jsonify,
+    redirect,
+    url_for,
+    make_response,
+)
 import json
-import yaml
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
 # Add the src directory to the Python path
@@ -18,9 +28,10 @@ src_dir = os.path.join(project_root, "development")
 sys.path.insert(0, src_dir)
 
 # Import AI modules
-from src.ai.analytics import NoteAnalytics
+from src.ai.analytics import AnalyticsService
 from src.ai.workflow_manager import WorkflowManager
 from src.cli.weekly_review_formatter import WeeklyReviewFormatter
+from src.utils.progress_events import get_progress_bus
 
 # Import monitoring modules
 from src.monitoring.metrics_collector import MetricsCollector
@@ -37,6 +48,9 @@ from web_metrics_utils import (
 # Import feature flag utilities
 from feature_flags import require_feature
 
+# Import parsed-note cache
+from note_cache import NoteCache, QualityScoreCache
+
 # Import automation health
 from src.automation.system_health import check_all
 
@@ -56,6 +70,69 @@ metrics_formatter = WebMetricsFormatter(enable_cors=True)
 metrics_coordinator = MetricsCoordinatorIntegration(metrics_endpoint)
 metrics_error_handler = WebMetricsErrorHandler()
 
+# Long-lived analytics reports, one per vault path, refreshed incrementally.
+# ?path= is client-controlled, so only the most recently used few are kept.
+ANALYTICS_REFRESH_SECONDS = 5.0
+MAX_ANALYTICS_SERVICES = 4
+_analytics_services = OrderedDict()
+_analytics_services_lock = threading.Lock()
+
+# A directory is treated as a vault if it has one of these
+VAULT_MARKERS = (".obsidian", "Inbox", "Fleeting Notes", "Permanent Notes")
+
+
+# Parsed frontmatter/body for note previews; weekly review scores every
+# Inbox/Fleeting note on each load, so it keeps just the scores, unbounded
+note_cache = NoteCache()
+quality_scores = QualityScoreCache()
+
+# Comment frames sent while no progress events arrive, so proxies keep the
+# stream open and disconnected clients are noticed
+PROGRESS_KEEPALIVE_SECONDS = 15.0
+
+
+def _vault_path_error(vault_path: str):
+    """(message, status) if vault_path is not an existing vault, else None."""
+    path = Path(vault_path)
+    if not path.is_dir():
+        return f"Vault not found: {vault_path}", 404
+    if not any((path / marker).is_dir() for marker in VAULT_MARKERS):
+        return f"Not a vault: {vault_path}", 400
+    return None
+
+
+def get_analytics_service(vault_path: str) -> AnalyticsService:
+    """Return the process-wide AnalyticsService for a (validated) vault path."""
+    key = os.path.realpath(vault_path)
+    evicted = []
+    with _analytics_services_lock:
+        service = _analytics_services.get(key)
+        if service is None:
+            service = AnalyticsService(key, refresh_interval=ANALYTICS_REFRESH_SECONDS)
+            _analytics_services[key] = service
+            while len(_analytics_services) > MAX_ANALYTICS_SERVICES:
+                evicted.append(_analytics_services.popitem(last=False)[1])
+        _analytics_services.move_to_end(key)
+    for old in evicted:
+        old.close()
+    return service
+
+
+def _not_modified(etag: str):
+    """304 response when the client already has this ETag, else None."""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+
+def _revalidated(response, etag: str):
+    """Tag a response so browsers revalidate it with If-None-Match."""
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
 
 @app.route("/")
 def index():
@@ -86,10 +163,20 @@ def dashboard():
 def analytics():
     """Analytics dashboard showing note collection insights."""
     vault_path = request.args.get("path", DEFAULT_VAULT_PATH)
+    path_error = _vault_path_error(vault_path)
+    if path_error is not None:
+        message, status = path_error
+        return (
+            render_template("error.html", error=message, title="Analytics Error"),
+            status,
+        )
 
     try:
-        analytics = NoteAnalytics(vault_path)
-        stats = analytics.generate_report()
+        service = get_analytics_service(vault_path)
+        stats, etag = service.report()
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
 
         # Type guard: Ensure stats is a dictionary
         if not isinstance(stats, dict):
@@ -117,12 +204,15 @@ def analytics():
             "recent_notes": [],  # Will be enhanced when note details are available
             "recommendations": stats.get("recommendations", []),
             "vault_path": vault_path,
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "generated_at": service.generated_at.strftime("%Y-%m-%d %H:%M:%S"),
         }
 
-        return render_template(
-            "analytics.html", data=dashboard_data, title="Analytics Dashboard"
+        response = make_response(
+            render_template(
+                "analytics.html", data=dashboard_data, title="Analytics Dashboard"
+            )
         )
+        return _revalidated(response, etag)
 
     except Exception as e:
         error_message = f"Error loading analytics: {str(e)}"
@@ -131,6 +221,37 @@ def analytics():
         )
 
 
+@app.route("/api/analytics")
+@require_feature("analytics")
+def api_analytics():
+    """Cached analytics report as JSON (supports If-None-Match)."""
+    vault_path = request.args.get("path", DEFAULT_VAULT_PATH)
+    path_error = _vault_path_error(vault_path)
+    if path_error is not None:
+        message, status = path_error
+        return jsonify({"error": message}), status
+
+    try:
+        service = get_analytics_service(vault_path)
+        stats, etag = service.report()
+    except Exception as e:
+        return jsonify({"error": f"Error loading analytics: {str(e)}"}), 500
+
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+    return _revalidated(
+        jsonify(
+            {
+                "vault_path": vault_path,
+                "generated_at": service.generated_at.isoformat(),
+                "report": stats,
+            }
+        ),
+        etag,
+    )
+
+
 @app.route("/weekly-review")
 @require_feature("weekly_review")
 def weekly_review():
@@ -159,9 +280,11 @@ def weekly_review():
         keep_items = []
         improve_items = []
 
-        all_notes = [(n, "Inbox") for n in inbox_notes[:20]] + [
-            (n, "Fleeting Notes") for n in fleeting_notes[:20]
+        # Every candidate is scored; unchanged notes come from quality_scores
+        all_notes = [(n, "Inbox") for n in inbox_notes] + [
+            (n, "Fleeting Notes") for n in fleeting_notes
         ]
+        quality_scores.retain(n for n, _ in all_notes)
 
         for note_path, source in all_notes:
             score = extract_quality_score_from_note(note_path)
@@ -248,8 +371,7 @@ def note_content():
         return jsonify({"error": "Note not found"}), 404
 
     try:
-        content = resolved.read_text(encoding="utf-8")
-        frontmatter, body = parse_note_content(content)
+        frontmatter, body = note_cache.get(resolved)
         title = (
             frontmatter.get("title", resolved.stem) if frontmatter else resolved.stem
         )
@@ -312,6 +434,39 @@ def api_metrics():
         return metrics_formatter.format_metrics_response(fallback_data)
 
 
+@app.route("/api/stream/progress")
+@require_feature("progress_stream")
+def api_stream_progress():
+    """Server-sent events stream of batch progress (start/note/finish).
+
+    Clients reconnecting with Last-Event-ID (or ?last_event_id=) are
+    replayed the retained events they missed.
+    """
+    bus = get_progress_bus()
+    bus.follow_spool()
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get(
+        "last_event_id"
+    )
+    try:
+        after_seq = int(last_event_id) if last_event_id else None
+    except ValueError:
+        after_seq = None
+
+    def generate():
+        with bus.subscribe(after_seq=after_seq) as subscription:
+            yield "retry: 3000\n\n"
+            while True:
+                event = subscription.get(timeout=PROGRESS_KEEPALIVE_SECONDS)
+                yield event.to_sse() if event is not None else ": keep-alive\n\n"
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.route("/settings")
 @require_feature("settings")
 def settings():
@@ -458,35 +613,6 @@ def _build_health_context(health_data):
     return context
 
 
-def parse_note_content(content: str) -> tuple:
-    """Parse markdown note into frontmatter dict and body string.
-
-    Args:
-        content: Raw markdown file content
-
-    Returns:
-        Tuple of (frontmatter_dict or None, body_string)
-    """
-    if not content.startswith("---"):
-        return None, content
-
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return None, content
-
-    frontmatter_text = parts[1].strip()
-    if not frontmatter_text:
-        return None, parts[2].strip()
-
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return None, parts[2].strip()
-        return frontmatter, parts[2].strip()
-    except Exception:
-        return None, parts[2].strip()
-
-
 def extract_quality_score_from_note(note_path: Path) -> float | None:
     """Extract quality_score from note frontmatter.
 
@@ -497,27 +623,7 @@ def extract_quality_score_from_note(note_path: Path) -> float | None:
         The quality_score as float if present, None otherwise
     """
     try:
-        content = note_path.read_text(encoding="utf-8")
-        if not content.startswith("---"):
-            return None
-
-        # Find frontmatter boundaries
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return None
-
-        frontmatter_text = parts[1].strip()
-        if not frontmatter_text:
-            return None
-
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return None
-
-        quality_score = frontmatter.get("quality_score")
-        if quality_score is not None:
-            return float(quality_score)
-        return None
+        return quality_scores.get(note_path)
     except Exception:
         return None
 
@@ -29,6 +29,7 @@ DEFAULT_FEATURE_FLAGS: Dict[str, bool] = {
     "settings": True,
     "onboarding": True,
     "automation_health": True,
+    "progress_stream": True,
 }
 
 
@@ -0,0 +1,161 @@
+"""Server-side cache of parsed notes for the web UI.
+
+The weekly review reads the quality score of every Inbox/Fleeting note on
+each page load, and note previews re-parse the same files on every click.
+NoteCache keeps the parsed frontmatter and body of recently used notes in a
+bounded LRU. Entries are validated against the file's (mtime_ns, size) on
+every lookup, so an edited note is re-parsed and a stat() is all an
+unchanged note costs.
+
+The weekly review only needs each note's quality score, but needs it for
+every Inbox/Fleeting note, in the same order, on every load; past the LRU's
+size that order evicts each entry before it is reused. QualityScoreCache
+keeps just the score, for every candidate, with the same validation.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+from src.utils.frontmatter import load_frontmatter_yaml
+
+
+class ParsedNote(NamedTuple):
+    """Frontmatter (None if absent/invalid) and body of one note."""
+
+    frontmatter: Optional[Dict[str, Any]]
+    body: str
+
+
+def parse_note_content(content: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Parse markdown note into frontmatter dict and body string.
+
+    Args:
+        content: Raw markdown file content
+
+    Returns:
+        Tuple of (frontmatter_dict or None, body_string)
+    """
+    if not content.startswith("---"):
+        return None, content
+
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return None, content
+
+    frontmatter_text = parts[1].strip()
+    if not frontmatter_text:
+        return None, parts[2].strip()
+
+    try:
+        frontmatter = load_frontmatter_yaml(frontmatter_text)
+        if not isinstance(frontmatter, dict):
+            return None, parts[2].strip()
+        return frontmatter, parts[2].strip()
+    except Exception:
+        return None, parts[2].strip()
+
+
+class NoteCache:
+    """Thread-safe LRU of ParsedNote keyed by (path, mtime_ns, size).
+
+    Only the newest version of each path is kept; a changed file replaces
+    its stale entry instead of occupying a second slot.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, int, ParsedNote]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Union[str, Path]) -> ParsedNote:
+        """Parsed note at path, read from disk only when it changed.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+            UnicodeDecodeError: If the file is not UTF-8
+        """
+        key = str(path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+
+        parsed = ParsedNote(*parse_note_content(Path(key).read_text(encoding="utf-8")))
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, parsed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return parsed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def quality_score(frontmatter: Optional[Dict[str, Any]]) -> Optional[float]:
+    """quality_score from parsed frontmatter, None if absent or not a number."""
+    if not frontmatter or frontmatter.get("quality_score") is None:
+        return None
+    try:
+        return float(frontmatter["quality_score"])
+    except (TypeError, ValueError):
+        return None
+
+
+class QualityScoreCache:
+    """Thread-safe map of path -> quality_score, validated by (mtime_ns, size).
+
+    Unbounded, since an entry is a float; call retain() with the current
+    candidates to forget notes that were moved or deleted.
+    """
+
+    def __init__(self):
+        self._scores: Dict[str, Tuple[int, int, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Union[str, Path]) -> Optional[float]:
+        """Score of the note at path, read from disk only when it changed.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+            UnicodeDecodeError: If the file is not UTF-8
+        """
+        key = str(path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._scores.get(key)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self.hits += 1
+                return entry[2]
+
+        frontmatter, _ = parse_note_content(Path(key).read_text(encoding="utf-8"))
+        score = quality_score(frontmatter)
+        with self._lock:
+            self.misses += 1
+            self._scores[key] = (stat.st_mtime_ns, stat.st_size, score)
+        return score
+
+    def retain(self, paths: Iterable[Union[str, Path]]) -> None:
+        """Drop every entry whose path is not in paths."""
+        keep = {str(path) for path in paths}
+        with self._lock:
+            for key in [k for k in self._scores if k not in keep]:
+                del self._scores[key]
+
+    def __len__(self) -> int:
+        return len(self._scores)